@@ -0,0 +1,144 @@
+--------------------------------------------------------
+-- [Noir] Benchmarks - Harness
+--------------------------------------------------------
+
+--[[
+    ----------------------------
+
+    CREDIT:
+        Author(s): @Cuh4 (GitHub)
+        GitHub Repository: https://github.com/cuhHub/Noir
+
+    License:
+        Copyright (C) 2025 Cuh4
+
+        Licensed under the Apache License, Version 2.0 (the "License");
+        you may not use this file except in compliance with the License.
+        You may obtain a copy of the License at
+
+            http://www.apache.org/licenses/LICENSE-2.0
+
+        Unless required by applicable law or agreed to in writing, software
+        distributed under the License is distributed on an "AS IS" BASIS,
+        WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+        See the License for the specific language governing permissions and
+        limitations under the License.
+
+    ----------------------------
+]]
+
+--[[
+    Registers and runs benchmarks. Used by `run_benchmarks.py`.
+
+    Benchmark("Table:Copy", 10000, function()
+        Noir.Libraries.Table:Copy(tbl)
+    end)
+]]
+
+local clock = os.clock
+local benchmarks = {}
+
+--[[
+    Registers a benchmark.
+]]
+---@param name string
+---@param iterations integer How many times the callback is called per sample
+---@param callback function
+---@param setup function|nil Called before each sample, outside of the timing
+---@param teardown function|nil Called after each sample, outside of the timing
+function Benchmark(name, iterations, callback, setup, teardown)
+    table.insert(benchmarks, {
+        Name = name,
+        Iterations = iterations,
+        Callback = callback,
+        Setup = setup,
+        Teardown = teardown
+    })
+end
+
+--[[
+    Times one sample of a benchmark in seconds.
+]]
+---@param benchmark table
+---@return number
+local function runSample(benchmark)
+    local callback = benchmark.Callback
+
+    if benchmark.Setup then
+        benchmark.Setup()
+    end
+
+    local started = clock()
+
+    for _ = 1, benchmark.Iterations do
+        callback()
+    end
+
+    local elapsed = clock() - started
+
+    if benchmark.Teardown then
+        benchmark.Teardown()
+    end
+
+    return elapsed
+end
+
+--[[
+    Measures how many KB one sample of a benchmark allocates. The garbage collector is stopped while measuring.
+]]
+---@param benchmark table
+---@return number
+local function measureAllocations(benchmark)
+    local callback = benchmark.Callback
+
+    if benchmark.Setup then
+        benchmark.Setup()
+    end
+
+    collectgarbage("collect")
+    collectgarbage("stop")
+
+    local before = collectgarbage("count")
+
+    for _ = 1, benchmark.Iterations do
+        callback()
+    end
+
+    local allocated = collectgarbage("count") - before
+    collectgarbage("restart")
+
+    if benchmark.Teardown then
+        benchmark.Teardown()
+    end
+
+    return allocated
+end
+
+--[[
+    Runs all registered benchmarks, writing one line per benchmark to stdout:
+    BENCHMARK <tab> name <tab> iterations <tab> comma-separated sample times in seconds <tab> allocated KB
+]]
+---@param samples integer
+---@param warmup integer
+function RunBenchmarks(samples, warmup)
+    for _, benchmark in ipairs(benchmarks) do
+        for _ = 1, warmup do
+            runSample(benchmark)
+        end
+
+        local times = {}
+
+        for index = 1, samples do
+            times[index] = ("%.9f"):format(runSample(benchmark))
+        end
+
+        io.write(("BENCHMARK\t%s\t%d\t%s\t%.3f\n"):format(
+            benchmark.Name,
+            benchmark.Iterations,
+            table.concat(times, ","),
+            measureAllocations(benchmark)
+        ))
+    end
+
+    io.stdout:flush()
+end
\ No newline at end of file
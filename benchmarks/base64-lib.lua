@@ -0,0 +1,39 @@
+--------------------------------------------------------
+-- [Noir] Benchmarks - Base64 Library
+--------------------------------------------------------
+
+--[[
+    ----------------------------
+
+    CREDIT:
+        Author(s): @Cuh4 (GitHub)
+        GitHub Repository: https://github.com/cuhHub/Noir
+
+    License:
+        Copyright (C) 2025 Cuh4
+
+        Licensed under the Apache License, Version 2.0 (the "License");
+        you may not use this file except in compliance with the License.
+        You may obtain a copy of the License at
+
+            http://www.apache.org/licenses/LICENSE-2.0
+
+        Unless required by applicable law or agreed to in writing, software
+        distributed under the License is distributed on an "AS IS" BASIS,
+        WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+        See the License for the specific language governing permissions and
+        limitations under the License.
+
+    ----------------------------
+]]
+
+local data = ("Noir is a framework for Stormworks: Build and Rescue. "):rep(4)
+local encoded = Noir.Libraries.Base64:Encode(data)
+
+Benchmark("Base64:Encode", 100, function()
+    Noir.Libraries.Base64:Encode(data)
+end)
+
+Benchmark("Base64:Decode", 100, function()
+    Noir.Libraries.Base64:Decode(encoded)
+end)
\ No newline at end of file
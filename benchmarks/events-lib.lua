@@ -0,0 +1,46 @@
+--------------------------------------------------------
+-- [Noir] Benchmarks - Events Library
+--------------------------------------------------------
+
+--[[
+    ----------------------------
+
+    CREDIT:
+        Author(s): @Cuh4 (GitHub)
+        GitHub Repository: https://github.com/cuhHub/Noir
+
+    License:
+        Copyright (C) 2025 Cuh4
+
+        Licensed under the Apache License, Version 2.0 (the "License");
+        you may not use this file except in compliance with the License.
+        You may obtain a copy of the License at
+
+            http://www.apache.org/licenses/LICENSE-2.0
+
+        Unless required by applicable law or agreed to in writing, software
+        distributed under the License is distributed on an "AS IS" BASIS,
+        WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+        See the License for the specific language governing permissions and
+        limitations under the License.
+
+    ----------------------------
+]]
+
+local event = Noir.Libraries.Events:Create()
+
+for _ = 1, 10 do
+    event:Connect(function() end)
+end
+
+Benchmark("Events:Create", 2000, function()
+    Noir.Libraries.Events:Create()
+end)
+
+Benchmark("Event:Fire (10 connections)", 10000, function()
+    event:Fire(1, 2, 3)
+end)
+
+Benchmark("Event:Connect + Disconnect", 5000, function()
+    event:Disconnect(event:Connect(function() end))
+end)
\ No newline at end of file
@@ -0,0 +1,49 @@
+--------------------------------------------------------
+-- [Noir] Benchmarks - JSON Library
+--------------------------------------------------------
+
+--[[
+    ----------------------------
+
+    CREDIT:
+        Author(s): @Cuh4 (GitHub)
+        GitHub Repository: https://github.com/cuhHub/Noir
+
+    License:
+        Copyright (C) 2025 Cuh4
+
+        Licensed under the Apache License, Version 2.0 (the "License");
+        you may not use this file except in compliance with the License.
+        You may obtain a copy of the License at
+
+            http://www.apache.org/licenses/LICENSE-2.0
+
+        Unless required by applicable law or agreed to in writing, software
+        distributed under the License is distributed on an "AS IS" BASIS,
+        WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+        See the License for the specific language governing permissions and
+        limitations under the License.
+
+    ----------------------------
+]]
+
+local data = {
+    name = "Noir",
+    version = 1,
+    enabled = true,
+    values = {1, 2, 3, 4, 5, 6, 7, 8, 9, 10},
+    nested = {
+        foo = "bar",
+        list = {"a", "b", "c"}
+    }
+}
+
+local encoded = Noir.Libraries.JSON:Encode(data)
+
+Benchmark("JSON:Encode", 500, function()
+    Noir.Libraries.JSON:Encode(data)
+end)
+
+Benchmark("JSON:Decode", 500, function()
+    Noir.Libraries.JSON:Decode(encoded)
+end)
\ No newline at end of file
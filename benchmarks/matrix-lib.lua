@@ -0,0 +1,42 @@
+--------------------------------------------------------
+-- [Noir] Benchmarks - Matrix Library
+--------------------------------------------------------
+
+--[[
+    ----------------------------
+
+    CREDIT:
+        Author(s): @Cuh4 (GitHub)
+        GitHub Repository: https://github.com/cuhHub/Noir
+
+    License:
+        Copyright (C) 2025 Cuh4
+
+        Licensed under the Apache License, Version 2.0 (the "License");
+        you may not use this file except in compliance with the License.
+        You may obtain a copy of the License at
+
+            http://www.apache.org/licenses/LICENSE-2.0
+
+        Unless required by applicable law or agreed to in writing, software
+        distributed under the License is distributed on an "AS IS" BASIS,
+        WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+        See the License for the specific language governing permissions and
+        limitations under the License.
+
+    ----------------------------
+]]
+
+local pos = matrix.translation(3, 0, 2)
+
+Benchmark("Matrix:Offset", 10000, function()
+    Noir.Libraries.Matrix:Offset(pos, 15, -25, 1)
+end)
+
+Benchmark("Matrix:Scale", 10000, function()
+    Noir.Libraries.Matrix:Scale(1, 2, 3)
+end)
+
+Benchmark("Matrix:Magnitude", 10000, function()
+    Noir.Libraries.Matrix:Magnitude(pos)
+end)
\ No newline at end of file
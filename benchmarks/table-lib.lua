@@ -0,0 +1,45 @@
+--------------------------------------------------------
+-- [Noir] Benchmarks - Table Library
+--------------------------------------------------------
+
+--[[
+    ----------------------------
+
+    CREDIT:
+        Author(s): @Cuh4 (GitHub)
+        GitHub Repository: https://github.com/cuhHub/Noir
+
+    License:
+        Copyright (C) 2025 Cuh4
+
+        Licensed under the Apache License, Version 2.0 (the "License");
+        you may not use this file except in compliance with the License.
+        You may obtain a copy of the License at
+
+            http://www.apache.org/licenses/LICENSE-2.0
+
+        Unless required by applicable law or agreed to in writing, software
+        distributed under the License is distributed on an "AS IS" BASIS,
+        WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+        See the License for the specific language governing permissions and
+        limitations under the License.
+
+    ----------------------------
+]]
+
+local tbl = {
+    foo = true,
+    bar = {1, 2, 3, {deep = "value"}},
+    baz = {
+        qux = {1, 2, 3},
+        quux = "string"
+    }
+}
+
+Benchmark("Table:Copy", 10000, function()
+    Noir.Libraries.Table:Copy(tbl)
+end)
+
+Benchmark("Table:DeepCopy", 10000, function()
+    Noir.Libraries.Table:DeepCopy(tbl)
+end)
\ No newline at end of file
@@ -0,0 +1,52 @@
+--------------------------------------------------------
+-- [Noir] Benchmarks - Task Service
+--------------------------------------------------------
+
+--[[
+    ----------------------------
+
+    CREDIT:
+        Author(s): @Cuh4 (GitHub)
+        GitHub Repository: https://github.com/cuhHub/Noir
+
+    License:
+        Copyright (C) 2025 Cuh4
+
+        Licensed under the Apache License, Version 2.0 (the "License");
+        you may not use this file except in compliance with the License.
+        You may obtain a copy of the License at
+
+            http://www.apache.org/licenses/LICENSE-2.0
+
+        Unless required by applicable law or agreed to in writing, software
+        distributed under the License is distributed on an "AS IS" BASIS,
+        WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+        See the License for the specific language governing permissions and
+        limitations under the License.
+
+    ----------------------------
+]]
+
+local TaskService = Noir.Services.TaskService
+TaskService:_Initialize()
+
+-- Thousands of waiting tasks, none of which are due
+for _ = 1, 5000 do
+    TaskService:AddTickTask(function() end, 1e9)
+end
+
+Benchmark("TaskService:_HandleTasks (5000 waiting)", 2000, function()
+    TaskService.Ticks = TaskService.Ticks + 1
+    TaskService:_HandleTasks()
+end)
+
+Benchmark("TaskService:AddTickTask + RemoveTask (5000 waiting)", 2000, function()
+    TaskService:RemoveTask(TaskService:AddTickTask(function() end, 100))
+end)
+
+Benchmark("TaskService:AddTickTask + _HandleTasks (1 due, 5000 waiting)", 2000, function()
+    TaskService:AddTickTask(function() end, 1)
+
+    TaskService.Ticks = TaskService.Ticks + 1
+    TaskService:_HandleTasks()
+end)
@@ -0,0 +1,58 @@
+--------------------------------------------------------
+-- [Noir] Benchmarks - Type Checking
+--------------------------------------------------------
+
+--[[
+    ----------------------------
+
+    CREDIT:
+        Author(s): @Cuh4 (GitHub)
+        GitHub Repository: https://github.com/cuhHub/Noir
+
+    License:
+        Copyright (C) 2025 Cuh4
+
+        Licensed under the Apache License, Version 2.0 (the "License");
+        you may not use this file except in compliance with the License.
+        You may obtain a copy of the License at
+
+            http://www.apache.org/licenses/LICENSE-2.0
+
+        Unless required by applicable law or agreed to in writing, software
+        distributed under the License is distributed on an "AS IS" BASIS,
+        WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+        See the License for the specific language governing permissions and
+        limitations under the License.
+
+    ----------------------------
+]]
+
+local object = Noir.Libraries.Events:Create()
+
+Benchmark("TypeChecking:Assert (1 type)", 20000, function()
+    Noir.TypeChecking:Assert("Benchmark", "value", 1, "number")
+end)
+
+Benchmark("TypeChecking:Assert (3 types)", 20000, function()
+    Noir.TypeChecking:Assert("Benchmark", "value", nil, "string", "table", "nil")
+end)
+
+Benchmark("TypeChecking:Assert (class)", 20000, function()
+    Noir.TypeChecking:Assert("Benchmark", "value", object, Noir.Classes.Event)
+end)
+
+Benchmark("TypeChecking:AssertMany", 5000, function()
+    Noir.TypeChecking:AssertMany("Benchmark", "values", {1, 2, 3}, "number")
+end)
+
+Benchmark("TypeChecking:Assert (class, second type)", 20000, function()
+    Noir.TypeChecking:Assert("Benchmark", "value", object, "nil", Noir.Classes.Event)
+end)
+
+Benchmark("TypeChecking:Assert (disabled)", 20000, function()
+    Noir.TypeChecking:Assert("Benchmark", "value", object, Noir.Classes.Event)
+end, function()
+    Noir.TypeChecking.Enabled = false
+end, function()
+    Noir.TypeChecking.Enabled = true
+end)
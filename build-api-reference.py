@@ -4,10 +4,18 @@ This script is also terrible and extremely rushed.
 """
 
 from __future__ import annotations
+import bisect
+import hashlib
+import json
 import re
 import os
 import textwrap
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+
+CACHE_PATH = os.path.join("_build", "api-reference.cache.json")
+CACHE_VERSION = 2
+INDEX_VERSION = 1
 
 @dataclass
 class NoirValue:
@@ -15,6 +23,7 @@ class NoirValue:
     type: str
     description: str
     point: int
+    line: int
     params: list[Param]
     returns: list[ReturnValue]
     deprecated: bool
@@ -40,6 +49,14 @@ class Parser():
         self.path = path
         self.content = None
         
+        # index, see indexContent()
+        self.lines: list[str] = []
+        self.lineStarts: list[int] = []
+        self.lastCommentStarts: list[int] = []
+        self.lastCommentEnds: list[int] = []
+        self.nextCommentStarts: list[int] = []
+        self.nextCommentEnds: list[int] = []
+        
         self.customTypes = {
             "Noir.Libraries.Events:Create()" : "NoirEvent",
             "Noir.Class" : "NoirClass",
@@ -50,6 +67,74 @@ class Parser():
     def updateContent(self):
         with open(self.path, "r") as f:
             self.content = f.read()
+            
+        self.indexContent()
+            
+    def indexContent(self):
+        # split into lines once, remembering where each line starts
+        self.lines = self.content.split("\n")
+        self.lineStarts = []
+        
+        point = 0
+        
+        for line in self.lines:
+            self.lineStarts.append(point)
+            point += len(line) + 1
+            
+        # for each line, the closest line at or before it that starts/ends a comment (-1 if none)
+        self.lastCommentStarts = []
+        self.lastCommentEnds = []
+        
+        lastStart, lastEnd = -1, -1
+        
+        for index, line in enumerate(self.lines):
+            if line.find("--[[") != -1:
+                lastStart = index
+                
+            if line.find("]]") != -1:
+                lastEnd = index
+                
+            self.lastCommentStarts.append(lastStart)
+            self.lastCommentEnds.append(lastEnd)
+            
+        # for each line, the closest line at or after it that starts/ends a comment (len(lines) if none)
+        self.nextCommentStarts = [0] * len(self.lines)
+        self.nextCommentEnds = [0] * len(self.lines)
+        
+        nextStart, nextEnd = len(self.lines), len(self.lines)
+        
+        for index in range(len(self.lines) - 1, -1, -1):
+            line = self.lines[index]
+            
+            if line.find("--[[") != -1:
+                nextStart = index
+                
+            if line.find("]]") != -1:
+                nextEnd = index
+                
+            self.nextCommentStarts[index] = nextStart
+            self.nextCommentEnds[index] = nextEnd
+            
+    def getLineIndex(self, point: int) -> int:
+        return bisect.bisect_right(self.lineStarts, point) - 1
+    
+    def getLinesBefore(self, point: int, stop: int) -> list[str]:
+        # same as reversed(self.content[:point].split("\n")), but only goes back to line `stop` (inclusive)
+        index = self.getLineIndex(point)
+        return [self.content[self.lineStarts[index]:point], *reversed(self.lines[max(stop, 0):index])]
+    
+    def getLinesAfter(self, point: int, stop: int) -> list[str]:
+        # same as self.content[point:].split("\n"), but only goes forward to line `stop` (inclusive)
+        index = self.getLineIndex(point)
+        return [self.lines[index][point - self.lineStarts[index]:], *self.lines[index + 1:stop + 1]]
+    
+    def getLastCommentStart(self, point: int) -> int:
+        index = self.getLineIndex(point)
+        return self.lastCommentStarts[index - 1] if index > 0 else -1
+    
+    def getLastCommentEnd(self, point: int) -> int:
+        index = self.getLineIndex(point)
+        return self.lastCommentEnds[index - 1] if index > 0 else -1
         
     def getType(self, value: str) -> str:
         if value.find("---@type ") != -1:
@@ -84,7 +169,7 @@ class Parser():
         lines: list[str] = []
         
         # go backwards til start of command
-        for line in reversed(self.content[:point].split("\n")):
+        for line in self.getLinesBefore(point, self.getLastCommentStart(point)):
             if line.find("--[[") != -1:
                 break
             
@@ -122,7 +207,7 @@ class Parser():
         params: list[Param] = []
         found = False
         
-        for line in reversed(self.content[:point].split("\n")):
+        for line in self.getLinesBefore(point, self.getLastCommentEnd(point)):
             line = self.deindent(line)
             
             if line.find("]]") != -1:
@@ -161,7 +246,7 @@ class Parser():
         # search backwards for ---@return
         returns = []
 
-        for line in reversed(self.content[:point].split("\n")):
+        for line in self.getLinesBefore(point, self.getLastCommentEnd(point)):
             line = self.deindent(line)
 
             if line.find("]]") != -1:
@@ -197,9 +282,7 @@ class Parser():
         return [*reversed(returns)]
     
     def getIsDeprecated(self, point: int) -> bool:
-        line = self.getLine(point)
-        
-        for line in reversed(self.content[:point].split("\n")):
+        for line in self.getLinesBefore(point, self.getLastCommentEnd(point)):
             if line.find("]]") != -1:
                 break
             
@@ -218,7 +301,8 @@ class Parser():
             return line[len("function") + 1:], "function"
         
     def getLine(self, point: int) -> str:
-        return self.content[point:].split("\n")[0]
+        index = self.getLineIndex(point)
+        return self.lines[index][point - self.lineStarts[index]:]
     
     def isInComment(self, point: int) -> bool:
         # setup what to find
@@ -226,7 +310,9 @@ class Parser():
         commentEnd = "]]"
         
         # go backwards, looking for start of comment
-        for line in reversed(self.content[:point].split("\n")):
+        index = self.getLineIndex(point)
+        
+        for line in self.getLinesBefore(point, max(self.getLastCommentStart(point), self.getLastCommentEnd(point))):
             if line.find(commentStart) != -1:
                 return True
             
@@ -234,7 +320,9 @@ class Parser():
                 return False
             
         # go forwards, looking for end of comment
-        for line in self.content[point:].split("\n"):
+        stop = min(self.nextCommentStarts[index + 1], self.nextCommentEnds[index + 1]) if index + 1 < len(self.lines) else index
+        
+        for line in self.getLinesAfter(point, stop):
             if line.find(commentStart) != -1:
                 return False
             
@@ -272,12 +360,15 @@ class Parser():
         # get content
         if not self.content:
             self.updateContent()
+            
+        if not self.lines:
+            self.indexContent()
         
         # for later
         attributePoints = []
         
         # find attributes
-        for line in self.content.split("\n"):
+        for index, line in enumerate(self.lines):
             # check if should ignore
             if line.endswith("---@ar_ignore"):
                 continue
@@ -291,7 +382,7 @@ class Parser():
                 continue
             
             # get the point
-            point = self.content.find(line)
+            point = self.lineStarts[index]
 
             # check if in function
             if self.isInFunction(point):
@@ -342,6 +433,7 @@ class Parser():
                 type = self.getType(value),
                 description = self.getDescription(point),
                 point = point,
+                line = self.getLineIndex(point) + 1,
                 params = self.getParameters(point) if value == "function" else [],
                 returns = self.getReturns(point) if value == "function" else [],
                 deprecated = self.getIsDeprecated(point),
@@ -352,25 +444,102 @@ class Parser():
         return values
     
     @staticmethod
-    def parseAll(dir: str) -> list[NoirValue]:
-        values = []
+    def getPaths(dir: str) -> list[str]:
+        paths = []
         
         for file in os.listdir(dir):
             path = os.path.join(dir, file)
             
             if os.path.isdir(path):
-                values.extend(Parser.parseAll(path))
+                paths.extend(Parser.getPaths(path))
             else:
-                parser = Parser(path)
-                values.extend(parser.parse())
+                paths.append(path)
+                
+        return paths
+    
+    @staticmethod
+    def parseAll(dir: str, cache: dict[str, dict]|None = None) -> list[NoirValue]:
+        # cache is keyed by absolute path, see loadCache(). updated in place
+        cache = cache if cache is not None else {}
+        paths = Parser.getPaths(dir)
+        
+        # find files that changed since they were last parsed
+        hashes = {path: hashFile(path) for path in paths}
+        changed = [path for path in paths if cache.get(os.path.abspath(path), {}).get("hash") != hashes[path]]
+        
+        # parse changed files, on multiple processes if there's more than one
+        if len(changed) > 1:
+            with ProcessPoolExecutor() as executor:
+                parsed = list(executor.map(parseFile, changed))
+        else:
+            parsed = [parseFile(path) for path in changed]
+            
+        for path, values in zip(changed, parsed):
+            cache[os.path.abspath(path)] = {
+                "hash" : hashes[path],
+                "values" : [asdict(value) for value in values]
+            }
+            
+        # forget removed files
+        for path in set(cache) - {os.path.abspath(path) for path in paths}:
+            cache.pop(path)
+            
+        # return values in file order
+        values = []
+        
+        for path in paths:
+            values.extend(valueFromDict(value) for value in cache[os.path.abspath(path)]["values"])
                 
         return values
+    
+def parseFile(path: str) -> list[NoirValue]:
+    return Parser(path).parse()
+
+def hashFile(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+    
+def valueFromDict(value: dict) -> NoirValue:
+    return NoirValue(**{
+        **value,
+        "params" : [Param(**param) for param in value["params"]],
+        "returns" : [ReturnValue(**returnValue) for returnValue in value["returns"]]
+    })
+    
+def loadCache() -> dict[str, dict]:
+    if not os.path.exists(CACHE_PATH):
+        return {}
+    
+    try:
+        with open(CACHE_PATH, "r", encoding = "utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if cache.get("version") != CACHE_VERSION:
+        return {}
+    
+    return cache["files"]
+
+def saveCache(files: dict[str, dict]):
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok = True)
+    
+    with open(CACHE_PATH, "w", encoding = "utf-8") as f:
+        json.dump({"version" : CACHE_VERSION, "files" : files}, f)
+        
+def writeIfChanged(path: str, content: str, encoding: str|None = None) -> bool:
+    # skips writing if the file already has this content, so unchanged pages keep their timestamps
+    if os.path.exists(path):
+        with open(path, "r", encoding = encoding) as f:
+            if f.read() == content:
+                return False
+            
+    with open(path, "w", encoding = encoding) as f:
+        f.write(content)
         
-values = Parser.parseAll("src/Noir")
-valuesForFiles: dict[str, list[str]] = {}
+    return True
 
-# format into markdown
-for value in values:
+def formatValue(value: NoirValue) -> str:
     # get value stuffs
     markdown = ""
     name = value.name
@@ -406,37 +575,60 @@ for value in values:
                 
             markdown += "\n".join(returns)
     
-    # save
-    if not valuesForFiles.get(value.path):
-        valuesForFiles[value.path] = []
-        
-    valuesForFiles[value.path].append(markdown)
-    
-# write
-for path, markdown in valuesForFiles.items():
-    directory = os.path.relpath(os.path.dirname(path), "src/noir")
-    name = os.path.splitext(os.path.basename(path))[0]
+    return markdown
+
+def getSearchKey(value: NoirValue) -> str:
+    # "Noir.Services.TaskService:AddTask(callback, ...)" -> "noir.services.taskservice:addtask"
+    return value.name.split("(")[0].strip().lower()
+
+def getTrigrams(key: str) -> set[str]:
+    return {key[index:index + 3] for index in range(len(key) - 2)}
+
+def buildSymbolIndex(values: list[NoirValue]) -> list[dict]:
+    symbols = []
     
-    writePath = os.path.join("docs", "api-reference", "noir", directory, name).lower() + ".md"
+    for value in values:
+        symbols.append({
+            "name" : value.name,
+            "type" : value.type,
+            "description" : value.description,
+            "params" : [asdict(param) for param in value.params],
+            "returns" : [asdict(returnValue) for returnValue in value.returns],
+            "deprecated" : value.deprecated,
+            "file" : os.path.relpath(value.path).replace("\\", "/"),
+            "line" : value.line
+        })
+        
+    return symbols
 
-    os.makedirs(os.path.dirname(writePath), exist_ok = True)
+def buildSearchIndex(values: list[NoirValue]) -> dict:
+    # symbols are referred to by their position in the symbol index
+    keys = [getSearchKey(value) for value in values]
+    prefixes: dict[str, list[int]] = {}
+    trigrams: dict[str, list[int]] = {}
     
-    with open(f"{writePath}", "w", encoding="utf-8") as file:
-        file.write(f"# {name}\n\n" + "\n\n---\n\n".join(markdown))
+    for id, key in enumerate(keys):
+        # prefixes of the member name, eg: "a", "ad", "add", ... for "addtask"
+        member = re.split(r"[.:]", key)[-1]
         
-# update summary.md
-with open("docs/SUMMARY.md", "r") as f:
-    summary = f.read()
-    
-    start = "* [☄️ API Reference](api-reference/README.md)"
-    startPoint = summary.find(start) + len(start)
-    
-summary = summary[:startPoint]
+        for length in range(1, len(member) + 1):
+            prefixes.setdefault(member[:length], []).append(id)
+            
+        # trigrams of the whole key, for substring search
+        for trigram in sorted(getTrigrams(key)):
+            trigrams.setdefault(trigram, []).append(id)
+            
+    return {
+        "version" : INDEX_VERSION,
+        "keys" : keys,
+        "prefixes" : prefixes,
+        "trigrams" : trigrams
+    }
 
 def recursiveSummaryUpdate(path: str, level: int = 1) -> str:
     text = ""
     
-    for name in os.listdir(path):
+    for name in sorted(os.listdir(path), key = str.lower): # sorted so the summary doesn't change with file order
         full = os.path.join(path, name)
         forSummary = os.path.dirname(os.path.relpath(full, "src")).replace("\\", "/").lower()
 
@@ -452,7 +644,56 @@ def recursiveSummaryUpdate(path: str, level: int = 1) -> str:
             
     return text
 
-summary += "\n" + recursiveSummaryUpdate("src/Noir", 1)
+def main():
+    # parse, reusing values of files that haven't changed
+    cache = loadCache()
+    values = Parser.parseAll("src/Noir", cache)
+    saveCache(cache)
+    
+    # format into markdown
+    valuesForFiles: dict[str, list[str]] = {}
+    
+    for value in values:
+        if not valuesForFiles.get(value.path):
+            valuesForFiles[value.path] = []
+            
+        valuesForFiles[value.path].append(formatValue(value))
+        
+    # write pages that changed
+    written = 0
+    
+    for path, markdown in valuesForFiles.items():
+        directory = os.path.relpath(os.path.dirname(path), "src/noir")
+        name = os.path.splitext(os.path.basename(path))[0]
+        
+        writePath = os.path.join("docs", "api-reference", "noir", directory, name).lower() + ".md"
+
+        os.makedirs(os.path.dirname(writePath), exist_ok = True)
+        
+        if writeIfChanged(writePath, f"# {name}\n\n" + "\n\n---\n\n".join(markdown), encoding = "utf-8"):
+            written += 1
+            
+    # write symbol and search indexes, sorted by name so they don't change with file order
+    values = sorted(values, key = lambda value: (getSearchKey(value), value.path, value.line))
+    
+    for name, index in [("symbols.json", {"version" : INDEX_VERSION, "symbols" : buildSymbolIndex(values)}), ("search-index.json", buildSearchIndex(values))]:
+        if writeIfChanged(os.path.join("docs", "api-reference", name), json.dumps(index, separators = (",", ":"), ensure_ascii = False), encoding = "utf-8"):
+            written += 1
+            
+    # update summary.md
+    with open("docs/SUMMARY.md", "r") as f:
+        summary = f.read()
+        
+        start = "* [☄️ API Reference](api-reference/README.md)"
+        startPoint = summary.find(start) + len(start)
+        
+    summary = summary[:startPoint]
+    summary += "\n" + recursiveSummaryUpdate("src/Noir", 1)
+
+    if writeIfChanged("docs/SUMMARY.md", summary):
+        written += 1
+        
+    print(f"Updated {written} of {len(valuesForFiles) + 3} API reference files.")
 
-with open("docs/SUMMARY.md", "w") as f:
-    f.write(summary)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
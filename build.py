@@ -24,25 +24,57 @@ limitations under the License.
 """
 
 # // Imports
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
 from pathlib import Path
 from tools.combine import Combiner
+import click
+import hashlib
+import json
+import os
+import re
 import subprocess
+import sys
+
+# // Variables
+TOOLS_CACHE_PATH = Path(".build_cache/tools") # PyInstaller work/spec files, logs and hashes of the last build of each tool
+TOOL_DEPENDENCIES = { # Files outside of a tool's directory that are bundled with it, at the same path relative to the repo
+    "project_manager" : [Path("tools/combine/main.py")] # copied into projects, see `LocalSource`
+}
 
 # // Functions
-def build_noir():
+def build_noir(profile: str = "debug", strip_debugging: bool = False, minify: bool = False):
     """
     Builds all of Noir into a singular file.
+    
+    Args:
+        profile (str, optional): The build profile. "release" strips type checking, comments and annotations. Defaults to "debug".
+        strip_debugging (bool, optional): Whether or not to also disable `Noir.Debugging` tracking in the "release" profile. Defaults to False.
+        minify (bool, optional): Whether or not to minify the built Noir. Defaults to False.
+        
+    Raises:
+        RuntimeError: If the version couldn't be filled in.
     """
 
+    # The version is filled in as files are read, so the output is final when it is written (and skipped if unchanged)
     combiner = Combiner(
         directory = Path("src"),
         destination = Path("_build/Noir.lua"),
         whitelisted_extensions = [".lua"],
         blacklisted_extensions = [],
-        ignored = []
+        ignored = [],
+        cache = True,
+        profile = profile,
+        strip_debugging = strip_debugging,
+        minify = minify,
+        replacements = get_version_replacements()
     )
     
-    combiner.combine()
+    result, _ = combiner.combine()
+    version = ".".join(get_version())
+    
+    if f"\"{version}\"" not in result:
+        raise RuntimeError(f"Failed to fill in Noir's version ({version}). Is the `Noir.Version = \"{{VERSION_MAJOR}}.{{VERSION_MINOR}}.{{VERSION_PATCH}}\"` placeholder still in the source?")
 
 def get_version() -> tuple[int, int, int]:
     """
@@ -54,75 +86,225 @@ def get_version() -> tuple[int, int, int]:
 
     return tuple(Path("VERSION").read_text().split("."))
 
-def update_version():
+def get_version_replacements() -> dict[str, str]:
     """
-    Updates the version in the Noir.lua build file.
+    Gets the replacements that fill in the version in Noir's source.
+
+    Returns:
+        dict[str, str]: The version placeholder, and what to replace it with.
     """
     
-    # Update version in Noir
     major, minor, patch = get_version()
     to_replace = "Noir.Version = \"{VERSION_MAJOR}.{VERSION_MINOR}.{VERSION_PATCH}\""
 
-    # Get contents
-    noir_path = Path("_build/Noir.lua")
-    noir_contents = noir_path.read_text()
+    return {
+        to_replace : to_replace.format(
+            VERSION_MAJOR = major,
+            VERSION_MINOR = minor,
+            VERSION_PATCH = patch
+        )
+    }
     
-    # Replace version
-    noir_path.write_text(noir_contents.replace(to_replace, to_replace.format(
-        VERSION_MAJOR = major,
-        VERSION_MINOR = minor,
-        VERSION_PATCH = patch
-    )))
+def get_installed_versions(requirements: list[str]) -> dict[str, str]:
+    """
+    Gets the installed versions of packages and everything they depend on.
+
+    Args:
+        requirements (list[str]): The packages, as lines of a `requirements.txt` file (eg: "rich==14.0.0").
+
+    Returns:
+        dict[str, str]: The installed version of each package by normalized name, or "missing" for requirements that aren't installed.
+    """
     
-def build(name: str, path: Path, icon: Path|None = None):
+    versions: dict[str, str] = {}
+    pending = [(requirement, True) for requirement in requirements]
+    
+    while len(pending) > 0:
+        requirement, direct = pending.pop()
+        
+        if "extra ==" in requirement:
+            continue
+        
+        match = re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)", requirement)
+        
+        if match is None:
+            continue
+        
+        name = re.sub(r"[-_.]+", "-", match.group(1)).lower() # normalized, so the same package is only checked once
+        
+        if name in versions:
+            continue
+        
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            if direct:
+                versions[name] = "missing"
+                
+            continue
+        
+        pending.extend((dependency, False) for dependency in metadata.requires(name) or [])
+        
+    return versions
+
+def get_tool_hash(path: Path, icon: Path|None = None, dependencies: list[Path]|None = None) -> str:
+    """
+    Hashes everything a tool's build depends on: the files in its directory (source, requirements and icon), the icon, files it depends on elsewhere in the repo, the installed versions of its requirements, and the Python and PyInstaller versions.
+
+    Args:
+        path (Path): The tool's directory.
+        icon (Path|None, optional): The path to the icon. Defaults to None.
+        dependencies (list[Path]|None, optional): Files outside of the tool's directory that it depends on. Defaults to None.
+
+    Returns:
+        str: The hash.
+    """
+    
+    digest = hashlib.sha256()
+    requirements_path = path / "requirements.txt"
+    requirements = requirements_path.read_text().splitlines() if requirements_path.exists() else []
+    versions = get_installed_versions([*requirements, "pyinstaller"])
+        
+    digest.update(f"{sys.version}\0{json.dumps(versions, sort_keys = True)}\0".encode())
+    files = [file for file in sorted(path.rglob("*")) if file.is_file() and "__pycache__" not in file.parts]
+    
+    if icon is not None and icon not in files:
+        files.append(icon)
+        
+    files.extend(dependencies or [])
+    
+    for file in files:
+        digest.update(f"{file.relative_to(path) if file.is_relative_to(path) else file.as_posix()}\0".encode())
+        digest.update(hashlib.sha256(file.read_bytes()).digest())
+        
+    return digest.hexdigest()
+
+def get_tool_artifact(name: str) -> Path:
+    """
+    Returns the path PyInstaller puts a built tool at.
+
+    Args:
+        name (str): The name of the tool.
+
+    Returns:
+        Path: The path to the executable.
+    """
+    
+    return Path("_build") / (f"{name}.exe" if sys.platform == "win32" else name)
+
+def build(name: str, path: Path, icon: Path|None = None, dependencies: list[Path]|None = None):
     """
     Run PyInstaller with the given path.
+    Each build gets its own work and spec directories in the tools cache, which are kept between builds so PyInstaller can reuse its analysis.
 
     Args:
         name (str): The name of the executable.
         path (Path): The path to build.
-        path (Path|None): The path to the icon.
+        icon (Path|None): The path to the icon.
+        dependencies (list[Path]|None, optional): Files to bundle, at the same path relative to the repo. Defaults to None.
+        
+    Raises:
+        RuntimeError: If PyInstaller failed. The log is included in the error.
     """
     
+    cache_path = TOOLS_CACHE_PATH / name
+    cache_path.mkdir(parents = True, exist_ok = True)
+    log_path = cache_path / "build.log"
+    
     # Build
     arguments = [
         "pyinstaller", str(path.absolute()),
         "--onefile",
+        "--noconfirm",
         "--distpath", "_build",
-        "--name", name,
-        "--specpath", "specs"
+        "--workpath", str(cache_path / "work"),
+        "--specpath", str(cache_path / "spec"),
+        "--name", name
     ]
     
     if icon is not None:
         arguments.extend([f"--icon={str(icon.absolute())}"])
+        
+    for dependency in dependencies or []:
+        arguments.extend(["--add-data", f"{dependency.absolute()}{os.pathsep}{dependency.parent.as_posix()}"])
  
     print(f"> Building {name}... Icon: {icon if icon is not None else "N/A"}")
-    print(arguments)
     
-    subprocess.run(arguments, check = True)
+    # Output is logged to a file instead of the console as builds run at the same time
+    with open(log_path, "w") as log:
+        result = subprocess.run(arguments, stdout = log, stderr = subprocess.STDOUT)
+    
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to build {name} (exit code {result.returncode}). Log ({log_path}):\n{log_path.read_text(errors = "replace")}")
+
+def build_tool(tool: Path, force: bool = False) -> bool:
+    """
+    Builds a tool, unless it hasn't changed since it was last built.
+
+    Args:
+        tool (Path): The tool's directory, containing a `main.py` file.
+        force (bool, optional): Whether or not to build the tool even if it hasn't changed. Defaults to False.
 
-def build_tools():
+    Returns:
+        bool: Whether or not the tool was built.
     """
-    Builds all of Noir's tools.
+    
+    icon = tool / "icon.ico"
+    icon = icon if icon.exists() else None
+    
+    dependencies = TOOL_DEPENDENCIES.get(tool.name, [])
+    hash_path = TOOLS_CACHE_PATH / tool.name / "hash.json"
+    tool_hash = get_tool_hash(tool, icon, dependencies)
+    
+    try:
+        last_hash = json.loads(hash_path.read_text()).get("hash")
+    except (OSError, ValueError):
+        last_hash = None
+        
+    if not force and last_hash == tool_hash and get_tool_artifact(tool.name).exists():
+        print(f"> Skipping {tool.name} (unchanged)")
+        return False
+    
+    build(tool.name, tool / "main.py", icon, dependencies)
+    hash_path.write_text(json.dumps({"hash" : tool_hash}))
+    
+    return True
+
+def build_tools(jobs: int|None = None, force: bool = False):
     """
+    Builds all of Noir's tools at the same time. Tools that haven't changed since they were last built are skipped.
     
-    for tool in Path("tools").iterdir():
-        file = tool / "main.py"
+    Args:
+        jobs (int|None, optional): The maximum amount of tools to build at the same time. Defaults to the amount of CPUs.
+        force (bool, optional): Whether or not to build tools even if they haven't changed. Defaults to False.
         
-        if not file.exists():
-            continue
+    Raises:
+        RuntimeError: If any tool failed to build. The other tools still finish.
+    """
     
-        icon = tool / "icon.ico"
+    tools = [tool for tool in sorted(Path("tools").iterdir()) if (tool / "main.py").exists()]
+    
+    with ThreadPoolExecutor(max_workers = max(min(jobs or os.cpu_count() or 1, len(tools)), 1)) as executor:
+        futures = [executor.submit(build_tool, tool, force) for tool in tools]
         
-        build(tool.name, file,  icon if icon.exists() else None)
+    errors = [future.exception() for future in futures if future.exception() is not None]
+    
+    if len(errors) > 0:
+        raise RuntimeError("\n\n".join(str(error) for error in errors))
 
 # ---- // Main
-if __name__ == "__main__":
-    print("Building Noir...")
-    build_noir()
-    
-    print("Updating Noir version...")
-    update_version()
+@click.command()
+@click.option("--profile", "-p", type = click.Choice(Combiner.PROFILES), default = "debug", help = "\"release\" strips type checking, comments and annotations from Noir.")
+@click.option("--strip_debugging", "-sd", is_flag = True, default = False, help = "Disables Noir.Debugging tracking in the \"release\" profile.")
+@click.option("--minify", "-m", is_flag = True, default = False, help = "Minifies the built Noir.")
+@click.option("--jobs", "-j", type = click.IntRange(min = 1), default = None, help = "The maximum amount of tools to build at the same time. Defaults to the amount of CPUs.")
+@click.option("--force_tools", "-ft", is_flag = True, default = False, help = "Rebuilds tools even if they haven't changed since they were last built.")
+def main(profile: str, strip_debugging: bool, minify: bool, jobs: int|None, force_tools: bool):
+    print(f"Building Noir ({profile})...")
+    build_noir(profile, strip_debugging, minify)
     
     print("Building tools...")
-    build_tools()
\ No newline at end of file
+    build_tools(jobs, force_tools)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
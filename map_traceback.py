@@ -0,0 +1,54 @@
+# // ---------------------------------------------------------------------
+# // ------- [Noir] Traceback Mapping Tool
+# // ---------------------------------------------------------------------
+
+"""
+A tool for pointing errors and tracebacks from a combined script back at the original files.
+Repo: https://github.com/cuhHub/Noir
+
+---
+
+Copyright (C) 2025 Cuh4
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---- // Imports
+import click
+import sys
+from pathlib import Path
+
+from tools.combine import CombinerSourceMap
+
+# ---- // Main
+@click.command()
+@click.option("--map", "-m", "map_path", type = str, required = True, help = "The source map written by the combiner (`--source_map`), eg: \"script.lua.map.json\".")
+@click.option("--name", "-n", default = [], multiple = True, help = "A name the combined script is referred to by in the traceback. Defaults to the script's file name.")
+@click.argument("traceback", type = click.File("r"), default = "-")
+def run(map_path: str, name: list[str], traceback):
+    """
+    Rewrites `<name>:<line>` references in a traceback (read from a file or stdin) to the original files and lines.
+    """
+    
+    path = Path(map_path)
+    
+    try:
+        source_map = CombinerSourceMap.load(path)
+    except (OSError, ValueError) as exception:
+        raise click.ClickException(str(exception))
+    
+    names = list(name) or [path.name.removesuffix(".map.json")]
+    sys.stdout.write(source_map.rewrite(traceback.read(), names))
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,347 @@
+# // ---------------------------------------------------------------------
+# // ------- [Noir] Benchmark Tool
+# // ---------------------------------------------------------------------
+
+"""
+A tool for running Noir benchmarks.
+Repo: https://github.com/cuhHub/Noir
+
+---
+
+Copyright (C) 2025 Cuh4
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---- // Imports
+import click
+import json
+import math
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, asdict
+from rich import print
+from rich.panel import Panel
+from rich.table import Table
+from pathlib import Path
+
+from run_test import build_prelude, success, info, error, LUA_EXECUTABLE, LUA_PATH
+from build import get_version
+
+# ---- // Variables
+BENCHMARK_DIR = Path("benchmarks")
+HARNESS = (BENCHMARK_DIR / "_harness.lua").read_text()
+BASELINES_PATH = BENCHMARK_DIR / "baselines.json"
+
+# ---- // Main
+@dataclass
+class BenchmarkResult():
+    """
+    The result of a benchmark.
+    """
+
+    name: str
+    suite: str
+    iterations: int
+    samples: int
+    median_ns: float
+    p95_ns: float
+    allocated_kb: float
+
+class NoirBenchmarkSuite():
+    """
+    A file of Noir benchmarks.
+    """
+
+    def __init__(self, path: Path, prelude: str):
+        """
+        Initializes new `NoirBenchmarkSuite` instances.
+
+        Args:
+            path (Path): The path to the benchmark file.
+            prelude (str): The code to run before the benchmarks (the polyfill and Noir). See `build_prelude()` in `run_test.py`.
+        """
+
+        self.name = path.stem
+        self.path = path
+        self.prelude = prelude
+
+    def _parse_line(self, line: str) -> BenchmarkResult:
+        """
+        Parses a line of benchmark output. See `benchmarks/_harness.lua`.
+
+        Args:
+            line (str): The line to parse.
+
+        Returns:
+            BenchmarkResult: The parsed result.
+        """
+
+        _, name, iterations, times, allocated = line.split("\t")
+        iterations = int(iterations)
+
+        per_op = sorted(float(time) / iterations * 1e9 for time in times.split(","))
+
+        return BenchmarkResult(
+            name = name,
+            suite = self.name,
+            iterations = iterations,
+            samples = len(per_op),
+            median_ns = statistics.median(per_op),
+            p95_ns = per_op[math.ceil(len(per_op) * 0.95) - 1],
+            allocated_kb = float(allocated) / iterations
+        )
+
+    def run(self, samples: int, warmup: int) -> list[BenchmarkResult]:
+        """
+        Runs all benchmarks in this suite.
+
+        Args:
+            samples (int): The amount of timed samples per benchmark.
+            warmup (int): The amount of untimed samples to run before timing.
+
+        Returns:
+            list[BenchmarkResult]: The results of all benchmarks.
+
+        Raises:
+            RuntimeError: If the benchmark failed to run.
+        """
+
+        source = "\n\n".join([self.prelude, HARNESS, self.path.read_text(), f"RunBenchmarks({samples}, {warmup})"])
+        result = subprocess.run([LUA_EXECUTABLE.absolute(), "-"], input = source.encode("utf-8"), cwd = LUA_PATH, capture_output = True)
+
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.decode("utf-8").strip().split("\n")[0])
+
+        return [self._parse_line(line) for line in result.stdout.decode("utf-8").splitlines() if line.startswith("BENCHMARK\t")]
+
+def get_benchmark_paths() -> list[Path]:
+    """
+    Returns the paths of all benchmark suites, sorted by name.
+
+    Returns:
+        list[Path]: The paths of all benchmark suites.
+    """
+
+    return sorted(path for path in BENCHMARK_DIR.iterdir() if path.suffix == ".lua" and not path.name.startswith("_"))
+
+def show_results(results: list[BenchmarkResult]):
+    """
+    Prints benchmark results as a table.
+
+    Args:
+        results (list[BenchmarkResult]): The results to show.
+    """
+
+    table = Table(title = "Benchmarks")
+    table.add_column("Suite", style = "blue")
+    table.add_column("Benchmark")
+    table.add_column("Median (ns/op)", justify = "right")
+    table.add_column("p95 (ns/op)", justify = "right")
+    table.add_column("Allocated (KB/op)", justify = "right")
+
+    for result in results:
+        table.add_row(result.suite, result.name, f"{result.median_ns:,.0f}", f"{result.p95_ns:,.0f}", f"{result.allocated_kb:.3f}")
+
+    print(table)
+
+def get_version_string() -> str:
+    """
+    Returns the current Noir version as a string. See the `VERSION` file.
+
+    Returns:
+        str: The current version, eg: "1.2.3".
+    """
+
+    return ".".join(get_version()).strip()
+
+def load_baselines() -> dict[str, dict[str, dict]]:
+    """
+    Loads all saved baselines.
+
+    Returns:
+        dict[str, dict[str, dict]]: Benchmark results keyed by version, then by "suite/name".
+    """
+
+    if not BASELINES_PATH.exists():
+        return {}
+
+    return json.loads(BASELINES_PATH.read_text("utf-8"))
+
+def write_baseline(version: str, results: list[BenchmarkResult]):
+    """
+    Saves benchmark results as the baseline for a version, replacing any existing baseline results for the same benchmarks.
+
+    Args:
+        version (str): The version to save the baseline for.
+        results (list[BenchmarkResult]): The results to save.
+    """
+
+    baselines = load_baselines()
+    baselines.setdefault(version, {}).update({f"{result.suite}/{result.name}": asdict(result) for result in results})
+
+    BASELINES_PATH.write_text(json.dumps(baselines, indent = 4, sort_keys = True), encoding = "utf-8")
+
+def compare_results(results: list[BenchmarkResult], baseline: dict[str, dict], threshold: float) -> list[BenchmarkResult]:
+    """
+    Compares benchmark results against a baseline and prints a per-benchmark delta table.
+
+    Args:
+        results (list[BenchmarkResult]): The new results.
+        baseline (dict[str, dict]): The baseline to compare against. See `load_baselines()`.
+        threshold (float): How much slower (as a percentage of the baseline median) a benchmark can get before it counts as a regression.
+
+    Returns:
+        list[BenchmarkResult]: The results that regressed.
+    """
+
+    regressions: list[BenchmarkResult] = []
+
+    table = Table(title = "Compared To Baseline")
+    table.add_column("Benchmark", style = "blue")
+    table.add_column("Baseline (ns/op)", justify = "right")
+    table.add_column("Now (ns/op)", justify = "right")
+    table.add_column("Delta", justify = "right")
+    table.add_column("Allocated Delta (KB/op)", justify = "right")
+
+    for result in results:
+        key = f"{result.suite}/{result.name}"
+        base = baseline.get(key)
+
+        if base is None:
+            table.add_row(key, "N/A", f"{result.median_ns:,.0f}", "[yellow]new[/yellow]", "N/A")
+            continue
+
+        delta = (result.median_ns - base["median_ns"]) / base["median_ns"] * 100 if base["median_ns"] > 0 else 0.0
+        regressed = delta > threshold
+
+        if regressed:
+            regressions.append(result)
+
+        color = "red" if regressed else ("green" if delta < -threshold else "white")
+
+        table.add_row(
+            key,
+            f"{base["median_ns"]:,.0f}",
+            f"{result.median_ns:,.0f}",
+            f"[{color}]{delta:+.1f}%[/{color}]",
+            f"{result.allocated_kb - base["allocated_kb"]:+.3f}"
+        )
+
+    print(table)
+    return regressions
+
+def find_missing_results(results: list[BenchmarkResult], baseline: dict[str, dict], suites: list[str]) -> list[str]:
+    """
+    Finds benchmarks in a baseline that have no result, eg: because their suite failed or they were removed.
+    Only benchmarks of suites that were run are checked, so filtering suites doesn't count as missing results.
+
+    Args:
+        results (list[BenchmarkResult]): The new results.
+        baseline (dict[str, dict]): The baseline to compare against. See `load_baselines()`.
+        suites (list[str]): The names of the suites that were run (inc. ones that failed).
+
+    Returns:
+        list[str]: The "suite/name" keys of the benchmarks with no result.
+    """
+
+    keys = {f"{result.suite}/{result.name}" for result in results}
+    return sorted(key for key, base in baseline.items() if base["suite"] in suites and key not in keys)
+
+@click.command()
+@click.option("--samples", "-s", type = click.IntRange(min = 1), default = 10, help = "The amount of timed samples per benchmark.")
+@click.option("--warmup", "-w", type = click.IntRange(min = 0), default = 2, help = "The amount of untimed samples to run before timing.")
+@click.option("--filter", "-f", "name_filter", type = str, default = None, help = "Only runs benchmark suites whose name contains this.")
+@click.option("--output", "-o", type = str, default = "_build/benchmarks.json", help = "Where to write the results as JSON.")
+@click.option("--baseline", "-b", type = str, default = None, help = "The version of the baseline to compare against. Defaults to the current version.")
+@click.option("--threshold", "-t", type = click.FloatRange(min = 0), default = 10.0, help = "How much slower (in %) a benchmark can get before it counts as a regression.")
+@click.option("--save_baseline", is_flag = True, default = False, help = "Saves the results as the baseline for the current version.")
+def run(samples: int, warmup: int, name_filter: str|None, output: str, baseline: str|None, threshold: float, save_baseline: bool):
+    print(Panel(
+        title = "⏱️ | Noir Benchmark Tool",
+        renderable = "A tool to run all Noir benchmarks.",
+        border_style = "green",
+        width = 60
+    ))
+
+    # Build Noir once for all suites
+    prelude = build_prelude()
+
+    # Run suites one at a time so they don't compete for CPU
+    results: list[BenchmarkResult] = []
+    suites: list[str] = []
+    failures: list[str] = []
+
+    for path in get_benchmark_paths():
+        if name_filter is not None and name_filter not in path.stem:
+            continue
+
+        suite = NoirBenchmarkSuite(path, prelude)
+        suites.append(suite.name)
+
+        try:
+            results.extend(suite.run(samples, warmup))
+        except RuntimeError as exception:
+            error(f"\"{suite.name}\" failed: {exception}")
+            failures.append(suite.name)
+            continue
+
+        info(f"Ran benchmark suite: \"{suite.name}\"")
+
+    # Show results
+    show_results(results)
+
+    # Save results
+    output_path = Path(output)
+    output_path.parent.mkdir(parents = True, exist_ok = True)
+    output_path.write_text(json.dumps([asdict(result) for result in results], indent = 4))
+
+    info(f"Saved results to {output_path}.")
+
+    # Save baseline
+    version = get_version_string()
+
+    if save_baseline:
+        write_baseline(version, results)
+        success(f"Saved results as the baseline for {version}.")
+    else:
+        # Compare against baseline
+        baseline_version = baseline or version
+        baseline_results = load_baselines().get(baseline_version)
+
+        if baseline_results is None:
+            info(f"No baseline for {baseline_version}. Use --save_baseline to create one.")
+        else:
+            regressions = compare_results(results, baseline_results, threshold)
+            missing = find_missing_results(results, baseline_results, suites)
+
+            if len(regressions) > 0:
+                error(f"{len(regressions)} benchmark(s) regressed by more than {threshold:.1f}% compared to {baseline_version}: {", ".join(result.name for result in regressions)}")
+
+            if len(missing) > 0:
+                error(f"{len(missing)} benchmark(s) in the {baseline_version} baseline have no result: {", ".join(missing)}")
+
+            if len(regressions) == 0 and len(missing) == 0 and len(failures) == 0:
+                success(f"No regressions compared to {baseline_version}.")
+
+            if len(regressions) > 0 or len(missing) > 0:
+                sys.exit(1)
+
+    # Failed suites fail the run, even without a baseline to compare against
+    if len(failures) > 0:
+        error(f"{len(failures)} benchmark suite(s) failed to run: {", ".join(failures)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,248 @@
+# // ---------------------------------------------------------------------
+# // ------- [Noir] Simulation Tool
+# // ---------------------------------------------------------------------
+
+"""
+A tool for load testing Noir (and optionally an addon) against a simulated Stormworks server.
+Repo: https://github.com/cuhHub/Noir
+
+---
+
+Copyright (C) 2025 Cuh4
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---- // Imports
+import click
+import json
+import math
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, asdict
+from rich import print
+from rich.panel import Panel
+from rich.table import Table
+from pathlib import Path
+
+from tools.combine import Combiner
+from run_test import build_prelude, success, info, error, LUA_EXECUTABLE, LUA_PATH
+
+# ---- // Variables
+SIMULATION_DIR = Path("simulation")
+SERVER = (SIMULATION_DIR / "_server.lua").read_text()
+SIMULATOR = (SIMULATION_DIR / "_simulator.lua").read_text()
+
+# ---- // Main
+@dataclass
+class SimulationConfig():
+    """
+    The workload to simulate.
+    """
+
+    ticks: int
+    tick_rate: int
+    players: int
+    vehicles: int
+    bodies: int
+    objects: int
+    tasks: int
+    churn: float
+    seed: int
+    batch_size: int
+
+    def to_lua(self) -> str:
+        """
+        Returns the call that starts the simulation. See `simulation/_simulator.lua`.
+
+        Returns:
+            str: The Lua code.
+        """
+
+        return (
+            f"Simulator:Run({{Ticks = {self.ticks}, TickRate = {self.tick_rate}, Players = {self.players}, Vehicles = {self.vehicles}, "
+            f"BodiesPerVehicle = {self.bodies}, Objects = {self.objects}, Tasks = {self.tasks}, Churn = {self.churn}, Seed = {self.seed}, BatchSize = {self.batch_size}}})"
+        )
+
+@dataclass
+class ServiceResult():
+    """
+    The time a service spent per tick during a simulation.
+    Times are measured over batches of ticks, so `mean_us`, `p95_us` and `max_us` describe the mean time per tick of each batch.
+    """
+
+    name: str
+    ticks: int
+    batches: int
+    mean_us: float
+    p95_us: float
+    max_us: float
+    total_ms: float
+
+def build_addon(directory: Path) -> str:
+    """
+    Builds an addon in memory.
+
+    Args:
+        directory (Path): The addon's source directory.
+
+    Returns:
+        str: The combined addon.
+    """
+
+    combiner = Combiner(
+        directory = directory,
+        destination = SIMULATION_DIR / "_addon_temp.lua",
+        whitelisted_extensions = [".lua"],
+        blacklisted_extensions = [],
+        ignored = []
+    )
+
+    addon, _ = combiner.combine(prevent_write = True)
+    return addon
+
+def parse_line(line: str, config: SimulationConfig) -> ServiceResult:
+    """
+    Parses a line of simulation output. See `simulation/_simulator.lua`.
+
+    Args:
+        line (str): The line to parse.
+        config (SimulationConfig): The workload that was simulated.
+
+    Returns:
+        ServiceResult: The parsed result.
+    """
+
+    _, name, times = line.split("\t")
+    batch_times = [float(time) * 1e6 for time in times.split(",")]
+
+    # The last batch is shorter if the ticks aren't a multiple of the batch size
+    batch_ticks = [min(config.batch_size, config.ticks - index * config.batch_size) for index in range(len(batch_times))]
+    per_tick = sorted(time / ticks for time, ticks in zip(batch_times, batch_ticks))
+
+    return ServiceResult(
+        name = name,
+        ticks = sum(batch_ticks),
+        batches = len(batch_times),
+        mean_us = sum(batch_times) / sum(batch_ticks),
+        p95_us = per_tick[math.ceil(len(per_tick) * 0.95) - 1],
+        max_us = per_tick[-1],
+        total_ms = sum(batch_times) / 1000
+    )
+
+def simulate(prelude: str, addon: str, config: SimulationConfig) -> list[ServiceResult]:
+    """
+    Runs a simulation.
+
+    Args:
+        prelude (str): The polyfill and Noir. See `build_prelude()` in `run_test.py`.
+        addon (str): The addon to run alongside Noir. Can be empty.
+        config (SimulationConfig): The workload to simulate.
+
+    Returns:
+        list[ServiceResult]: The time spent per tick by each service, slowest first. The whole tick is included as "Total".
+
+    Raises:
+        RuntimeError: If the simulation failed to run.
+    """
+
+    source = "\n\n".join([prelude, SERVER, addon, SIMULATOR, config.to_lua()])
+    result = subprocess.run([LUA_EXECUTABLE.absolute(), "-"], input = source.encode("utf-8"), cwd = LUA_PATH, capture_output = True)
+
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.decode("utf-8").strip().split("\n")[0])
+
+    results = [parse_line(line, config) for line in result.stdout.decode("utf-8").splitlines() if line.startswith("SIMULATION\t")]
+    return sorted(results, key = lambda result: (result.name != "Total", -result.total_ms))
+
+def show_results(results: list[ServiceResult], batch_size: int):
+    """
+    Prints simulation results as a table.
+
+    Args:
+        results (list[ServiceResult]): The results to show.
+        batch_size (int): The amount of ticks per batch.
+    """
+
+    table = Table(title = "Time Per Tick", caption = f"p95 and max are of the mean time per tick of each {batch_size}-tick batch, as Lua's timer can be too coarse (about 1ms on Windows) to time single ticks.")
+    table.add_column("Service", style = "blue")
+    table.add_column("Mean (µs)", justify = "right")
+    table.add_column("p95 (µs)", justify = "right")
+    table.add_column("Max (µs)", justify = "right")
+    table.add_column("Total (ms)", justify = "right")
+
+    for result in results:
+        table.add_row(result.name, f"{result.mean_us:,.1f}", f"{result.p95_us:,.1f}", f"{result.max_us:,.1f}", f"{result.total_ms:,.1f}")
+
+    print(table)
+
+@click.command()
+@click.option("--ticks", "-t", type = click.IntRange(min = 1), default = 3600, help = "The amount of ticks to simulate.")
+@click.option("--tick_rate", type = click.IntRange(min = 1), default = 60, help = "The amount of ticks per second, used to advance server time.")
+@click.option("--players", "-p", type = click.IntRange(min = 0), default = 60, help = "The amount of players to join.")
+@click.option("--vehicles", "-v", type = click.IntRange(min = 0), default = 200, help = "The amount of vehicles to spawn.")
+@click.option("--bodies", "-b", type = click.IntRange(min = 1), default = 5, help = "The amount of bodies per vehicle.")
+@click.option("--objects", "-o", type = click.IntRange(min = 0), default = 500, help = "The amount of objects to load.")
+@click.option("--tasks", type = click.IntRange(min = 0), default = 1000, help = "The amount of tick tasks to add.")
+@click.option("--churn", "-c", type = click.FloatRange(min = 0, max = 1), default = 0.05, help = "The chance per tick of a player, vehicle and object being replaced.")
+@click.option("--seed", "-s", type = int, default = 1, help = "The random seed, so runs are repeatable.")
+@click.option("--batch_size", type = click.IntRange(min = 1), default = 60, help = "The amount of ticks to time together. Lua's timer can be too coarse to time single ticks.")
+@click.option("--addon", "-a", type = str, default = None, help = "The source directory of an addon to run alongside Noir.")
+@click.option("--output", type = str, default = "_build/simulation.json", help = "Where to write the results as JSON.")
+def run(ticks: int, tick_rate: int, players: int, vehicles: int, bodies: int, objects: int, tasks: int, churn: float, seed: int, batch_size: int, addon: str|None, output: str):
+    print(Panel(
+        title = "🛰️ | Noir Simulation Tool",
+        renderable = "A tool to load test Noir against a simulated server.",
+        border_style = "green",
+        width = 60
+    ))
+
+    config = SimulationConfig(
+        ticks = ticks,
+        tick_rate = tick_rate,
+        players = players,
+        vehicles = vehicles,
+        bodies = bodies,
+        objects = objects,
+        tasks = tasks,
+        churn = churn,
+        seed = seed,
+        batch_size = batch_size
+    )
+
+    # Build Noir and the addon
+    prelude = build_prelude()
+    addon_source = build_addon(Path(addon)) if addon else ""
+
+    # Simulate
+    info(f"Simulating {ticks} ticks with {players} player(s), {vehicles} vehicle(s) ({bodies} bodies each), {objects} object(s) and {tasks} task(s).")
+
+    try:
+        results = simulate(prelude, addon_source, config)
+    except RuntimeError as exception:
+        error(f"Simulation failed: {exception}")
+        sys.exit(1)
+
+    # Show results
+    show_results(results, batch_size)
+
+    # Save results
+    output_path = Path(output)
+    output_path.parent.mkdir(parents = True, exist_ok = True)
+    output_path.write_text(json.dumps({"config": asdict(config), "services": [asdict(result) for result in results]}, indent = 4))
+
+    success(f"Saved results to {output_path}.")
+
+if __name__ == "__main__":
+    run()
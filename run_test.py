@@ -25,67 +25,97 @@ limitations under the License.
 
 # ---- // Imports
 import click
+import os
+import queue
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from rich import print
 from rich.panel import Panel
 from pathlib import Path
 
-from tools.combine import Combiner
+from tools.combine import Combiner, CombinerSourceMap
 
 # ---- // Variables
 TEST_DIR = Path("tests")
-POLYFILL = (TEST_DIR / "_polyfill.lua").read_text()
+POLYFILL_PATH = TEST_DIR / "_polyfill.lua"
+POLYFILL = POLYFILL_PATH.read_text()
 NOIR_PATH = Path("src/Noir")
 LUA_PATH = Path("lua")
 LUA_EXECUTABLE = LUA_PATH / "lua53.exe"
+WORKER_PATH = TEST_DIR / "_worker.lua"
 
 # ---- // Main
+def build_prelude(minify: bool = False) -> str:
+    """
+    Builds Noir in memory and packs the polyfill before it. This is shared by all tests.
+    
+    Args:
+        minify (bool, optional): Whether or not to minify Noir, to test the minifier against Noir. Defaults to False.
+    
+    Returns:
+        str: The polyfill followed by Noir.
+    """
+    
+    prelude, _ = build_prelude_with_source_map(minify)
+    return prelude
+
+def build_prelude_with_source_map(minify: bool = False) -> tuple[str, CombinerSourceMap]:
+    """
+    Builds Noir in memory and packs the polyfill before it, along with a source map for the result.
+    
+    Args:
+        minify (bool, optional): Whether or not to minify Noir, to test the minifier against Noir. Defaults to False.
+    
+    Returns:
+        str: The polyfill followed by Noir.
+        CombinerSourceMap: Maps lines of the prelude back to the polyfill and Noir's source files.
+    """
+    
+    combiner = Combiner(
+        directory = NOIR_PATH,
+        destination = TEST_DIR / "_noir_temp.lua",
+        whitelisted_extensions = [".lua"],
+        blacklisted_extensions = [],
+        ignored = [],
+        cache = True,
+        minify = minify
+    )
+    
+    noir, _ = combiner.combine(prevent_write = True)
+    
+    source_map = CombinerSourceMap()
+    source_map.add(1, POLYFILL_PATH, 1)
+    source_map.extend(combiner.source_map, POLYFILL.count("\n") + 2)
+    
+    return POLYFILL + "\n\n" + noir, source_map
+
 class NoirTest():
     """
     A Noir test.
     """
     
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, prelude: str, source_map: CombinerSourceMap|None = None):
         """
         Initializes new `NoirTest` instances.
         
         Args:
             path (Path): The path to the test file.
+            prelude (str): The code to run before the test (the polyfill and Noir). See `build_prelude()`.
+            source_map (CombinerSourceMap|None, optional): The source map of the prelude, used to point errors at the original files. See `build_prelude_with_source_map()`. Defaults to None.
         """
         
         self.name = path.stem
         self.path = path
-
-        
-    def _create_temp_noir_build(self) -> Path:
-        """
-        Creates a temporary build of Noir to be packed with the test file.
-        
-        Returns:
-            Path: The path to the temporary build.
-        """
+        self.prelude = prelude
+        self.duration = 0.0
         
-        # Create temp file
-        temp_file = self.path.parent / f"{self.name}_temp.lua"
+        self.source_map = CombinerSourceMap()
         
-        # Build Noir and dump to temp file
-        combiner = Combiner(
-            directory = NOIR_PATH,
-            destination = temp_file,
-            whitelisted_extensions = [".lua"],
-            blacklisted_extensions = [],
-            ignored = []
-        )
-        
-        combiner.combine()
-        
-        # Add polyfill
-        contents = temp_file.read_text()
-        contents = POLYFILL + "\n\n" + contents
-        temp_file.write_text(contents)
-        
-        # Return
-        return temp_file
+        if source_map is not None:
+            self.source_map.extend(source_map, 0)
+            
+        self.source_map.add(prelude.count("\n") + 3, path, 1)
     
     def _get_error_message(self, stderr: bytes) -> str:
         """
@@ -99,10 +129,11 @@ class NoirTest():
         """
         
         error = stderr.decode("utf-8")
-        no_path = "".join(error.split("_temp.lua:")[1:]) # removes long path at start of error message
-        no_traceback = no_path.split("\n")[0] # removes traceback at end of error message
+        _, chunk_name, no_path = error.partition("stdin:") # removes interpreter name at start of error message
+        mapped = self.source_map.rewrite(chunk_name + no_path, ["stdin"]) # points lines at the original files
+        no_traceback = mapped.split("\n")[0] # removes traceback at end of error message
 
-        return no_traceback 
+        return no_traceback
         
     def run(self) -> tuple[bool, str]:
         """
@@ -112,18 +143,13 @@ class NoirTest():
             tuple[bool, str]: Whether or not the test passed, and the reason why it failed (if it did)
         """
         
-        # Create a temporary build of Noir to be packed with the test file
-        temp_noir_build = self._create_temp_noir_build()
-        
-        # Add test code to the temp file
-        test_content = self.path.read_text()
+        # Pack the test code with Noir
+        source = self.prelude + "\n\n" + self.path.read_text()
         
-        with temp_noir_build.open("a") as file:
-            file.write("\n\n" + test_content)
-        
-        # Run the temp file
-        result = subprocess.run([LUA_EXECUTABLE, temp_noir_build.absolute()], cwd = LUA_PATH, capture_output = True)
-        temp_noir_build.unlink()
+        # Run through stdin
+        started_at = time.perf_counter()
+        result = subprocess.run([LUA_EXECUTABLE.absolute(), "-"], input = source.encode("utf-8"), cwd = LUA_PATH, capture_output = True)
+        self.duration = time.perf_counter() - started_at
         
         # Return
         if result.returncode == 0:
@@ -131,6 +157,164 @@ class NoirTest():
         else:
             return False, self._get_error_message(result.stderr)
 
+class NoirWorker():
+    """
+    A long-lived Lua interpreter that loads the polyfill and Noir once, then runs many tests.
+    Noir is restored to a fresh copy before each test. See `tests/_worker.lua` for the protocol.
+    """
+    
+    def __init__(self, prelude: str, source_map: CombinerSourceMap|None = None):
+        """
+        Initializes new `NoirWorker` instances.
+        
+        Args:
+            prelude (str): The code to load once (the polyfill and Noir). See `build_prelude()`.
+            source_map (CombinerSourceMap|None, optional): The source map of the prelude, used to point errors at the original files. See `build_prelude_with_source_map()`. Defaults to None.
+            
+        Raises:
+            RuntimeError: If the prelude failed to load.
+        """
+        
+        self.prelude = prelude
+        self.source_map = source_map or CombinerSourceMap()
+        self.process = subprocess.Popen(
+            [LUA_EXECUTABLE.absolute(), WORKER_PATH.absolute()],
+            cwd = LUA_PATH,
+            stdin = subprocess.PIPE,
+            stdout = subprocess.PIPE,
+            stderr = subprocess.DEVNULL
+        )
+        
+        successful, message = self._send("LOAD", prelude)
+        
+        if not successful:
+            self.close()
+            raise RuntimeError(f"Worker failed to load Noir: {self.source_map.rewrite(message, ["noir"])}")
+        
+    def _send(self, command: str, source: str) -> tuple[bool, str]:
+        """
+        Sends a command to the worker and waits for the response.
+        
+        Args:
+            command (str): The command header, excluding the source size.
+            source (str): The source code to send with the command.
+            
+        Returns:
+            tuple[bool, str]: Whether or not the command succeeded, and the error message (if it didn't)
+        """
+        
+        data = source.encode("utf-8")
+        name, _, argument = command.partition(" ")
+        header = f"{name} {len(data)}" + (f" {argument}" if argument else "")
+        
+        try:
+            self.process.stdin.write(header.encode("utf-8") + b"\n" + data)
+            self.process.stdin.flush()
+            response = self.process.stdout.readline().decode("utf-8").rstrip("\r\n")
+        except OSError:
+            response = ""
+            
+        if response == "":
+            self.process.wait()
+            return False, "Worker exited unexpectedly."
+        
+        if response == "OK":
+            return True, ""
+        
+        return False, response.removeprefix("FAIL ")
+    
+    def is_alive(self) -> bool:
+        """
+        Returns whether or not the worker process is still running.
+        
+        Returns:
+            bool: Whether or not the worker is alive.
+        """
+        
+        return self.process.poll() is None
+        
+    def run(self, test: "NoirTest") -> tuple[bool, str]:
+        """
+        Runs a test in this worker.
+        
+        Args:
+            test (NoirTest): The test to run.
+            
+        Returns:
+            tuple[bool, str]: Whether or not the test passed, and the reason why it failed (if it did)
+        """
+        
+        started_at = time.perf_counter()
+        successful, message = self._send(f"RUN {test.name}", test.path.read_text())
+        test.duration = time.perf_counter() - started_at
+        
+        # Tests are loaded as their own chunk, so their lines need no mapping
+        test_map = CombinerSourceMap([test.path], [(1, 0, 1)])
+        return successful, self.source_map.rewrite(test_map.rewrite(message, [test.name]), ["noir"])
+    
+    def close(self):
+        """
+        Stops the worker.
+        """
+        
+        if self.process.stdin:
+            self.process.stdin.close()
+            
+        self.process.wait()
+        
+class NoirWorkerPool():
+    """
+    A pool of `NoirWorker`s. Workers that die are replaced.
+    """
+    
+    def __init__(self, prelude: str, size: int, source_map: CombinerSourceMap|None = None):
+        """
+        Initializes new `NoirWorkerPool` instances.
+        
+        Args:
+            prelude (str): The code each worker loads once. See `build_prelude()`.
+            size (int): The amount of workers.
+            source_map (CombinerSourceMap|None, optional): The source map of the prelude. See `NoirWorker`. Defaults to None.
+        """
+        
+        self.prelude = prelude
+        self.source_map = source_map
+        self.workers: queue.Queue[NoirWorker] = queue.Queue()
+        
+        with ThreadPoolExecutor(max_workers = size) as executor:
+            for worker in executor.map(lambda _: NoirWorker(prelude, source_map), range(size)):
+                self.workers.put(worker)
+        
+    def run(self, test: "NoirTest") -> tuple[bool, str]:
+        """
+        Runs a test on the next free worker.
+        
+        Args:
+            test (NoirTest): The test to run.
+            
+        Returns:
+            tuple[bool, str]: Whether or not the test passed, and the reason why it failed (if it did)
+        """
+        
+        worker = self.workers.get()
+        
+        try:
+            return worker.run(test)
+        finally:
+            if not worker.is_alive():
+                worker.close()
+                worker = NoirWorker(self.prelude, self.source_map)
+                
+            self.workers.put(worker)
+            
+    def close(self):
+        """
+        Stops all workers.
+        """
+        
+        while not self.workers.empty():
+            self.workers.get().close()
+
 def success(message: str):
     """
     Prints a success message.
@@ -161,8 +345,21 @@ def error(message: str):
     
     print("[bold red](Error)[/bold red] " + message)
 
+def get_test_paths() -> list[Path]:
+    """
+    Returns the paths of all tests, sorted by name.
+    
+    Returns:
+        list[Path]: The paths of all tests.
+    """
+    
+    return sorted(path for path in TEST_DIR.iterdir() if path.suffix == ".lua" and not path.name.startswith("_"))
+
 @click.command()
-def run():
+@click.option("--jobs", "-j", type = click.IntRange(min = 1), default = os.cpu_count() or 1, help = "The amount of tests to run at the same time. Defaults to the CPU count.")
+@click.option("--persistent", "-p", is_flag = True, default = False, help = "Runs tests in long-lived interpreters that only load Noir once.")
+@click.option("--minify", "-m", is_flag = True, default = False, help = "Runs tests against minified Noir, to check the minifier.")
+def run(jobs: int, persistent: bool, minify: bool):
     print(Panel(
         title = "⚙️ | Noir Test Tool",
         renderable = "A tool to run all Noir tests.",
@@ -170,27 +367,36 @@ def run():
         width = 60
     ))
     
-    # Run tests
+    # Build Noir once for all tests
+    started_at = time.perf_counter()
+    prelude, source_map = build_prelude_with_source_map(minify)
+    build_duration = time.perf_counter() - started_at
+    
+    # Start workers if needed
+    pool = NoirWorkerPool(prelude, jobs, source_map) if persistent else None
+    pool_duration = time.perf_counter() - started_at - build_duration
+    
+    # Run tests. Each test feeds its own stdin, so they can run at the same time
     results: list[tuple[NoirTest, bool, str]] = []
     success_count, fail_count = 0, 0
     
-    for test_path in TEST_DIR.iterdir():
-        if test_path.suffix != ".lua":
-            continue
-        
-        if test_path.name.startswith("_"):
-            continue
-        
-        test = NoirTest(test_path)
-        successful, fail_reason = test.run()
-        results.append((test, successful, fail_reason))
-        
-        if successful:
-            success_count += 1
-        else:
-            fail_count += 1
+    tests = [NoirTest(test_path, prelude, source_map) for test_path in get_test_paths()]
+    
+    with ThreadPoolExecutor(max_workers = jobs) as executor:
+        for test, (successful, fail_reason) in zip(tests, executor.map(pool.run if pool else NoirTest.run, tests)): # map() keeps the order stable
+            results.append((test, successful, fail_reason))
+            
+            if successful:
+                success_count += 1
+            else:
+                fail_count += 1
 
-        info(f"Ran test: \"{test.name}\"")
+            info(f"Ran test: \"{test.name}\"")
+            
+    run_duration = time.perf_counter() - started_at - build_duration - pool_duration
+    
+    if pool:
+        pool.close()
         
     # Show results
     info("----------------")
@@ -205,5 +411,11 @@ def run():
     test_count = len(results)
     info(f"Out of {test_count} tests, {success_count} ({success_count / test_count * 100:.1f}%) passed and {fail_count} failed ({fail_count / test_count * 100:.1f}%).")
     
+    # Show timings
+    total_duration = time.perf_counter() - started_at
+    test_duration = sum(test.duration for test, _, _ in results)
+    
+    info(f"Built Noir in {build_duration * 1000:.1f}ms.{f" Started {jobs} worker(s) in {pool_duration * 1000:.1f}ms." if pool else ""} Ran {test_count} tests in {run_duration * 1000:.1f}ms with {jobs} job(s) ({test_duration / test_count * 1000:.1f}ms per test). Total: {total_duration * 1000:.1f}ms.")
+    
 if __name__ == "__main__":
     run()
\ No newline at end of file
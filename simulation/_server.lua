@@ -0,0 +1,171 @@
+--------------------------------------------------------
+-- [Noir] Simulation - Server
+--------------------------------------------------------
+
+--[[
+    ----------------------------
+
+    CREDIT:
+        Author(s): @Cuh4 (GitHub)
+        GitHub Repository: https://github.com/cuhHub/Noir
+
+    License:
+        Copyright (C) 2025 Cuh4
+
+        Licensed under the Apache License, Version 2.0 (the "License");
+        you may not use this file except in compliance with the License.
+        You may obtain a copy of the License at
+
+            http://www.apache.org/licenses/LICENSE-2.0
+
+        Unless required by applicable law or agreed to in writing, software
+        distributed under the License is distributed on an "AS IS" BASIS,
+        WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+        See the License for the specific language governing permissions and
+        limitations under the License.
+
+    ----------------------------
+]]
+
+---@diagnostic disable duplicate-set-field
+
+--[[
+    A headless stand-in for the Stormworks `server` API, used by `run_simulation.py`.<br>
+    Loaded after `tests/_polyfill.lua`. Game state lives in `Simulation` and is changed by `simulation/_simulator.lua`.<br>
+    Any `server` function not defined here does nothing and returns nothing.
+]]
+Simulation = {
+    TimeMillisec = 0,
+    Players = {}, ---@type table<integer, table>
+    Vehicles = {}, ---@type table<integer, table<integer, integer>> group_id -> vehicle_ids
+    Bodies = {}, ---@type table<integer, table>
+    Objects = {} ---@type table<integer, table>
+}
+
+setmetatable(server, {
+    __index = function()
+        return function() end
+    end
+})
+
+-------------------------------
+-- // General
+-------------------------------
+
+function server.getTimeMillisec()
+    return Simulation.TimeMillisec
+end
+
+function server.getAddonIndex()
+    return 0, true
+end
+
+function server.getAddonData()
+    return {
+        name = "Simulation",
+        path_id = "simulation",
+        file_store = 4,
+        location_count = 0
+    }
+end
+
+function server.getMapID()
+    return 0
+end
+
+-------------------------------
+-- // Players
+-------------------------------
+
+function server.getPlayers()
+    local players = {{id = 0, name = "Server", admin = true, auth = true, steam_id = 0}} -- dedicated server host
+
+    for _, player in pairs(Simulation.Players) do
+        table.insert(players, player)
+    end
+
+    return players
+end
+
+function server.getPlayerCharacterID(peer_id)
+    local player = Simulation.Players[peer_id]
+    return player and player.object_id, player ~= nil
+end
+
+function server.getPlayerPos(peer_id)
+    local player = Simulation.Players[peer_id]
+    return player and player.pos or matrix.translation(0, 0, 0), player ~= nil
+end
+
+function server.getPlayerLookDirection(peer_id)
+    return 0, 0, 1, Simulation.Players[peer_id] ~= nil
+end
+
+-------------------------------
+-- // Vehicles
+-------------------------------
+
+function server.getVehicleGroup(group_id)
+    local bodies = Simulation.Vehicles[group_id]
+    return bodies or {}, bodies ~= nil
+end
+
+function server.getVehicleSimulating(vehicle_id)
+    local body = Simulation.Bodies[vehicle_id]
+    return body ~= nil and body.loaded, body ~= nil
+end
+
+function server.getVehiclePos(vehicle_id)
+    local body = Simulation.Bodies[vehicle_id]
+    return body and body.pos or matrix.translation(0, 0, 0), body ~= nil
+end
+
+function server.getVehicleData(vehicle_id)
+    local body = Simulation.Bodies[vehicle_id]
+
+    if not body then
+        return nil, false
+    end
+
+    return {
+        tags_full = "",
+        tags = {},
+        group_id = body.group_id,
+        static = false,
+        editable = true,
+        invulnerable = false,
+        name = "Simulated Body",
+        transform = body.pos,
+        simulating = body.loaded,
+        mass = 1000,
+        voxels = 100
+    }, true
+end
+
+-------------------------------
+-- // Objects
+-------------------------------
+
+function server.getObjectSimulating(object_id)
+    local object = Simulation.Objects[object_id]
+    return object ~= nil and object.loaded, object ~= nil
+end
+
+function server.getObjectPos(object_id)
+    local object = Simulation.Objects[object_id]
+    return object and object.pos or matrix.translation(0, 0, 0), object ~= nil
+end
+
+function server.getObjectData(object_id)
+    local object = Simulation.Objects[object_id]
+
+    if not object then
+        return nil
+    end
+
+    return {
+        object_type = object.type,
+        transform = object.pos,
+        simulating = object.loaded
+    }
+end
@@ -0,0 +1,377 @@
+--------------------------------------------------------
+-- [Noir] Simulation - Simulator
+--------------------------------------------------------
+
+--[[
+    ----------------------------
+
+    CREDIT:
+        Author(s): @Cuh4 (GitHub)
+        GitHub Repository: https://github.com/cuhHub/Noir
+
+    License:
+        Copyright (C) 2025 Cuh4
+
+        Licensed under the Apache License, Version 2.0 (the "License");
+        you may not use this file except in compliance with the License.
+        You may obtain a copy of the License at
+
+            http://www.apache.org/licenses/LICENSE-2.0
+
+        Unless required by applicable law or agreed to in writing, software
+        distributed under the License is distributed on an "AS IS" BASIS,
+        WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+        See the License for the specific language governing permissions and
+        limitations under the License.
+
+    ----------------------------
+]]
+
+--[[
+    Drives Noir's real tick loop against `simulation/_server.lua`, used by `run_simulation.py`.<br>
+    Time spent in each service (its methods and its callback connections) is measured, excluding time spent in other services it calls into.<br>
+    `os.clock()` can be too coarse to time a single tick (about 1ms on Windows), so time is accumulated over batches of ticks instead.
+
+    Simulator:Run({
+        Ticks = 3600,
+        TickRate = 60,
+        Players = 60,
+        Vehicles = 200,
+        BodiesPerVehicle = 5,
+        Objects = 500,
+        Tasks = 1000,
+        Churn = 0.05,
+        Seed = 1,
+        BatchSize = 60
+    })
+]]
+Simulator = {}
+
+local clock = os.clock
+
+-------------------------------
+-- // Measuring
+-------------------------------
+
+Simulator._Totals = {} ---@type table<string, number>
+Simulator._Stack = {} ---@type table<integer, table>
+
+--[[
+    Starts measuring time for a service.
+]]
+---@param name string
+function Simulator:_Enter(name)
+    table.insert(self._Stack, {Name = name, Start = clock(), Children = 0})
+end
+
+--[[
+    Stops measuring time for the most recently entered service, passing through any values.
+]]
+---@return any
+function Simulator:_Leave(...)
+    local frame = table.remove(self._Stack)
+    local elapsed = clock() - frame.Start
+    local parent = self._Stack[#self._Stack]
+
+    self._Totals[frame.Name] = (self._Totals[frame.Name] or 0) + elapsed - frame.Children
+
+    if parent then
+        parent.Children = parent.Children + elapsed
+    end
+
+    return ...
+end
+
+--[[
+    Wraps a function so time spent in it is attributed to a service.
+]]
+---@param name string
+---@param func function
+---@return function
+function Simulator:_Wrap(name, func)
+    return function(...)
+        self:_Enter(name)
+        return self:_Leave(func(...))
+    end
+end
+
+--[[
+    Wraps all methods and callback connections of all services.
+]]
+function Simulator:_Instrument()
+    for name, service in pairs(Noir.Services.CreatedServices) do
+        for index, value in pairs(service) do
+            if type(value) == "function" then
+                service[index] = self:_Wrap(name, value)
+            elseif Noir.Classes.Connection:IsSameType(value) then
+                value.Callback = self:_Wrap(name, value.Callback)
+            end
+        end
+    end
+end
+
+-------------------------------
+-- // Game
+-------------------------------
+
+Simulator._NextPeerID = 1
+Simulator._NextGroupID = 1
+Simulator._NextVehicleID = 1
+Simulator._NextObjectID = 1
+
+--[[
+    Calls a game callback if the addon defined it.
+]]
+---@param name string
+local function callback(name, ...)
+    local func = _ENV[name]
+
+    if func then
+        func(...)
+    end
+end
+
+--[[
+    Returns a random key from a table, or nil if it is empty.
+]]
+---@param tbl table
+---@return any
+local function randomKey(tbl)
+    local keys = {}
+
+    for key in pairs(tbl) do
+        table.insert(keys, key)
+    end
+
+    return #keys > 0 and keys[math.random(#keys)] or nil
+end
+
+--[[
+    Makes a player join.
+]]
+function Simulator:JoinPlayer()
+    local peerID = self._NextPeerID
+    self._NextPeerID = peerID + 1
+
+    local player = {
+        id = peerID,
+        name = "Player "..peerID,
+        admin = false,
+        auth = true,
+        steam_id = 76561190000000000 + peerID,
+        object_id = self:LoadObject(),
+        pos = matrix.translation(math.random(-5000, 5000), 0, math.random(-5000, 5000))
+    }
+
+    Simulation.Players[peerID] = player
+    callback("onPlayerJoin", player.steam_id, player.name, peerID, player.admin, player.auth)
+end
+
+--[[
+    Makes a random player leave.
+]]
+function Simulator:LeavePlayer()
+    local peerID = randomKey(Simulation.Players)
+
+    if not peerID then
+        return
+    end
+
+    local player = Simulation.Players[peerID]
+    Simulation.Players[peerID] = nil
+
+    callback("onPlayerLeave", player.steam_id, player.name, peerID, player.admin, player.auth)
+end
+
+--[[
+    Spawns a vehicle, loading all of its bodies.
+]]
+---@param bodyCount integer
+function Simulator:SpawnVehicle(bodyCount)
+    local groupID = self._NextGroupID
+    self._NextGroupID = groupID + 1
+
+    local peerID = randomKey(Simulation.Players) or -1
+    local pos = matrix.translation(math.random(-5000, 5000), 0, math.random(-5000, 5000))
+    local x, y, z = matrix.position(pos)
+    local bodyIDs = {}
+
+    for _ = 1, bodyCount do
+        local vehicleID = self._NextVehicleID
+        self._NextVehicleID = vehicleID + 1
+
+        Simulation.Bodies[vehicleID] = {group_id = groupID, pos = pos, loaded = false}
+        table.insert(bodyIDs, vehicleID)
+    end
+
+    Simulation.Vehicles[groupID] = bodyIDs
+
+    for _, vehicleID in ipairs(bodyIDs) do
+        callback("onVehicleSpawn", vehicleID, peerID, x, y, z, 10, groupID)
+    end
+
+    callback("onGroupSpawn", groupID, peerID, x, y, z, 10)
+
+    for _, vehicleID in ipairs(bodyIDs) do
+        Simulation.Bodies[vehicleID].loaded = true
+        callback("onVehicleLoad", vehicleID)
+    end
+end
+
+--[[
+    Despawns a random vehicle.
+]]
+function Simulator:DespawnVehicle()
+    local groupID = randomKey(Simulation.Vehicles)
+
+    if not groupID then
+        return
+    end
+
+    for _, vehicleID in ipairs(Simulation.Vehicles[groupID]) do
+        Simulation.Bodies[vehicleID] = nil
+        callback("onVehicleDespawn", vehicleID, -1)
+    end
+
+    Simulation.Vehicles[groupID] = nil
+end
+
+--[[
+    Creates and loads an object.
+]]
+---@return integer
+function Simulator:LoadObject()
+    local objectID = self._NextObjectID
+    self._NextObjectID = objectID + 1
+
+    Simulation.Objects[objectID] = {type = 1, pos = matrix.translation(0, 0, 0), loaded = true}
+    callback("onObjectLoad", objectID)
+
+    return objectID
+end
+
+--[[
+    Unloads and removes a random object.
+]]
+function Simulator:UnloadObject()
+    local objectID = randomKey(Simulation.Objects)
+
+    if not objectID then
+        return
+    end
+
+    Simulation.Objects[objectID] = nil
+    callback("onObjectUnload", objectID)
+end
+
+--[[
+    Advances time by one tick and calls `onTick`.
+]]
+---@param tickRate number
+function Simulator:Tick(tickRate)
+    Simulation.TimeMillisec = Simulation.TimeMillisec + 1000 / tickRate
+    callback("onTick", 1)
+end
+
+-------------------------------
+-- // Main
+-------------------------------
+
+--[[
+    Starts Noir, populates the server, then runs ticks while measuring each service.<br>
+    Writes one line per service to stdout:
+    SIMULATION <tab> service <tab> comma-separated time spent per batch of `BatchSize` ticks in seconds
+
+    The last batch is shorter if `Ticks` isn't a multiple of `BatchSize`.
+
+    The whole tick is reported under the name "Total".
+]]
+---@param config table
+function Simulator:Run(config)
+    math.randomseed(config.Seed or 1)
+    debug.log = function() end -- logs are formatted, but not printed
+
+    -- Start Noir, as the game would
+    if not Noir.IsStarting and not Noir.HasStarted then
+        Noir:Start()
+    end
+
+    callback("onCreate", true)
+    self:Tick(config.TickRate)
+
+    if not Noir.HasStarted then
+        error("Noir did not start.")
+    end
+
+    self:_Instrument()
+
+    -- Populate
+    for _ = 1, config.Players do
+        self:JoinPlayer()
+    end
+
+    for _ = 1, config.Vehicles do
+        self:SpawnVehicle(config.BodiesPerVehicle)
+    end
+
+    for _ = 1, config.Objects do
+        self:LoadObject()
+    end
+
+    for _ = 1, config.Tasks do
+        Noir.Services.TaskService:AddTickTask(function() end, math.random(1, 600), nil, math.random() < 0.5)
+    end
+
+    -- Run ticks
+    local times = {Total = {}}
+
+    for name in pairs(Noir.Services.CreatedServices) do
+        times[name] = {}
+    end
+
+    local batchSize = config.BatchSize or 60
+
+    for name in pairs(times) do
+        self._Totals[name] = 0
+    end
+
+    local started = clock()
+
+    for tick = 1, config.Ticks do
+        if math.random() < config.Churn then
+            self:LeavePlayer()
+            self:JoinPlayer()
+        end
+
+        if math.random() < config.Churn then
+            self:DespawnVehicle()
+            self:SpawnVehicle(config.BodiesPerVehicle)
+        end
+
+        if math.random() < config.Churn then
+            self:UnloadObject()
+            self:LoadObject()
+        end
+
+        self:Tick(config.TickRate)
+
+        -- End the batch
+        if tick % batchSize == 0 or tick == config.Ticks then
+            self._Totals.Total = clock() - started
+
+            for name, serviceTimes in pairs(times) do
+                table.insert(serviceTimes, ("%.9f"):format(self._Totals[name]))
+                self._Totals[name] = 0
+            end
+
+            started = clock()
+        end
+    end
+
+    -- Output
+    for name, serviceTimes in pairs(times) do
+        io.write(("SIMULATION\t%s\t%s\n"):format(name, table.concat(serviceTimes, ",")))
+    end
+
+    io.stdout:flush()
+end
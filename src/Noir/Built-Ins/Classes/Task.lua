@@ -51,6 +51,7 @@
 ---@field IsRepeating boolean Whether or not this task is repeating
 ---@field Arguments table<integer, any> The arguments that will be passed to this task upon completion
 ---@field OnCompletion NoirEvent The event that will be fired when this task is completed
+---@field _QueueIndex integer|nil The position of this task in the TaskService's queue for its task type, or nil if it isn't queued
 Noir.Classes.Task = Noir.Class("Task")
 
 --[[
@@ -104,6 +105,8 @@ function Noir.Classes.Task:SetDuration(duration)
 
     self.Duration = duration
     self.StopsAt = self.StartedAt + duration
+
+    Noir.Services.TaskService:_RescheduleTask(self)
 end
 
 --[[
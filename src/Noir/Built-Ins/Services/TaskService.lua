@@ -47,7 +47,8 @@
 ---@field _TaskID integer The ID of the most recent task
 ---@field TickIterationProcesses table<integer, NoirTickIterationProcess> A table of tick iteration processes
 ---@field _TickIterationProcessID integer The ID of the most recent tick iteration process
----@field _TaskTypeHandlers table<NoirTaskType, fun(task: NoirTask)>
+---@field _TaskTypeClocks table<NoirTaskType, fun(): number> Returns the current point in time for each task type
+---@field _TaskQueues table<NoirTaskType, table<integer, NoirTask>> Binary min-heaps of tasks for each task type, ordered by when they stop
 ---@field _OnTickConnection NoirConnection Represents the connection to the onTick game callback
 Noir.Services.TaskService = Noir.Services:CreateService(
     "TaskService",
@@ -67,41 +68,20 @@ function Noir.Services.TaskService:ServiceInit()
     self.TickIterationProcesses = {}
     self._TickIterationProcessID = 0
 
-    self._TaskTypeHandlers = {}
+    self._TaskTypeClocks = {
+        Time = function()
+            return self:GetTimeSeconds()
+        end,
 
-    self._TaskTypeHandlers["Time"] = function(task)
-        local time = self:GetTimeSeconds()
-
-        if time < task.StopsAt then
-            return
+        Ticks = function()
+            return self.Ticks
         end
+    }
 
-        if task.IsRepeating then
-            task.StartedAt = time
-            task.StopsAt = time + task.Duration
-
-            task.OnCompletion:Fire(table.unpack(task.Arguments))
-        else
-            self:RemoveTask(task)
-            task.OnCompletion:Fire(table.unpack(task.Arguments))
-        end
-    end
-
-    self._TaskTypeHandlers["Ticks"] = function(task)
-        if self.Ticks < task.StopsAt then
-            return
-        end
-
-        if task.IsRepeating then
-            task.StartedAt = self.Ticks
-            task.StopsAt = self.Ticks + task.Duration
-
-            task.OnCompletion:Fire(table.unpack(task.Arguments))
-        else
-            self:RemoveTask(task)
-            task.OnCompletion:Fire(table.unpack(task.Arguments))
-        end
-    end
+    self._TaskQueues = {
+        Time = {},
+        Ticks = {}
+    }
 end
 
 function Noir.Services.TaskService:ServiceStart()
@@ -130,21 +110,199 @@ end
 
 --[[
     Handles tasks.<br>
+    Only tasks that are due are touched, so this is cheap no matter how many tasks are waiting.<br>
     Used internally.
 ]]
 function Noir.Services.TaskService:_HandleTasks()
-    for _, task in pairs(self:GetTasks(true)) do
-        if not self:_IsValidTaskType(task.TaskType) then
-            error("TaskService:_HandleTasks()", "Task #%d has an invalid task type of '%s'. Please ensure when creating a task, you use the correct type (assuming you're using `:_AddTask()`)", task.ID, task.TaskType)
+    for taskType, queue in pairs(self._TaskQueues) do
+        if not queue[1] then
+            goto continue
         end
 
-        local handler = self._TaskTypeHandlers[task.TaskType]
-        handler(task)
+        local now = self._TaskTypeClocks[taskType]()
+
+        -- Most ticks have nothing due, so don't create a table for them
+        if queue[1].StopsAt > now then
+            goto continue
+        end
+
+        -- Take all due tasks out first, so repeating tasks with a duration of 0 only run once per tick
+        local due = {}
+
+        while queue[1] and queue[1].StopsAt <= now do
+            table.insert(due, self:_PopTask(queue))
+        end
+
+        for _, task in ipairs(due) do
+            -- Skip tasks removed by a previous task this tick
+            if self.Tasks[task.ID] == task then
+                if task.IsRepeating then
+                    task.StartedAt = now
+                    task.StopsAt = now + task.Duration
+
+                    self:_PushTask(task)
+                else
+                    self.Tasks[task.ID] = nil
+                end
+
+                task.OnCompletion:Fire(table.unpack(task.Arguments))
+            end
+        end
 
         ::continue::
     end
 end
 
+--[[
+    Returns whether or not a task should run before another task.<br>
+    Used internally.
+]]
+---@param task NoirTask
+---@param other NoirTask
+---@return boolean
+function Noir.Services.TaskService:_IsTaskBefore(task, other)
+    if task.StopsAt == other.StopsAt then
+        return task.ID < other.ID
+    end
+
+    return task.StopsAt < other.StopsAt
+end
+
+--[[
+    Swaps two tasks in a task queue.<br>
+    Used internally.
+]]
+---@param queue table<integer, NoirTask>
+---@param index integer
+---@param otherIndex integer
+function Noir.Services.TaskService:_SwapTasks(queue, index, otherIndex)
+    queue[index], queue[otherIndex] = queue[otherIndex], queue[index]
+    queue[index]._QueueIndex = index
+    queue[otherIndex]._QueueIndex = otherIndex
+end
+
+--[[
+    Moves a task up its task queue until it is in order.<br>
+    Used internally.
+]]
+---@param queue table<integer, NoirTask>
+---@param index integer
+function Noir.Services.TaskService:_SiftTaskUp(queue, index)
+    while index > 1 do
+        local parent = math.floor(index / 2)
+
+        if not self:_IsTaskBefore(queue[index], queue[parent]) then
+            break
+        end
+
+        self:_SwapTasks(queue, index, parent)
+        index = parent
+    end
+end
+
+--[[
+    Moves a task down its task queue until it is in order.<br>
+    Used internally.
+]]
+---@param queue table<integer, NoirTask>
+---@param index integer
+function Noir.Services.TaskService:_SiftTaskDown(queue, index)
+    local size = #queue
+
+    while true do
+        local smallest = index
+        local left, right = index * 2, index * 2 + 1
+
+        if left <= size and self:_IsTaskBefore(queue[left], queue[smallest]) then
+            smallest = left
+        end
+
+        if right <= size and self:_IsTaskBefore(queue[right], queue[smallest]) then
+            smallest = right
+        end
+
+        if smallest == index then
+            break
+        end
+
+        self:_SwapTasks(queue, index, smallest)
+        index = smallest
+    end
+end
+
+--[[
+    Adds a task to the queue for its task type.<br>
+    Used internally.
+]]
+---@param task NoirTask
+function Noir.Services.TaskService:_PushTask(task)
+    local queue = self._TaskQueues[task.TaskType]
+
+    table.insert(queue, task)
+    task._QueueIndex = #queue
+
+    self:_SiftTaskUp(queue, task._QueueIndex)
+end
+
+--[[
+    Removes and returns the task that stops first from a task queue.<br>
+    Used internally.
+]]
+---@param queue table<integer, NoirTask>
+---@return NoirTask
+function Noir.Services.TaskService:_PopTask(queue)
+    local task = queue[1]
+    self:_UnqueueTask(task)
+
+    return task
+end
+
+--[[
+    Removes a task from the queue for its task type, if it is in it.<br>
+    Used internally.
+]]
+---@param task NoirTask
+function Noir.Services.TaskService:_UnqueueTask(task)
+    local index = task._QueueIndex
+
+    if not index then
+        return
+    end
+
+    local queue = self._TaskQueues[task.TaskType]
+    local last = #queue
+
+    if index ~= last then
+        self:_SwapTasks(queue, index, last)
+    end
+
+    queue[last] = nil
+    task._QueueIndex = nil
+
+    if index ~= last then
+        self:_SiftTaskUp(queue, index)
+        self:_SiftTaskDown(queue, index)
+    end
+end
+
+--[[
+    Moves a queued task to its new place after its `StopsAt` changed.<br>
+    Used internally.
+]]
+---@param task NoirTask
+function Noir.Services.TaskService:_RescheduleTask(task)
+    local index = task._QueueIndex
+
+    if not index then
+        return
+    end
+
+    local queue = self._TaskQueues[task.TaskType]
+
+    self:_SiftTaskUp(queue, index)
+    self:_SiftTaskDown(queue, task._QueueIndex)
+end
+
 --[[
     Add a task to the TaskService.<br>
     Used internally.
@@ -178,6 +336,7 @@ function Noir.Services.TaskService:_AddTask(callback, duration, arguments, isRep
     task.OnCompletion:Connect(callback)
 
     self.Tasks[task.ID] = task
+    self:_PushTask(task)
 
     -- Return the task
     return task
@@ -190,7 +349,7 @@ end
 ---@param taskType string
 ---@return boolean
 function Noir.Services.TaskService:_IsValidTaskType(taskType)
-    return self._TaskTypeHandlers[taskType] ~= nil
+    return self._TaskTypeClocks[taskType] ~= nil
 end
 
 --[[
@@ -335,6 +494,7 @@ function Noir.Services.TaskService:RemoveTask(task)
 
     -- Remove task
     self.Tasks[task.ID] = nil
+    self:_UnqueueTask(task)
 end
 
 --[[
@@ -34,9 +34,39 @@
 --[[
     A module of Noir for checking if a value is of the correct type.<br>
     This normally would be a library, but libraries need to use this and libraries are meant to be independent of each other.
+
+    Noir.TypeChecking:Assert("myFunction()", "name", name, "string", "nil")
+    Noir.TypeChecking:Assert("myFunction()", "player", player, Noir.Classes.Player)
+
+    -- Turning type checking off for a tested release
+    Noir.TypeChecking.Enabled = false
 ]]
 Noir.TypeChecking = {}
 
+--[[
+    Enables/disables type checking. True by default.<br>
+    When disabled, `:Assert()` and `:AssertMany()` do nothing. This is faster, but mistakes will go unnoticed, so only disable this once your addon is tested.
+]]
+Noir.TypeChecking.Enabled = true
+
+--[[
+    A table containing compiled checkers, keyed by the first, second and third type. See `:_GetChecker()`.<br>
+    Used internally.
+]]
+Noir.TypeChecking._Checkers = setmetatable({}, {__mode = "k"})
+
+--[[
+    A table containing compiled checkers for more than three types, keyed by the amount of types and then by each type. See `:_GetVariadicChecker()`.<br>
+    Used internally.
+]]
+Noir.TypeChecking._VariadicCheckers = setmetatable({}, {__mode = "k"})
+
+--[[
+    Used in place of missing types when keying `_Checkers`.<br>
+    Used internally.
+]]
+Noir.TypeChecking._NoType = {}
+
 --[[
     Raises an error if the value is not any of the provided types.<br>
     This supports checking if a value is a specific class or not too.
@@ -44,39 +74,43 @@ Noir.TypeChecking = {}
 ---@param origin string The location of the thing (method, function, etc) that called this so the user can find out where something went wrong
 ---@param parameterName string The name of the parameter that is being type checked
 ---@param value any
+---@param typeA NoirTypeCheckingType
+---@param typeB NoirTypeCheckingType|nil
+---@param typeC NoirTypeCheckingType|nil
 ---@param ... NoirTypeCheckingType
-function Noir.TypeChecking:Assert(origin, parameterName, value, ...)
+function Noir.TypeChecking:Assert(origin, parameterName, value, typeA, typeB, typeC, ...)
     -- TODO: Type checking can't be performed here otherwise we get a stack overflow :-( very small priority but might want to get this sorted in the future
 
-    -- Pack types into a table
-    local types = {...}
+    -- Check if enabled
+    if not self.Enabled then
+        return
+    end
 
-    -- Get value type
+    -- Value == ExactType. Covers most calls without creating any tables
     local valueType = type(value)
 
-    -- Check if the value is of the correct type
-    for _, typeToCheck in pairs(types) do
-        -- Value == ExactType
-        if valueType == typeToCheck then
-            return
-        end
+    if valueType == typeA or valueType == typeB or valueType == typeC then
+        return
+    end
 
-        -- Value == Any Class
-        if typeToCheck == "class" and Noir.IsClass(value) then
-            return
-        end
+    -- Value == Class, or more than three types were provided
+    local checker
 
-        -- Value == Exact Class
-        if Noir.IsClass(typeToCheck) and typeToCheck:IsSameType(value) then ---@diagnostic disable-line param-type-mismatch
-            return
-        end
+    if select("#", ...) == 0 then
+        checker = self:_GetChecker(typeA, typeB, typeC)
+    else
+        checker = self:_GetVariadicChecker(typeA, typeB, typeC, ...)
+    end
+
+    if checker(value) then
+        return
     end
 
     -- Otherwise, raise an error
     error(
         origin,
         "Expected %s for parameter '%s', but got '%s'.",
-        self:_FormatTypes(types),
+        self:_FormatTypes(self:_CollectTypes(typeA, typeB, typeC, ...)),
         parameterName,
         Noir.IsClass(value) and value.ClassName.." (Class)" or valueType
     )
@@ -90,6 +124,11 @@ end
 ---@param values table<integer, any>
 ---@param ... NoirTypeCheckingType
 function Noir.TypeChecking:AssertMany(origin, parameterName, values, ...)
+    -- Check if enabled
+    if not self.Enabled then
+        return
+    end
+
     -- Perform type checking on the provided parameters
     self:Assert("Noir.TypeChecking:AssertMany()", "origin", origin, "string")
     self:Assert("Noir.TypeChecking:AssertMany()", "parameterName", parameterName, "string")
@@ -101,6 +140,152 @@ function Noir.TypeChecking:AssertMany(origin, parameterName, values, ...)
     end
 end
 
+--[[
+    Returns the compiled checker for up to three types, compiling it the first time these types are used together.<br>
+    Used internally.
+]]
+---@param typeA NoirTypeCheckingType|nil
+---@param typeB NoirTypeCheckingType|nil
+---@param typeC NoirTypeCheckingType|nil
+---@return fun(value: any): boolean
+function Noir.TypeChecking:_GetChecker(typeA, typeB, typeC)
+    local keyA, keyB, keyC = typeA or self._NoType, typeB or self._NoType, typeC or self._NoType
+
+    local checkersA = self._Checkers[keyA]
+
+    if not checkersA then
+        checkersA = setmetatable({}, {__mode = "k"})
+        self._Checkers[keyA] = checkersA
+    end
+
+    local checkersB = checkersA[keyB]
+
+    if not checkersB then
+        checkersB = setmetatable({}, {__mode = "k"})
+        checkersA[keyB] = checkersB
+    end
+
+    local checker = checkersB[keyC]
+
+    if not checker then
+        checker = self:_CompileChecker(typeA, typeB, typeC)
+        checkersB[keyC] = checker
+    end
+
+    return checker
+end
+
+--[[
+    Returns the compiled checker for any amount of types, compiling it the first time these types are used together.<br>
+    Slower than `:_GetChecker()`, so only used for more than three types.<br>
+    Used internally.
+]]
+---@param ... NoirTypeCheckingType|nil
+---@return fun(value: any): boolean
+function Noir.TypeChecking:_GetVariadicChecker(...)
+    local count = select("#", ...)
+    local checkers = self._VariadicCheckers[count]
+
+    if not checkers then
+        checkers = setmetatable({}, {__mode = "k"})
+        self._VariadicCheckers[count] = checkers
+    end
+
+    for index = 1, count - 1 do
+        local key = select(index, ...) or self._NoType
+        local nextCheckers = checkers[key]
+
+        if not nextCheckers then
+            nextCheckers = setmetatable({}, {__mode = "k"})
+            checkers[key] = nextCheckers
+        end
+
+        checkers = nextCheckers
+    end
+
+    local key = select(count, ...) or self._NoType
+    local checker = checkers[key]
+
+    if not checker then
+        checker = self:_CompileChecker(...)
+        checkers[key] = checker
+    end
+
+    return checker
+end
+
+--[[
+    Returns the provided types as a list, skipping missing (nil) types.<br>
+    Used internally.
+]]
+---@param ... NoirTypeCheckingType|nil
+---@return table<integer, NoirTypeCheckingType>
+function Noir.TypeChecking:_CollectTypes(...)
+    local types = {}
+
+    for index = 1, select("#", ...) do
+        local typeToCollect = select(index, ...)
+
+        if typeToCollect ~= nil then
+            table.insert(types, typeToCollect)
+        end
+    end
+
+    return types
+end
+
+--[[
+    Compiles a function that returns whether or not a value is any of the provided types.<br>
+    Used internally.
+]]
+---@param ... NoirTypeCheckingType|nil
+---@return fun(value: any): boolean
+function Noir.TypeChecking:_CompileChecker(...)
+    local primitives = {}
+    local classes = {}
+    local anyClass = false
+
+    for _, typeToCheck in ipairs(self:_CollectTypes(...)) do
+        if typeToCheck == "class" then
+            anyClass = true
+        elseif Noir.IsClass(typeToCheck) then
+            table.insert(classes, typeToCheck)
+        else
+            primitives[typeToCheck] = true
+        end
+    end
+
+    return function(value)
+        -- Value == ExactType
+        local valueType = type(value)
+
+        if primitives[valueType] then
+            return true
+        end
+
+        -- Same as `Noir.IsClass()`, but avoids a call and the second lookup below
+        local className = valueType == "table" and value.ClassName
+
+        if not className then
+            return false
+        end
+
+        -- Value == Any Class
+        if anyClass then
+            return true
+        end
+
+        -- Value == Exact Class
+        for _, class in ipairs(classes) do
+            if class.ClassName == className or class:IsSameType(value) then
+                return true
+            end
+        end
+
+        return false
+    end
+end
+
 --[[
     Format required types for an error message.<br>
     Used internally.
@@ -0,0 +1,202 @@
+--------------------------------------------------------
+-- [Noir] Tests - Worker
+--------------------------------------------------------
+
+--[[
+    ----------------------------
+
+    CREDIT:
+        Author(s): @Cuh4 (GitHub)
+        GitHub Repository: https://github.com/cuhHub/Noir
+
+    License:
+        Copyright (C) 2025 Cuh4
+
+        Licensed under the Apache License, Version 2.0 (the "License");
+        you may not use this file except in compliance with the License.
+        You may obtain a copy of the License at
+
+            http://www.apache.org/licenses/LICENSE-2.0
+
+        Unless required by applicable law or agreed to in writing, software
+        distributed under the License is distributed on an "AS IS" BASIS,
+        WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+        See the License for the specific language governing permissions and
+        limitations under the License.
+
+    ----------------------------
+]]
+
+--[[
+    A long-lived interpreter used by `run_test.py --persistent`.
+    Loads the polyfill and Noir once, then runs many tests, restoring Noir before each one.
+
+    Protocol (one header line, followed by exactly <bytes> bytes of source):
+        -> LOAD <bytes>         Loads the polyfill and Noir. Must be sent first.
+        -> RUN <bytes> <name>   Runs a test.
+        <- OK
+        <- FAIL <message>
+]]
+
+local stdin, stdout, stderr = io.stdin, io.stdout, io.stderr
+local load, pcall, pairs, next, type, tostring, tonumber = load, pcall, pairs, next, type, tostring, tonumber
+local getmetatable, setmetatable, select = getmetatable, setmetatable, select
+
+-- stdout is reserved for the protocol, so anything tests print goes to stderr
+function print(...)
+    local parts = {}
+
+    for index = 1, select("#", ...) do
+        parts[index] = tostring(select(index, ...))
+    end
+
+    stderr:write(table.concat(parts, "\t"), "\n")
+end
+
+-------------------------------
+-- // Snapshots
+-------------------------------
+
+--[[
+    Deep copies a value, preserving shared references and metatables.
+]]
+---@param value any
+---@param copies table<table, table>
+---@return any
+local function deepCopy(value, copies)
+    if type(value) ~= "table" then
+        return value
+    end
+
+    if copies[value] then
+        return copies[value]
+    end
+
+    local copy = {}
+    copies[value] = copy
+
+    for index, innerValue in next, value do
+        copy[deepCopy(index, copies)] = deepCopy(innerValue, copies)
+    end
+
+    local metatable = getmetatable(value)
+
+    if type(metatable) == "table" then
+        setmetatable(copy, deepCopy(metatable, copies))
+    end
+
+    return copy
+end
+
+local globals = nil ---@type table<any, any>
+local snapshot = nil ---@type table<table, table>
+local originals = nil ---@type table<table, table>
+
+--[[
+    Takes a snapshot of the global environment after Noir is loaded.
+]]
+local function takeSnapshot()
+    globals = {}
+
+    for index, value in pairs(_G) do
+        globals[index] = value
+    end
+
+    snapshot = {}
+    originals = {}
+
+    deepCopy({Noir = Noir, g_savedata = g_savedata}, snapshot)
+
+    for original, copy in next, snapshot do
+        originals[copy] = original
+    end
+end
+
+--[[
+    Restores the global environment to the snapshot, giving the next test a fresh Noir.<br>
+    Tables are restored in place rather than replaced, as Noir's closures (eg: wrapped service methods) still reference the originals.
+]]
+local function restoreSnapshot()
+    for index in pairs(_G) do
+        if globals[index] == nil then
+            _G[index] = nil
+        end
+    end
+
+    for index, value in pairs(globals) do
+        _G[index] = value
+    end
+
+    for original, copy in next, snapshot do
+        for index in next, original do
+            original[index] = nil
+        end
+
+        for index, value in next, copy do
+            original[originals[index] or index] = originals[value] or value
+        end
+
+        local metatable = getmetatable(copy)
+        setmetatable(original, metatable and originals[metatable])
+    end
+end
+
+-------------------------------
+-- // Protocol
+-------------------------------
+
+--[[
+    Sends a response.
+]]
+---@param response string
+local function respond(response)
+    stdout:write((response:gsub("[\r\n]+", " ")), "\n")
+    stdout:flush()
+end
+
+--[[
+    Runs a chunk of source code, returning whether or not it succeeded and the error message if not.
+]]
+---@param source string
+---@param name string
+---@param env table|nil
+---@return boolean, string|nil
+local function run(source, name, env)
+    local chunk, loadError = load(source, "="..name, "t", env or _G)
+
+    if not chunk then
+        return false, loadError
+    end
+
+    local successful, runError = pcall(chunk)
+    return successful, successful and nil or tostring(runError)
+end
+
+while true do
+    local header = stdin:read("l")
+
+    if not header then
+        break
+    end
+
+    local command, size, name = header:match("^(%u+) (%d+) ?(.*)$")
+    local source = size and stdin:read(tonumber(size)) or ""
+
+    if command == "LOAD" then
+        local successful, message = run(source, "noir")
+
+        if successful then
+            takeSnapshot()
+            respond("OK")
+        else
+            respond("FAIL "..message)
+        end
+    elseif command == "RUN" and snapshot then
+        restoreSnapshot()
+
+        local successful, message = run(source, name, setmetatable({}, {__index = _G}))
+        respond(successful and "OK" or "FAIL "..message)
+    else
+        respond("FAIL Invalid command: "..header)
+    end
+end
@@ -0,0 +1,181 @@
+# // ---------------------------------------------------------------------
+# // ------- [Noir] Combine Tool Tests
+# // ---------------------------------------------------------------------
+
+"""
+Tests for the Lua lexer and minifier of the combine tool. Run from the repo root with `py -m unittest discover -s tests/python`.
+Tests that execute Lua need `lupa`, and are skipped without it.
+Repo: https://github.com/cuhHub/Noir
+
+---
+
+Copyright (C) 2025 Cuh4
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---- // Imports
+import unittest
+
+from tools.combine import LuaLexer, LuaMinifier
+
+try:
+    from lupa import lua53
+except ImportError:
+    lua53 = None
+
+import run_test
+
+# ---- // Functions
+def get_kinds(source: str) -> list[tuple[str, str]]:
+    """
+    Tokenizes source code, keeping significant tokens and comments.
+
+    Args:
+        source (str): The source code.
+
+    Returns:
+        list[tuple[str, str]]: The kind and text of each token.
+    """
+
+    return [(token.kind, token.text) for token in LuaLexer.tokenize(source) if token.kind != "whitespace"]
+
+def execute(source: str):
+    """
+    Runs Lua source code in a fresh interpreter.
+
+    Args:
+        source (str): The source code.
+
+    Returns:
+        Any: What the source code returned.
+    """
+
+    return lua53.LuaRuntime().execute(source)
+
+# ---- // Tests
+class LuaLexerTests(unittest.TestCase):
+    """
+    Tests that strings, comments and numbers are tokenized as one token each.
+    """
+
+    def test_round_trip(self):
+        source = "local a = [==[ ]] ]==] -- comment\n--[[ block ]] return a..'b'"
+        self.assertEqual("".join(token.text for token in LuaLexer.tokenize(source)), source)
+
+    def test_long_strings(self):
+        self.assertEqual(get_kinds("x = [==[ a ]] ]=] end ]==]"), [("name", "x"), ("symbol", "="), ("string", "[==[ a ]] ]=] end ]==]")])
+        self.assertEqual(get_kinds("x = [[\nlocal y = 1\n]]")[-1], ("string", "[[\nlocal y = 1\n]]"))
+
+    def test_block_comments(self):
+        self.assertEqual(get_kinds("--[[ local x = 1\n]] y"), [("comment", "--[[ local x = 1\n]]"), ("name", "y")])
+        self.assertEqual(get_kinds("--[==[ ]] local x ]==] y"), [("comment", "--[==[ ]] local x ]==]"), ("name", "y")])
+        self.assertEqual(get_kinds("-- [[ not a block\ny"), [("comment", "-- [[ not a block"), ("name", "y")])
+
+    def test_escaped_quotes(self):
+        self.assertEqual(get_kinds(r'x = "a\"b" .. "c"')[2:], [("string", r'"a\"b"'), ("symbol", ".."), ("string", '"c"')])
+        self.assertEqual(get_kinds(r"x = 'it\'s' .. 'c'")[2:], [("string", r"'it\'s'"), ("symbol", ".."), ("string", "'c'")])
+        self.assertEqual(get_kinds(r'x = "\\" .. "c"')[2:], [("string", r'"\\"'), ("symbol", ".."), ("string", '"c"')])
+
+    def test_numbers(self):
+        for number in ["0x1p4", "0xA.8p-1", "0xff", "1e10", "1.5E-3", ".5", "3."]:
+            with self.subTest(number = number):
+                self.assertEqual(get_kinds(f"x = {number}")[-1], ("number", number))
+
+    def test_keywords(self):
+        self.assertEqual(get_kinds("local ends = end_"), [("keyword", "local"), ("name", "ends"), ("symbol", "="), ("name", "end_")])
+
+    def test_unfinished(self):
+        for source in ['x = "a', "x = [[ a", "--[==[ a ]]", "x = 'a\nb'"]:
+            with self.subTest(source = source):
+                with self.assertRaises(ValueError):
+                    LuaLexer.tokenize(source)
+
+class LuaMinifierTests(unittest.TestCase):
+    """
+    Tests that minified code behaves the same as the original.
+    """
+
+    def assertSameResult(self, source: str):
+        """
+        Asserts that minified source code returns the same as the original.
+
+        Args:
+            source (str): The source code.
+        """
+
+        if lua53 is None:
+            self.skipTest("lupa is not installed")
+
+        self.assertEqual(execute(LuaMinifier().minify(source)), execute(source))
+
+    def test_removes_comments(self):
+        self.assertEqual(LuaMinifier(rename_locals = False).minify("-- a\nx = 1 --[[ b ]] y = 2 --[[\n]] z = 3"), "x=1 y=2\nz=3")
+
+    def test_keeps_strings(self):
+        minified = LuaMinifier().minify("local a = [==[ -- not a comment ]] ]==] local b = \"a\\\" -- c\" return a, b")
+
+        self.assertIn("[==[ -- not a comment ]] ]==]", minified)
+        self.assertIn("\"a\\\" -- c\"", minified)
+
+    def test_keeps_license_once(self):
+        minified = LuaMinifier().minify("--[[ Copyright (C) 2025 ]]\nx = 1\n--[[ Copyright (C) 2025 ]]\ny = 2")
+        self.assertEqual(minified.count("Copyright"), 1)
+
+    def test_separates_tokens(self):
+        self.assertSameResult("local a = 2 return a - -a, 1 .. 2, 0x1p4 .. '', a..'b', [[x]]..[==[y]==]")
+
+    def test_does_not_rename_to_globals(self):
+        source = "a = 10 b = 20 local first, second = 1, 2 return a + b + first + second"
+        minified = LuaMinifier().minify(source)
+
+        self.assertIn("a=10", minified)
+        self.assertIn("b=20", minified)
+        self.assertNotIn("local a", minified)
+        self.assertNotIn(",b=", minified)
+        self.assertSameResult(source)
+
+    def test_does_not_rename_to_keywords(self):
+        # Enough locals visible at once to use two character names, which include "do", "if", "in" and "or"
+        outer = [f"outer{index}" for index in range(150)]
+        inner = [f"inner{index}" for index in range(150)]
+
+        source = (
+            f"local function create() local {", ".join(outer)} = {", ".join(str(index) for index in range(150))} "
+            f"return function() local {", ".join(inner)} = {", ".join(str(index) for index in range(150))} "
+            f"return {" + ".join(outer + inner)} end end "
+            "return create()()"
+        )
+
+        tokens = LuaMinifier().minify_tokens(LuaLexer.tokenize(source))
+        names = {token.text for token in tokens if token.kind == "name"}
+
+        self.assertIn("dp", names) # the name after "do", so "do" was skipped rather than never reached
+        self.assertEqual(names & LuaLexer.KEYWORDS, set())
+        self.assertSameResult(source)
+
+@unittest.skipIf(lua53 is None, "lupa is not installed")
+class MinifiedNoirTests(unittest.TestCase):
+    """
+    Tests that Noir passes its own tests once minified. See `py run_test.py --minify`.
+    """
+
+    def test_noir(self):
+        prelude = run_test.build_prelude(minify = True)
+
+        for path in run_test.get_test_paths():
+            with self.subTest(test = path.name):
+                execute(prelude + "\n\n" + path.read_text())
+
+if __name__ == "__main__":
+    unittest.main()
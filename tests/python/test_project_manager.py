@@ -0,0 +1,416 @@
+# // ---------------------------------------------------------------------
+# // ------- [Noir] Project Manager Tool Tests
+# // ---------------------------------------------------------------------
+
+"""
+Tests for the downloading and local source of the project manager tool, against a local HTTP server and local fixtures. Run from the repo root with `py -m unittest discover -s tests/python`.
+Repo: https://github.com/cuhHub/Noir
+
+---
+
+Copyright (C) 2025 Cuh4
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---- // Imports
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import requests
+
+from click.testing import CliRunner
+
+from tools.project_manager import CachedDownloader, LocalSource, Project
+from tools.project_manager.main import Path, bulk
+
+# ---- // Variables
+COMBINER_PATH = Path("tools/combine/main.py")
+
+# ---- // Functions
+def create_source(directory: Path, version: str = "1.2.3") -> Path:
+    """
+    Creates a copy of Noir's repo with a small stand-in for Noir's source.
+
+    Args:
+        directory (Path): Where to create the repo.
+        version (str, optional): The version in the `VERSION` file. Defaults to "1.2.3".
+
+    Returns:
+        Path: The root of the repo.
+    """
+
+    NoirPath = directory / "src" / "Noir"
+    NoirPath.mkdir(parents = True)
+
+    (NoirPath / "__order.json").write_text(json.dumps({"order" : ["Definition.lua", "Noir.lua"]}))
+    (NoirPath / "Definition.lua").write_text("Noir = {}")
+    (NoirPath / "Noir.lua").write_text("Noir.Version = \"{VERSION_MAJOR}.{VERSION_MINOR}.{VERSION_PATCH}\"")
+    (directory / "VERSION").write_text(version)
+
+    (directory / "tools" / "combine").mkdir(parents = True)
+    shutil.copyfile(COMBINER_PATH, directory / "tools" / "combine" / "main.py")
+
+    return directory
+
+# ---- // Classes
+class FileServer(ThreadingHTTPServer):
+    """
+    A local stand-in for GitHub, serving files with ETags and answering conditional requests.
+    """
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FileRequestHandler)
+
+        self.files: dict[str, bytes] = {}
+        self.status: int|None = None # forces a status for every request if set
+        self.requests: list[dict[str, str]] = []
+
+        self.thread = threading.Thread(target = self.serve_forever, kwargs = {"poll_interval" : 0.05}, daemon = True)
+        self.thread.start()
+
+    def get_url(self, path: str) -> str:
+        """
+        Returns the URL of a file.
+
+        Args:
+            path (str): The path of the file, eg: "/Noir.lua".
+
+        Returns:
+            str: The URL.
+        """
+
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+    def stop(self):
+        """
+        Stops the server, so requests to it fail as if offline.
+        """
+
+        self.shutdown()
+        self.server_close()
+
+class FileRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles requests to a `FileServer`.
+    """
+
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+        body = self.server.files.get(self.path)
+
+        if self.server.status is not None or body is None:
+            self.send_response(self.server.status or 404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        etag = f"\"{hashlib.sha256(body).hexdigest()[:16]}\""
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args):
+        pass
+
+# ---- // Tests
+class ProjectManagerTestCase(unittest.TestCase):
+    """
+    Runs each test in a temporary directory, with the user cache directory inside it.
+    """
+
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp()).resolve()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors = True)
+
+        environment = mock.patch.dict(os.environ, {"XDG_CACHE_HOME" : str(self.directory / "cache"), "LOCALAPPDATA" : str(self.directory / "cache")})
+        environment.start()
+        self.addCleanup(environment.stop)
+
+        self.SWAddonsPath = self.directory / "missions"
+        self.SWAddonsPath.mkdir()
+
+    def create_downloader(self, **kwargs) -> CachedDownloader:
+        """
+        Creates a downloader that ignores proxies from the environment, as the server is local.
+
+        Returns:
+            CachedDownloader: The downloader.
+        """
+
+        session = requests.Session()
+        session.trust_env = False
+        self.addCleanup(session.close)
+
+        return CachedDownloader(cacheDirectory = self.directory / "cache" / "noir", session = session, **kwargs)
+
+class CachedDownloaderTests(ProjectManagerTestCase):
+    """
+    Tests that the cached downloader revalidates, falls back to and addresses cached files correctly.
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.server = FileServer()
+        self.addCleanup(self.server.stop)
+
+        self.server.files["/Noir.lua"] = b"Noir = {}"
+        self.url = self.server.get_url("/Noir.lua")
+
+    def test_conditional_get(self):
+        first = self.create_downloader().fetch(self.url)
+        second = self.create_downloader().fetch(self.url)
+
+        self.assertEqual(first, second)
+        self.assertNotIn("If-None-Match", self.server.requests[0])
+        self.assertEqual(self.server.requests[1]["If-None-Match"], f"\"{hashlib.sha256(b"Noir = {}").hexdigest()[:16]}\"")
+
+    def test_downloads_changed_files(self):
+        first = self.create_downloader().fetch(self.url)
+        self.server.files["/Noir.lua"] = b"Noir = {Version = 2}"
+        second = self.create_downloader().fetch(self.url)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(second.read_bytes(), b"Noir = {Version = 2}")
+
+    def test_checks_once_per_downloader(self):
+        downloader = self.create_downloader()
+
+        downloader.download(self.url, self.directory / "a.lua")
+        downloader.download(self.url, self.directory / "b.lua")
+
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual((self.directory / "b.lua").read_bytes(), b"Noir = {}")
+
+    def test_content_addressed(self):
+        self.server.files["/copy.lua"] = b"Noir = {}"
+
+        objectPath = self.create_downloader().fetch(self.url)
+        copyPath = self.create_downloader().fetch(self.server.get_url("/copy.lua"))
+
+        self.assertEqual(objectPath.name, hashlib.sha256(b"Noir = {}").hexdigest())
+        self.assertEqual(objectPath, copyPath)
+        self.assertEqual(len(list((self.directory / "cache" / "noir" / "objects").iterdir())), 1)
+
+    def test_offline_fallback(self):
+        self.create_downloader().fetch(self.url)
+        self.server.stop()
+
+        path = self.directory / "Noir.lua"
+        self.create_downloader().download(self.url, path)
+
+        self.assertEqual(path.read_bytes(), b"Noir = {}")
+
+    def test_server_error_fallback(self):
+        self.create_downloader().fetch(self.url)
+        self.server.status = 503
+
+        self.assertEqual(self.create_downloader().fetch(self.url).read_bytes(), b"Noir = {}")
+
+    def test_offline_without_cache(self):
+        self.server.stop()
+
+        with self.assertRaises(Exception):
+            self.create_downloader().fetch(self.url)
+
+        self.assertFalse((self.directory / "Noir.lua").exists())
+
+    def test_missing_file(self):
+        with self.assertRaises(Exception):
+            self.create_downloader().download(self.server.get_url("/missing.lua"), self.directory / "missing.lua")
+
+        self.assertFalse((self.directory / "missing.lua").exists())
+
+    def test_redownloads_modified_objects(self):
+        objectPath = self.create_downloader().fetch(self.url)
+        objectPath.write_bytes(b"edited in place")
+
+        self.assertEqual(self.create_downloader().fetch(self.url).read_bytes(), b"Noir = {}")
+        self.assertNotIn("If-None-Match", self.server.requests[1])
+
+    def test_copies_by_default(self):
+        path = self.directory / "Noir.lua"
+        objectPath = self.create_downloader().fetch(self.url)
+
+        self.create_downloader().download(self.url, path)
+        path.write_bytes(b"edited in place")
+
+        self.assertEqual(objectPath.read_bytes(), b"Noir = {}")
+
+class LocalSourceTests(ProjectManagerTestCase):
+    """
+    Tests that projects can be created from a local copy of Noir without any network.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.root = create_source(self.directory / "Noir")
+
+    def create_project(self, source: LocalSource) -> Project:
+        """
+        Creates a project from a local source.
+
+        Args:
+            source (LocalSource): The local source.
+
+        Returns:
+            Project: The created project.
+        """
+
+        project = Project("Test Addon", self.directory / "TestAddon", self.SWAddonsPath, source = source)
+        project.create()
+
+        return project
+
+    def test_build_from_source(self):
+        for path in [self.root / "src", self.root / "src" / "Noir"]:
+            with self.subTest(path = path):
+                source = LocalSource(path)
+
+                self.assertEqual(source.NoirSourcePath, self.root / "src" / "Noir")
+                self.assertEqual(source.getNoir(), "Noir = {}\n\nNoir.Version = \"1.2.3\"")
+
+    def test_builds_once(self):
+        source = LocalSource(self.root / "src")
+
+        with mock.patch.object(LocalSource, "_build", wraps = source._build) as build:
+            source.getNoir()
+            source.getNoir()
+
+        self.assertEqual(build.call_count, 1)
+
+    def test_built_noir(self):
+        buildPath = self.directory / "_build"
+        buildPath.mkdir()
+        (buildPath / "Noir.lua").write_text("Noir = {Version = \"1.0.0\"}")
+
+        source = LocalSource(buildPath)
+
+        self.assertEqual(source.builtNoirPath, buildPath / "Noir.lua")
+        self.assertEqual(source.getNoir(), "Noir = {Version = \"1.0.0\"}")
+
+    def test_create_project(self):
+        project = self.create_project(LocalSource(self.root / "src"))
+
+        self.assertEqual(project.NoirPath.read_text(), "Noir = {}\n\nNoir.Version = \"1.2.3\"")
+        self.assertEqual(project.combinePath.name, "combine.py")
+        self.assertEqual(project.combinePath.read_bytes(), COMBINER_PATH.read_bytes())
+        self.assertTrue(project.buildPath.read_text().startswith("py combine.py"))
+        self.assertFalse((project.addonPath / "combine.exe").exists())
+
+    def test_copies_intellisense(self):
+        (self.root / "src" / "intellisense.lua").write_text("---@meta")
+        project = self.create_project(LocalSource(self.root / "src"))
+
+        self.assertEqual(project.intellisensePath.read_text(), "---@meta")
+
+    def test_missing_noir(self):
+        (self.directory / "empty").mkdir()
+
+        with self.assertRaises(Exception):
+            LocalSource(self.directory / "empty")
+
+class BulkTests(ProjectManagerTestCase):
+    """
+    Tests creating and updating many projects, and switching projects between downloaded and local copies of Noir.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.root = create_source(self.directory / "Noir")
+
+    def run_bulk(self, projects: list[dict], *arguments: str) -> int:
+        """
+        Runs the bulk command with a manifest.
+
+        Args:
+            projects (list[dict]): The projects in the manifest.
+            *arguments (str): Extra command line arguments.
+
+        Returns:
+            int: The exit code.
+        """
+
+        manifestPath = self.directory / "manifest.json"
+        manifestPath.write_text(json.dumps({"SWAddonsPath" : "missions", "source" : "Noir/src", "projects" : projects}))
+
+        return CliRunner().invoke(bulk, [str(manifestPath), *arguments]).exit_code
+
+    def test_one_broken_project(self):
+        (self.directory / "Broken").write_text("not a directory")
+
+        exitCode = self.run_bulk([
+            {"name" : "Good", "path" : "Good"},
+            {"name" : "Broken", "path" : "Broken"}
+        ])
+
+        self.assertEqual(exitCode, 1)
+        self.assertEqual((self.directory / "Good" / "Noir.lua").read_text(), "Noir = {}\n\nNoir.Version = \"1.2.3\"")
+        self.assertTrue((self.SWAddonsPath / "Good" / "playlist.xml").exists())
+
+    def test_all_projects(self):
+        self.assertEqual(self.run_bulk([{"name" : "A", "path" : "A"}, {"name" : "B", "path" : "B"}]), 0)
+        self.assertEqual(self.run_bulk([{"name" : "A", "path" : "A"}], "--action", "update"), 0)
+        self.assertEqual(self.run_bulk([{"name" : "C", "path" : "C"}], "--action", "update"), 1) # doesn't exist yet
+
+    def test_update_switches_combiner(self):
+        server = FileServer()
+        self.addCleanup(server.stop)
+
+        server.files = {"/Noir.lua" : b"Noir = {}", "/combine.exe" : b"MZ", "/intellisense.lua" : b"---@meta"}
+
+        urls = mock.patch.multiple(
+            Project,
+            NoirDownloadURL = server.get_url("/Noir.lua"),
+            CombineDownloadURL = server.get_url("/combine.exe"),
+            IntellisenseDownloadURL = server.get_url("/intellisense.lua")
+        )
+
+        urls.start()
+        self.addCleanup(urls.stop)
+
+        addonPath = self.directory / "Addon"
+        downloaded = Project("Addon", addonPath, self.SWAddonsPath, downloader = self.create_downloader())
+        local = Project("Addon", addonPath, self.SWAddonsPath, source = LocalSource(self.root / "src"))
+
+        downloaded.create()
+        self.assertTrue((addonPath / "build.bat").read_text().startswith("combine.exe"))
+
+        local.update()
+        self.assertTrue((addonPath / "build.bat").read_text().startswith("py combine.py"))
+        self.assertTrue((addonPath / "combine.py").exists())
+        self.assertFalse((addonPath / "combine.exe").exists())
+
+        downloaded.update()
+        self.assertTrue((addonPath / "build.bat").read_text().startswith("combine.exe"))
+        self.assertEqual((addonPath / "combine.exe").read_bytes(), b"MZ")
+        self.assertFalse((addonPath / "combine.py").exists())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# // ---------------------------------------------------------------------
+# // ------- [Noir] Benchmark Tool Tests
+# // ---------------------------------------------------------------------
+
+"""
+Tests for the regression gate of `run_benchmarks.py`. Run from the repo root with `py -m unittest discover -s tests/python`.
+Repo: https://github.com/cuhHub/Noir
+
+---
+
+Copyright (C) 2025 Cuh4
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# ---- // Imports
+import tempfile
+import unittest
+from dataclasses import asdict
+from pathlib import Path
+from unittest import mock
+
+from click.testing import CliRunner
+
+import run_benchmarks
+from run_benchmarks import BenchmarkResult, NoirBenchmarkSuite, find_missing_results
+
+# ---- // Functions
+def create_result(suite: str, name: str, median_ns: float = 100.0) -> BenchmarkResult:
+    """
+    Creates a benchmark result.
+
+    Args:
+        suite (str): The suite of the benchmark.
+        name (str): The name of the benchmark.
+        median_ns (float, optional): The median time per operation. Defaults to 100.0.
+
+    Returns:
+        BenchmarkResult: The result.
+    """
+
+    return BenchmarkResult(name = name, suite = suite, iterations = 1, samples = 1, median_ns = median_ns, p95_ns = median_ns, allocated_kb = 0.0)
+
+# ---- // Tests
+class RegressionGateTests(unittest.TestCase):
+    """
+    Tests that the regression gate fails for failed suites and missing results, not only for slower benchmarks.
+    """
+
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.output = self.directory / "results.json"
+        self.suites = {"good" : [create_result("good", "A")], "broken" : []}
+        self.baseline = {
+            "good/A" : asdict(create_result("good", "A")),
+            "broken/B" : asdict(create_result("broken", "B"))
+        }
+
+    def invoke(self, *arguments: str, failing: tuple[str, ...] = ()) -> int:
+        """
+        Runs the benchmark tool against fake suites, without running Lua.
+
+        Args:
+            *arguments (str): The command line arguments.
+            failing (tuple[str, ...], optional): The suites that fail to run. Defaults to ().
+
+        Returns:
+            int: The exit code.
+        """
+
+        def run(suite: NoirBenchmarkSuite, samples: int, warmup: int) -> list[BenchmarkResult]:
+            if suite.name in failing:
+                raise RuntimeError("lua: error")
+
+            return self.suites[suite.name]
+
+        with (
+            mock.patch.object(run_benchmarks, "build_prelude", return_value = ""),
+            mock.patch.object(run_benchmarks, "get_benchmark_paths", return_value = [Path(f"{name}.lua") for name in self.suites]),
+            mock.patch.object(run_benchmarks, "load_baselines", return_value = {"1.0.0" : self.baseline}),
+            mock.patch.object(NoirBenchmarkSuite, "run", run)
+        ):
+            return CliRunner().invoke(run_benchmarks.run, ["--output", str(self.output), "--baseline", "1.0.0", *arguments]).exit_code
+
+    def test_passes_without_regressions(self):
+        self.suites["broken"] = [create_result("broken", "B")]
+        self.assertEqual(self.invoke(), 0)
+
+    def test_fails_on_regression(self):
+        self.suites["broken"] = [create_result("broken", "B", median_ns = 200.0)]
+        self.assertEqual(self.invoke(), 1)
+
+    def test_fails_when_suite_fails(self):
+        self.assertEqual(self.invoke(failing = ("broken",)), 1)
+
+    def test_fails_when_suite_fails_without_baseline(self):
+        self.baseline.clear()
+        self.assertEqual(self.invoke("--baseline", "2.0.0", failing = ("broken",)), 1)
+
+    def test_fails_on_missing_result(self):
+        self.assertEqual(self.invoke(), 1) # "broken" runs, but has no result for "B"
+
+    def test_ignores_filtered_suites(self):
+        self.assertEqual(self.invoke("--filter", "good"), 0)
+
+    def test_find_missing_results(self):
+        results = [create_result("good", "A")]
+
+        self.assertEqual(find_missing_results(results, self.baseline, ["good", "broken"]), ["broken/B"])
+        self.assertEqual(find_missing_results(results, self.baseline, ["good"]), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+--------------------------------------------------------
+-- [Noir] Tests - Task Service
+--------------------------------------------------------
+
+--[[
+    ----------------------------
+
+    CREDIT:
+        Author(s): @Cuh4 (GitHub)
+        GitHub Repository: https://github.com/cuhHub/Noir
+
+    License:
+        Copyright (C) 2025 Cuh4
+
+        Licensed under the Apache License, Version 2.0 (the "License");
+        you may not use this file except in compliance with the License.
+        You may obtain a copy of the License at
+
+            http://www.apache.org/licenses/LICENSE-2.0
+
+        Unless required by applicable law or agreed to in writing, software
+        distributed under the License is distributed on an "AS IS" BASIS,
+        WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+        See the License for the specific language governing permissions and
+        limitations under the License.
+
+    ----------------------------
+]]
+
+local TaskService = Noir.Services.TaskService
+TaskService:_Initialize()
+
+local function tick()
+    TaskService.Ticks = TaskService.Ticks + 1
+    TaskService:_HandleTasks()
+end
+
+-- Tasks run in order of when they stop, not when they were added
+local order = {}
+
+for _, duration in ipairs({5, 1, 3, 1}) do
+    TaskService:AddTickTask(function()
+        table.insert(order, duration)
+    end, duration)
+end
+
+for _ = 1, 5 do
+    tick()
+end
+
+assert(table.concat(order, ",") == "1,1,3,5", "Tasks ran in the wrong order. Got: "..table.concat(order, ","))
+assert(next(TaskService:GetTasks()) == nil, "Completed tasks were not removed")
+
+-- Repeating tasks
+local count = 0
+
+local repeating = TaskService:AddTickTask(function()
+    count = count + 1
+end, 2, nil, true)
+
+for _ = 1, 6 do
+    tick()
+end
+
+assert(count == 3, "Repeating task ran "..count.." times instead of 3")
+
+-- Changing duration
+repeating:SetDuration(1)
+tick()
+assert(count == 4, "Repeating task did not use its new duration")
+
+-- Removing
+TaskService:RemoveTask(repeating)
+tick()
+tick()
+assert(count == 4, "Removed task still ran")
+
+-- Duration of 0 only runs once per tick
+local zeroCount = 0
+
+local zero = TaskService:AddTickTask(function()
+    zeroCount = zeroCount + 1
+end, 0, nil, true)
+
+tick()
+assert(zeroCount == 1, "Task with a duration of 0 ran "..zeroCount.." times in one tick")
+zero:Remove()
+
+-- Tasks removed by another task that is due on the same tick do not run
+local ran = false
+local victim
+
+TaskService:AddTickTask(function()
+    TaskService:RemoveTask(victim)
+end, 1)
+
+victim = TaskService:AddTickTask(function()
+    ran = true
+end, 1)
+
+tick()
+assert(not ran, "Task ran after being removed")
+
+-- Arguments
+local received
+
+TaskService:AddTickTask(function(value)
+    received = value
+end, 1, {"foo"})
+
+tick()
+assert(received == "foo", "Task did not receive its arguments")
+
+-- Many tasks
+local completed = 0
+
+for index = 1, 1000 do
+    TaskService:AddTickTask(function()
+        completed = completed + 1
+    end, index % 50 + 1)
+end
+
+for _ = 1, 50 do
+    tick()
+end
+
+assert(completed == 1000, "Only "..completed.." of 1000 tasks completed")
+assert(#TaskService._TaskQueues.Ticks == 0, "Task queue was not emptied")
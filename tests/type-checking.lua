@@ -0,0 +1,77 @@
+--------------------------------------------------------
+-- [Noir] Tests - Type Checking
+--------------------------------------------------------
+
+--[[
+    ----------------------------
+
+    CREDIT:
+        Author(s): @Cuh4 (GitHub)
+        GitHub Repository: https://github.com/cuhHub/Noir
+
+    License:
+        Copyright (C) 2025 Cuh4
+
+        Licensed under the Apache License, Version 2.0 (the "License");
+        you may not use this file except in compliance with the License.
+        You may obtain a copy of the License at
+
+            http://www.apache.org/licenses/LICENSE-2.0
+
+        Unless required by applicable law or agreed to in writing, software
+        distributed under the License is distributed on an "AS IS" BASIS,
+        WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+        See the License for the specific language governing permissions and
+        limitations under the License.
+
+    ----------------------------
+]]
+
+local function passes(value, ...)
+    return (pcall(Noir.TypeChecking.Assert, Noir.TypeChecking, "Test", "value", value, ...))
+end
+
+local object = Noir.Libraries.Events:Create()
+
+-- Primitives
+assert(passes(1, "number"), "Number did not pass as 'number'")
+assert(passes(nil, "string", "nil"), "nil did not pass as 'string' or 'nil'")
+assert(passes(true, "string", "number", "boolean"), "Boolean did not pass as the third type")
+assert(passes("a", "number", "table", "boolean", "string"), "String did not pass as the fourth type")
+assert(not passes(1, "string"), "Number passed as 'string'")
+assert(not passes(nil, "string", "table", "number"), "nil passed without 'nil'")
+assert(not passes(1, "string", "table", "boolean", "function"), "Number passed with four other types")
+
+-- Missing types
+assert(passes(1, "string", nil, "number"), "Number did not pass as the type after a nil")
+assert(passes(1, "string", nil, "table", "boolean", "number"), "Number did not pass as the fifth type after a nil")
+assert(passes(object, "string", nil, "table", nil, Noir.Classes.Event), "Event did not pass as a class after two nils")
+assert(not passes(object, "string", nil, "number", nil, Noir.Classes.Connection), "Event passed as Connection after two nils")
+assert(not passes(true, nil, nil, nil, "string"), "Boolean passed with only 'string'")
+
+assert(Noir.TypeChecking:_FormatTypes(Noir.TypeChecking:_CollectTypes("string", nil, "table", nil, "number")) == "'string', 'table' or 'number'", "Missing types were not skipped when formatting")
+
+-- Classes
+assert(passes(object, Noir.Classes.Event), "Event did not pass as Event")
+assert(passes(object, "class"), "Event did not pass as 'class'")
+assert(passes(object, "table"), "Event did not pass as 'table'")
+assert(passes(object, "nil", Noir.Classes.Event), "Event did not pass as the second type")
+assert(not passes(object, Noir.Classes.Connection), "Event passed as Connection")
+assert(not passes({}, "class"), "Table passed as 'class'")
+assert(not passes({}, Noir.Classes.Event), "Table passed as Event")
+
+-- Compiled checkers are reused
+Noir.TypeChecking:_GetChecker(Noir.Classes.Event, "nil")
+assert(Noir.TypeChecking:_GetChecker(Noir.Classes.Event, "nil") == Noir.TypeChecking:_GetChecker(Noir.Classes.Event, "nil"), "Checker was compiled twice")
+assert(Noir.TypeChecking:_GetVariadicChecker("string", nil, "table", Noir.Classes.Event) == Noir.TypeChecking:_GetVariadicChecker("string", nil, "table", Noir.Classes.Event), "Checker for four types was compiled twice")
+assert(Noir.TypeChecking:_GetVariadicChecker("string", nil, "table", "number") ~= Noir.TypeChecking:_GetVariadicChecker("string", "table", "number", nil), "Checkers for different types were shared")
+
+-- AssertMany
+assert(pcall(Noir.TypeChecking.AssertMany, Noir.TypeChecking, "Test", "values", {1, 2, 3}, "number"), "AssertMany failed on numbers")
+assert(not pcall(Noir.TypeChecking.AssertMany, Noir.TypeChecking, "Test", "values", {1, "2", 3}, "number"), "AssertMany passed a string")
+
+-- Disabling
+Noir.TypeChecking.Enabled = false
+assert(passes(1, "string"), "Type checking still ran when disabled")
+assert(pcall(Noir.TypeChecking.AssertMany, Noir.TypeChecking, "Test", "values", {"1"}, "number"), "AssertMany still ran when disabled")
+Noir.TypeChecking.Enabled = true
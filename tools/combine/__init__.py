@@ -24,4 +24,4 @@ limitations under the License.
 """
 
 # ---- // Imports
-from .main import Combiner
\ No newline at end of file
+from .main import Combiner, CombinerCache, CombinerPathMatcher, CombinerSizeReport, CombinerSourceMap, LuaLexer, LuaToken, LuaTransformer, LuaScopeResolver, LuaLocal, LuaMinifier, NoirTreeShaker
\ No newline at end of file
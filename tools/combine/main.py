@@ -24,114 +24,2110 @@ limitations under the License.
 """
 
 # ---- // Imports
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+import bisect
 import click
+import ctypes
+import hashlib
+import itertools
 import json
+import os
+import re
+import select
+import struct
+import sys
+import time
 import rich
 from rich import print
 from rich.panel import Panel
+from rich.table import Table
 
 # ---- // Classes
+class CombinerCache():
+    """
+    A persistent build cache used by the `Combiner` to skip re-reading unchanged files and re-writing an unchanged destination.
+    Files are considered unchanged if their modification time and size match the manifest, in which case they are neither read nor hashed. If only the modification time changed, the hash decides.
+    The manifest only holds modification times, sizes and hashes. File contents are kept separately, keyed by hash, so the two can never disagree.
+    """
+    
+    VERSION = 3
+
+    def __init__(self, path: Path):
+        """
+        Initialize the class.
+
+        Args:
+            path (Path): The directory to store the cache in.
+        """
+        
+        self.path = path
+        self.manifest_path = path / "manifest.json"
+        self.contents_path = path / "contents.json"
+        self.files: dict[str, dict] = {}
+        self.output: dict|None = None
+        
+        self._contents: dict[str, str] = {} # by hash
+        self._visited: set[str] = set()
+        self._dirty = False
+        self._contents_dirty = False
+        
+        self.load()
+        
+    @staticmethod
+    def hash(content: str) -> str:
+        """
+        Hash the provided content.
+
+        Args:
+            content (str): The content to hash.
+
+        Returns:
+            str: The SHA-256 hex digest of the content.
+        """
+        
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        
+    def load(self):
+        """
+        Load the cache from disk. An invalid or outdated cache is discarded.
+        """
+        
+        try:
+            manifest = json.loads(self.manifest_path.read_text("utf-8"))
+        except (OSError, ValueError):
+            return
+        
+        if not isinstance(manifest, dict) or manifest.get("version") != self.VERSION:
+            return
+        
+        self.files = manifest.get("files", {})
+        self.output = manifest.get("output")
+        
+        try:
+            self._contents = json.loads(self.contents_path.read_text("utf-8"))
+        except (OSError, ValueError):
+            self._contents = {} # files are read again
+        
+    def save(self, prune: bool = True):
+        """
+        Save the cache to disk if anything changed.
+        
+        Args:
+            prune (bool, optional): Whether or not to drop entries for files that were not read since the last prune. Defaults to True.
+        """
+        
+        stale = self.files.keys() - self._visited if prune else set()
+        
+        if prune:
+            self._visited.clear()
+        
+        if not self._dirty and not self._contents_dirty and len(stale) == 0:
+            return
+        
+        for key in stale:
+            del self.files[key]
+            
+        self.path.mkdir(parents = True, exist_ok = True)
+        
+        if self._contents_dirty or len(stale) > 0:
+            hashes = {entry["hash"] for entry in self.files.values()}
+            self._contents = {content_hash: content for content_hash, content in self._contents.items() if content_hash in hashes}
+            self._write(self.contents_path, self._contents)
+        
+        # Written last, so it never refers to contents that weren't saved
+        self._write(self.manifest_path, {
+            "version" : self.VERSION,
+            "files" : self.files,
+            "output" : self.output
+        })
+        
+        self._dirty = False
+        self._contents_dirty = False
+        
+    def _write(self, path: Path, data: dict):
+        """
+        Write JSON to a file, replacing it once written so a partly written file is never loaded.
+
+        Args:
+            path (Path): The file to write.
+            data (dict): The data to write.
+        """
+        
+        temporary_path = path.with_name(f".{path.name}.tmp")
+        temporary_path.write_text(json.dumps(data, separators = (",", ":")), encoding = "utf-8")
+        os.replace(temporary_path, path)
+        
+    def read(self, path: Path) -> str:
+        """
+        Read a file, reusing the cached contents if the file has not changed.
+
+        Args:
+            path (Path): The path of the file to read.
+
+        Returns:
+            str: The contents of the file.
+        """
+        
+        key = str(path.absolute())
+        stat = path.stat()
+        entry = self.files.get(key)
+        self._visited.add(key)
+        
+        if entry is not None and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size and entry["hash"] in self._contents:
+            return self._contents[entry["hash"]]
+        
+        content = path.read_text("utf-8")
+        content_hash = self.hash(content)
+        
+        if content_hash not in self._contents:
+            self._contents[content_hash] = content
+            self._contents_dirty = True
+        
+        self.files[key] = {
+            "mtime" : stat.st_mtime_ns,
+            "size" : stat.st_size,
+            "hash" : content_hash
+        }
+        
+        self._dirty = True
+        return content
+    
+    def is_output_current(self, destination: Path, output_hash: str) -> bool:
+        """
+        Check if the destination already contains the combined output.
+
+        Args:
+            destination (Path): The destination file.
+            output_hash (str): The hash of the combined output.
+
+        Returns:
+            bool: Whether or not writing the destination can be skipped.
+        """
+        
+        if self.output is None or self.output["hash"] != output_hash:
+            return False
+        
+        try:
+            stat = destination.stat()
+        except OSError:
+            return False
+        
+        return self.output["mtime"] == stat.st_mtime_ns and self.output["size"] == stat.st_size
+    
+    def set_output(self, destination: Path, output_hash: str):
+        """
+        Record the combined output that was just written to the destination.
+
+        Args:
+            destination (Path): The destination file.
+            output_hash (str): The hash of the combined output.
+        """
+        
+        stat = destination.stat()
+        
+        self.output = {
+            "hash" : output_hash,
+            "mtime" : stat.st_mtime_ns,
+            "size" : stat.st_size
+        }
+        
+        self._dirty = True
+
+class LuaToken():
+    """
+    A token of Lua source code. Joining the text of all tokens gives back the exact source.
+    """
+    
+    def __init__(self, kind: str, text: str, position: int = 0):
+        """
+        Initialize the class.
+
+        Args:
+            kind (str): The kind of token. One of "whitespace", "comment", "name", "keyword", "number", "string" or "symbol".
+            text (str): The source code of the token.
+            position (int, optional): Where the token starts in the original source. Kept by transforms, so output can be traced back to its source. Defaults to 0.
+        """
+        
+        self.kind = kind
+        self.text = text
+        self.position = position
+        
+    def is_significant(self) -> bool:
+        """
+        Returns whether or not this token affects the code (isn't whitespace or a comment).
+
+        Returns:
+            bool: Whether or not this token is significant.
+        """
+        
+        return self.kind != "whitespace" and self.kind != "comment"
+        
+    def __repr__(self) -> str:
+        return f"LuaToken({self.kind!r}, {self.text!r}, {self.position})"
+
+class LuaLexer():
+    """
+    Splits Lua 5.3 source code into tokens, handling strings, long strings and comments so that code inside them is never mistaken for real code.
+    """
+    
+    KEYWORDS = {
+        "and", "break", "do", "else", "elseif", "end", "false", "for", "function", "goto", "if", "in",
+        "local", "nil", "not", "or", "repeat", "return", "then", "true", "until", "while"
+    }
+    
+    _TOKEN_PATTERN = re.compile(r"""
+        (?P<whitespace>[ \t\r\n\f\v]+)
+        | (?P<long_bracket>(?:--)?\[=*\[)
+        | (?P<comment>--[^\n]*)
+        | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+        | (?P<number>0[xX][0-9a-fA-F]*(?:\.[0-9a-fA-F]*)?(?:[pP][+-]?[0-9]+)?|(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[eE][+-]?[0-9]+)?)
+        | (?P<string>"(?:\\z\s*|\\[\s\S]|[^"\\\n])*"|'(?:\\z\s*|\\[\s\S]|[^'\\\n])*')
+        | (?P<symbol>\.\.\.|\.\.|==|~=|<=|>=|<<|>>|//|::|[-+*/%^\#&~|<>=(){}\[\];:,.])
+    """, re.VERBOSE)
+    
+    @classmethod
+    def tokenize(cls, source: str) -> list[LuaToken]:
+        """
+        Split Lua source code into tokens.
+
+        Args:
+            source (str): The source code.
+
+        Returns:
+            list[LuaToken]: The tokens, in order.
+            
+        Raises:
+            ValueError: If the source contains an unfinished string, long string or comment, or an unexpected character.
+        """
+        
+        tokens: list[LuaToken] = []
+        position = 0
+        length = len(source)
+        
+        while position < length:
+            match = cls._TOKEN_PATTERN.match(source, position)
+            
+            if match is None:
+                raise ValueError(f"Unexpected character {source[position]!r} on line {source.count("\n", 0, position) + 1}.")
+            
+            kind = match.lastgroup
+            end = match.end()
+            
+            if kind == "long_bracket":
+                # Find the matching closing bracket with the same amount of `=`
+                opening = match.group()
+                level = opening.count("=")
+                end = source.find("]" + "=" * level + "]", end)
+                
+                if end == -1:
+                    raise ValueError(f"Unfinished long {"comment" if opening.startswith("--") else "string"} on line {source.count("\n", 0, position) + 1}.")
+                
+                end += level + 2
+                kind = "comment" if opening.startswith("--") else "string"
+            elif kind == "name" and match.group() in cls.KEYWORDS:
+                kind = "keyword"
+            elif kind is None:
+                raise ValueError(f"Unfinished string on line {source.count("\n", 0, position) + 1}.")
+            
+            tokens.append(LuaToken(kind, source[position:end], position))
+            position = end
+            
+        return tokens
+
+class LuaTransformer():
+    """
+    Transforms combined Lua source code for release builds.
+    Removes `Noir.TypeChecking:Assert()`/`:AssertMany()` statements and comments (including `---@` annotations and doc comments), keeping one copy of each license notice.
+    Removed code is replaced with the newlines it contained, so line numbers match the debug build.
+    """
+    
+    # Tokens that can't come right before the start of a statement
+    _EXPRESSION_TOKENS = {
+        "=", ",", "(", "[", "{", ".", ":", "..", "+", "-", "*", "/", "//", "%", "^", "#", "&", "~", "|", "<<", ">>",
+        "==", "~=", "<", ">", "<=", ">=", "and", "or", "not", "return", "local", "function", "if", "elseif", "while", "until", "in", "goto"
+    }
+    
+    # Tokens that continue an expression if they come right after one
+    _CONTINUATION_TOKENS = {
+        ".", ":", "[", "(", "{", "..", "+", "-", "*", "/", "//", "%", "^", "&", "~", "|", "<<", ">>",
+        "==", "~=", "<", ">", "<=", ">=", "and", "or"
+    }
+    
+    def __init__(self, strip_debugging: bool = False):
+        """
+        Initialize the class.
+
+        Args:
+            strip_debugging (bool, optional): Whether or not to also disable `Noir.Debugging` tracking by turning `Noir.Debugging.Enabled = true` into `= false`. Defaults to False.
+        """
+        
+        self.strip_debugging = strip_debugging
+        
+    def transform(self, source: str) -> str:
+        """
+        Transform Lua source code for release.
+
+        Args:
+            source (str): The source code.
+
+        Returns:
+            str: The transformed source code.
+            
+        Raises:
+            ValueError: If the source code could not be tokenized.
+        """
+        
+        return "".join(token.text for token in self.transform_tokens(LuaLexer.tokenize(source)))
+    
+    def transform_tokens(self, tokens: list[LuaToken]) -> list[LuaToken]:
+        """
+        Transform Lua tokens for release.
+
+        Args:
+            tokens (list[LuaToken]): The tokens of the source code. See `LuaLexer.tokenize()`.
+
+        Returns:
+            list[LuaToken]: The transformed tokens. Removed code is replaced with whitespace tokens.
+        """
+        
+        significant = [index for index, token in enumerate(tokens) if token.is_significant()]
+        
+        # Find code to remove or replace
+        removed: set[int] = set()
+        replaced: dict[int, str] = {}
+        
+        for position, index in enumerate(significant):
+            if tokens[index].text != "Noir":
+                continue
+            
+            if self._matches(tokens, significant, position, ["Noir", ".", "TypeChecking", ":"]) and position + 4 < len(significant) and tokens[significant[position + 4]].text in ("Assert", "AssertMany"):
+                end = self._find_call_end(tokens, significant, position + 5)
+                
+                if end is not None and self._is_statement(tokens, significant, position, end):
+                    removed.update(range(index, significant[end] + 1))
+                    
+            elif self.strip_debugging and self._matches(tokens, significant, position, ["Noir", ".", "Debugging", ".", "Enabled", "=", "true"]):
+                if self._is_statement(tokens, significant, position, position + 6):
+                    replaced[significant[position + 6]] = "false"
+                    
+        # Remove comments, keeping the first copy of each license notice
+        notices: set[str] = set()
+        
+        for index, token in enumerate(tokens):
+            if token.kind != "comment":
+                continue
+            
+            if "Copyright" in token.text and token.text not in notices:
+                notices.add(token.text)
+                continue
+            
+            removed.add(index)
+            
+        # Rebuild, keeping newlines of removed code and dropping trailing whitespace
+        transformed: list[LuaToken] = []
+        whitespace: list[str] = []
+        whitespace_position = 0
+        
+        for index, token in enumerate(tokens):
+            if index in removed or token.kind == "whitespace":
+                if not whitespace:
+                    whitespace_position = token.position
+                    
+                whitespace.append("\n" * token.text.count("\n") if index in removed else token.text)
+                continue
+            
+            if whitespace:
+                transformed.append(LuaToken("whitespace", re.sub(r"[ \t\r\f\v]+\n", "\n", "".join(whitespace)), whitespace_position))
+                whitespace.clear()
+                
+            transformed.append(LuaToken(token.kind, replaced.get(index, token.text), token.position))
+            
+        if whitespace:
+            transformed.append(LuaToken("whitespace", re.sub(r"[ \t\r\f\v]+(\n|$)", r"\1", "".join(whitespace)), whitespace_position))
+            
+        return transformed
+    
+    def _matches(self, tokens: list[LuaToken], significant: list[int], position: int, texts: list[str]) -> bool:
+        """
+        Returns whether or not the significant tokens starting at a position have the provided text.
+
+        Args:
+            tokens (list[LuaToken]): All tokens.
+            significant (list[int]): The indexes of all significant tokens.
+            position (int): The position in `significant` to start at.
+            texts (list[str]): The text of each token to match.
+
+        Returns:
+            bool: Whether or not the tokens match.
+        """
+        
+        if position + len(texts) > len(significant):
+            return False
+        
+        return all(tokens[significant[position + offset]].text == text for offset, text in enumerate(texts))
+    
+    def _find_call_end(self, tokens: list[LuaToken], significant: list[int], position: int) -> int|None:
+        """
+        Returns the position of the `)` closing a call, given the position of its `(`.
+
+        Args:
+            tokens (list[LuaToken]): All tokens.
+            significant (list[int]): The indexes of all significant tokens.
+            position (int): The position of the `(` in `significant`.
+
+        Returns:
+            int|None: The position of the matching `)` in `significant`, or None if there isn't one.
+        """
+        
+        if position >= len(significant) or tokens[significant[position]].text != "(":
+            return None
+        
+        depth = 0
+        
+        for end in range(position, len(significant)):
+            text = tokens[significant[end]].text
+            
+            if text in ("(", "[", "{"):
+                depth += 1
+            elif text in (")", "]", "}"):
+                depth -= 1
+                
+                if depth == 0:
+                    return end
+                
+        return None
+    
+    def _is_statement(self, tokens: list[LuaToken], significant: list[int], start: int, end: int) -> bool:
+        """
+        Returns whether or not the significant tokens between two positions form a whole statement, rather than part of an expression.
+
+        Args:
+            tokens (list[LuaToken]): All tokens.
+            significant (list[int]): The indexes of all significant tokens.
+            start (int): The position of the first token in `significant`.
+            end (int): The position of the last token in `significant`.
+
+        Returns:
+            bool: Whether or not the tokens are a statement.
+        """
+        
+        if start > 0 and tokens[significant[start - 1]].text in self._EXPRESSION_TOKENS:
+            return False
+        
+        if end + 1 < len(significant):
+            following = tokens[significant[end + 1]]
+            
+            if following.text in self._CONTINUATION_TOKENS or following.kind == "string":
+                return False
+            
+        return True
+
+class LuaLocal():
+    """
+    A local variable found by `LuaScopeResolver`.
+    """
+    
+    def __init__(self, name: str, slot: int, renamable: bool = True):
+        """
+        Initialize the class.
+
+        Args:
+            name (str): The name of the local.
+            slot (int): How many locals were visible when this local was declared. Locals visible at the same time never share a slot.
+            renamable (bool, optional): Whether or not the local can be renamed. False for the implicit `self` of methods. Defaults to True.
+        """
+        
+        self.name = name
+        self.slot = slot
+        self.renamable = renamable
+
+class LuaScopeResolver():
+    """
+    A recursive descent parser for Lua 5.3 that works out which local (if any) every name refers to.
+    Only scopes are tracked, no syntax tree is built.
+    """
+    
+    _BINARY_OPERATORS = {
+        "+", "-", "*", "/", "//", "%", "^", "..", "==", "~=", "<", ">", "<=", ">=", "and", "or", "&", "|", "~", "<<", ">>"
+    }
+    
+    _UNARY_OPERATORS = {"-", "not", "#", "~"}
+    
+    _BLOCK_ENDS = {"end", "else", "elseif", "until", "<eof>"}
+    
+    def __init__(self, tokens: list[LuaToken]):
+        """
+        Initialize the class.
+
+        Args:
+            tokens (list[LuaToken]): The tokens of the source code. See `LuaLexer.tokenize()`.
+        """
+        
+        self.tokens = tokens
+        self.significant = [index for index, token in enumerate(tokens) if token.is_significant()]
+        self.position = 0
+        
+        self.references: dict[int, LuaLocal] = {} # token index -> local
+        self.globals: set[str] = set()
+        self.locals: list[LuaLocal] = []
+        self.statements: list[tuple[int, int]] = [] # top-level statements as (first token index, last token index)
+        
+        self._visible: dict[str, list[LuaLocal]] = {}
+        self._active: list[LuaLocal] = []
+        
+    def resolve(self):
+        """
+        Parse the tokens, filling `references`, `globals`, `locals` and `statements`.
+        
+        Raises:
+            ValueError: If the source code is invalid.
+        """
+        
+        self._block(top_level = True)
+        
+        if self._peek() != "<eof>":
+            self._fail(f"Expected end of file, got '{self._peek()}'")
+    
+    # Tokens
+    def _peek(self, offset: int = 0) -> str:
+        position = self.position + offset
+        return self.tokens[self.significant[position]].text if position < len(self.significant) else "<eof>"
+    
+    def _kind(self) -> str:
+        return self.tokens[self.significant[self.position]].kind if self.position < len(self.significant) else "<eof>"
+    
+    def _next(self) -> str:
+        text = self._peek()
+        self.position += 1
+        return text
+    
+    def _accept(self, text: str) -> bool:
+        if self._peek() == text:
+            self.position += 1
+            return True
+        
+        return False
+    
+    def _expect(self, text: str):
+        if not self._accept(text):
+            self._fail(f"Expected '{text}', got '{self._peek()}'")
+            
+    def _name(self) -> int:
+        if self._kind() != "name":
+            self._fail(f"Expected a name, got '{self._peek()}'")
+            
+        self.position += 1
+        return self.significant[self.position - 1]
+    
+    def _fail(self, message: str):
+        index = self.significant[min(self.position, len(self.significant) - 1)] if self.significant else 0
+        line = sum(token.text.count("\n") for token in self.tokens[:index]) + 1
+        
+        raise ValueError(f"{message} on line {line}.")
+    
+    # Scopes
+    def _open_scope(self) -> int:
+        return len(self._active)
+    
+    def _close_scope(self, scope: int):
+        while len(self._active) > scope:
+            local = self._active.pop()
+            self._visible[local.name].pop()
+            
+    def _declare(self, index: int, renamable: bool = True) -> LuaLocal:
+        local = LuaLocal(self.tokens[index].text if index >= 0 else "self", len(self._active), renamable)
+        
+        self.locals.append(local)
+        self._active.append(local)
+        self._visible.setdefault(local.name, []).append(local)
+        
+        if index >= 0:
+            self.references[index] = local
+            
+        return local
+    
+    def _reference(self, index: int):
+        name = self.tokens[index].text
+        visible = self._visible.get(name)
+        
+        if visible:
+            self.references[index] = visible[-1]
+        else:
+            self.globals.add(name)
+            
+    # Statements
+    def _block(self, top_level: bool = False):
+        scope = self._open_scope()
+        
+        while self._peek() not in self._BLOCK_ENDS:
+            start = self.position
+            
+            if self._peek() == "return":
+                self._return()
+            else:
+                self._statement()
+                
+            if top_level:
+                self.statements.append((self.significant[start], self.significant[self.position - 1]))
+                
+            if self.tokens[self.significant[start]].text == "return":
+                break
+            
+        self._close_scope(scope)
+        
+    def _return(self):
+        self._expect("return")
+        
+        if self._peek() not in self._BLOCK_ENDS and self._peek() != ";":
+            self._expression_list()
+            
+        self._accept(";")
+        
+    def _statement(self):
+        token = self._peek()
+        
+        if token == ";":
+            self._next()
+        elif token == "::":
+            self._next()
+            self._name()
+            self._expect("::")
+        elif token == "break":
+            self._next()
+        elif token == "goto":
+            self._next()
+            self._name()
+        elif token == "do":
+            self._next()
+            self._block()
+            self._expect("end")
+        elif token == "while":
+            self._next()
+            self._expression()
+            self._expect("do")
+            self._block()
+            self._expect("end")
+        elif token == "repeat":
+            # Locals declared in the body are visible in the condition
+            self._next()
+            scope = self._open_scope()
+            
+            while self._peek() not in self._BLOCK_ENDS:
+                if self._peek() == "return":
+                    self._return()
+                    break
+                
+                self._statement()
+                
+            self._expect("until")
+            self._expression()
+            self._close_scope(scope)
+        elif token == "if":
+            self._next()
+            self._expression()
+            self._expect("then")
+            self._block()
+            
+            while self._accept("elseif"):
+                self._expression()
+                self._expect("then")
+                self._block()
+                
+            if self._accept("else"):
+                self._block()
+                
+            self._expect("end")
+        elif token == "for":
+            self._for()
+        elif token == "function":
+            self._next()
+            
+            # Name: a.b.c:d
+            self._reference(self._name())
+            
+            while self._accept("."):
+                self._name()
+                
+            is_method = self._accept(":")
+            
+            if is_method:
+                self._name()
+                
+            self._function_body(is_method)
+        elif token == "local":
+            self._next()
+            
+            if self._accept("function"):
+                self._declare(self._name()) # visible inside its own body
+                self._function_body(False)
+                return
+            
+            names = [self._name()]
+            
+            while self._accept(","):
+                names.append(self._name())
+                
+            # Locals become visible after their values
+            if self._accept("="):
+                self._expression_list()
+                
+            for index in names:
+                self._declare(index)
+        else:
+            # Assignment or call
+            self._suffixed_expression()
+            
+            if self._peek() in ("=", ","):
+                while self._accept(","):
+                    self._suffixed_expression()
+                    
+                self._expect("=")
+                self._expression_list()
+                
+    def _for(self):
+        self._expect("for")
+        names = [self._name()]
+        
+        if self._accept("="):
+            self._expression()
+            self._expect(",")
+            self._expression()
+            
+            if self._accept(","):
+                self._expression()
+        else:
+            while self._accept(","):
+                names.append(self._name())
+                
+            self._expect("in")
+            self._expression_list()
+            
+        self._expect("do")
+        scope = self._open_scope()
+        
+        for index in names:
+            self._declare(index)
+            
+        self._block()
+        self._close_scope(scope)
+        self._expect("end")
+        
+    def _function_body(self, is_method: bool):
+        scope = self._open_scope()
+        
+        if is_method:
+            self._declare(-1, renamable = False)
+            
+        self._expect("(")
+        
+        if self._peek() != ")":
+            while True:
+                if self._accept("..."):
+                    break
+                
+                self._declare(self._name())
+                
+                if not self._accept(","):
+                    break
+                
+        self._expect(")")
+        self._block()
+        self._expect("end")
+        self._close_scope(scope)
+        
+    # Expressions
+    def _expression_list(self):
+        self._expression()
+        
+        while self._accept(","):
+            self._expression()
+            
+    def _expression(self):
+        while self._peek() in self._UNARY_OPERATORS:
+            self._next()
+            
+        self._simple_expression()
+        
+        while self._peek() in self._BINARY_OPERATORS:
+            self._next()
+            
+            while self._peek() in self._UNARY_OPERATORS:
+                self._next()
+                
+            self._simple_expression()
+            
+    def _simple_expression(self):
+        token, kind = self._peek(), self._kind()
+        
+        if kind in ("number", "string") or token in ("nil", "true", "false", "..."):
+            self._next()
+        elif token == "{":
+            self._table()
+        elif token == "function":
+            self._next()
+            self._function_body(False)
+        else:
+            self._suffixed_expression()
+            
+    def _suffixed_expression(self):
+        # Primary
+        if self._accept("("):
+            self._expression()
+            self._expect(")")
+        else:
+            self._reference(self._name())
+            
+        # Suffixes
+        while True:
+            token = self._peek()
+            
+            if token == ".":
+                self._next()
+                self._name()
+            elif token == "[":
+                self._next()
+                self._expression()
+                self._expect("]")
+            elif token == ":":
+                self._next()
+                self._name()
+                self._call_arguments()
+            elif token in ("(", "{") or self._kind() == "string":
+                self._call_arguments()
+            else:
+                break
+            
+    def _call_arguments(self):
+        if self._kind() == "string":
+            self._next()
+        elif self._peek() == "{":
+            self._table()
+        else:
+            self._expect("(")
+            
+            if self._peek() != ")":
+                self._expression_list()
+                
+            self._expect(")")
+            
+    def _table(self):
+        self._expect("{")
+        
+        while self._peek() != "}":
+            if self._accept("["):
+                self._expression()
+                self._expect("]")
+                self._expect("=")
+                self._expression()
+            elif self._kind() == "name" and self._peek(1) == "=":
+                self._name() # key, not a variable
+                self._next()
+                self._expression()
+            else:
+                self._expression()
+                
+            if not self._accept(",") and not self._accept(";"):
+                break
+            
+        self._expect("}")
+
+class LuaMinifier():
+    """
+    Minifies Lua 5.3 source code by removing comments and whitespace, and renaming locals to short names.
+    The first copy of each license notice is kept. Separators are newlines where the source had one, which costs nothing and keeps errors traceable to a line.
+    """
+    
+    # Pairs of characters that would form a different token if the tokens they end/start weren't separated
+    _JOINING_SYMBOLS = {"--", "..", "==", "~=", "<=", ">=", "<<", ">>", "//", "::", "[[", "[="}
+    
+    _NAME_CHARACTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_"
+    
+    def __init__(self, rename_locals: bool = True):
+        """
+        Initialize the class.
+
+        Args:
+            rename_locals (bool, optional): Whether or not to rename locals to short names. Defaults to True.
+        """
+        
+        self.rename_locals = rename_locals
+        
+    def minify(self, source: str) -> str:
+        """
+        Minify Lua source code.
+
+        Args:
+            source (str): The source code.
+
+        Returns:
+            str: The minified source code.
+            
+        Raises:
+            ValueError: If the source code is invalid.
+        """
+        
+        return "".join(token.text for token in self.minify_tokens(LuaLexer.tokenize(source)))
+    
+    def minify_tokens(self, tokens: list[LuaToken]) -> list[LuaToken]:
+        """
+        Minify Lua tokens.
+
+        Args:
+            tokens (list[LuaToken]): The tokens of the source code. See `LuaLexer.tokenize()`.
+
+        Returns:
+            list[LuaToken]: The minified tokens. Separators are whitespace tokens positioned at the token that follows them.
+            
+        Raises:
+            ValueError: If the source code is invalid.
+        """
+        
+        # Work out new names
+        names: dict[int, str] = {}
+        
+        if self.rename_locals:
+            resolver = LuaScopeResolver(tokens)
+            resolver.resolve()
+            
+            names = self._get_new_names(resolver)
+            
+        # Rebuild without comments and unnecessary whitespace
+        minified: list[LuaToken] = []
+        notices: set[str] = set()
+        previous: LuaToken|None = None
+        newline = False
+        
+        for index, token in enumerate(tokens):
+            if token.kind == "whitespace":
+                newline = newline or "\n" in token.text
+                continue
+            
+            if token.kind == "comment":
+                newline = newline or "\n" in token.text
+                
+                if "Copyright" in token.text and token.text not in notices:
+                    notices.add(token.text)
+                    
+                    if previous is not None:
+                        minified.append(LuaToken("whitespace", "\n", token.position))
+                        
+                    minified.append(token)
+                    minified.append(LuaToken("whitespace", "\n", token.position))
+                    previous = None
+                    
+                continue
+            
+            token = LuaToken(token.kind, names.get(index, token.text), token.position)
+            
+            if previous is not None and self._needs_separator(previous, token):
+                minified.append(LuaToken("whitespace", "\n" if newline else " ", token.position))
+                
+            minified.append(token)
+            previous = token
+            newline = False
+            
+        return minified
+    
+    def _get_new_names(self, resolver: LuaScopeResolver) -> dict[int, str]:
+        """
+        Picks a short name for every renamable local. Locals in the same slot share a name, as they are never visible at the same time.
+
+        Args:
+            resolver (LuaScopeResolver): A resolver that has resolved the source.
+
+        Returns:
+            dict[int, str]: The new name of each token that refers to a renamable local, by token index.
+        """
+        
+        # Never use names that are already used by globals or locals that can't be renamed
+        reserved = LuaLexer.KEYWORDS | resolver.globals | {local.name for local in resolver.locals if not local.renamable}
+        
+        slot_names: list[str] = []
+        generator = self._generate_names()
+        
+        def get_slot_name(slot: int) -> str:
+            while len(slot_names) <= slot:
+                name = next(generator)
+                
+                if name not in reserved:
+                    slot_names.append(name)
+                    
+            return slot_names[slot]
+        
+        return {index: get_slot_name(local.slot) for index, local in resolver.references.items() if local.renamable}
+    
+    def _generate_names(self):
+        """
+        Yields names in order of length: a, b, ..., _, aa, ab, ...
+
+        Yields:
+            str: The next name.
+        """
+        
+        characters = self._NAME_CHARACTERS
+        following = characters + "0123456789"
+        length = 1
+        
+        while True:
+            for first in characters:
+                for rest in itertools.product(following, repeat = length - 1):
+                    yield first + "".join(rest)
+                    
+            length += 1
+    
+    def _needs_separator(self, previous: LuaToken, token: LuaToken) -> bool:
+        """
+        Returns whether or not two tokens need whitespace between them to be read back as the same two tokens.
+
+        Args:
+            previous (LuaToken): The first token.
+            token (LuaToken): The second token.
+
+        Returns:
+            bool: Whether or not a separator is needed.
+        """
+        
+        last, first = previous.text[-1], token.text[0]
+        
+        if (last.isalnum() or last == "_") and (first.isalnum() or first == "_"):
+            return True
+        
+        if previous.kind == "number" and (first == "." or first.isalnum()):
+            return True
+        
+        if token.kind == "number" and first == "." and last == ".":
+            return True
+        
+        return last + first in self._JOINING_SYMBOLS
+
+class NoirTreeShaker():
+    """
+    Removes Noir services, libraries and classes that nothing references from Lua tokens.
+    A module is a top-level `Noir.<Kind>.<Name> = <constructor>(...)` statement, along with every top-level statement that assigns to `Noir.<Kind>.<Name>` or defines a function on it.
+    Everything else is kept, as are the modules it references, directly or through other modules.
+    Modules only looked up dynamically (eg: `Noir.Services[name]`) can't be found, so they must be kept explicitly.
+    """
+    
+    KINDS = ("Services", "Libraries", "Classes")
+    
+    _CONSTRUCTORS = {
+        "Services" : ["Noir", ".", "Services", ":", "CreateService", "("],
+        "Libraries" : ["Noir", ".", "Libraries", ":", "Create", "("],
+        "Classes" : ["Noir", ".", "Class", "("]
+    }
+    
+    def __init__(self, keep: list[str]|None = None):
+        """
+        Initialize the class.
+
+        Args:
+            keep (list[str]|None, optional): Modules to always keep, eg: "TaskService" or "Services.TaskService". Defaults to None.
+        """
+        
+        self.keep = keep or []
+        self.removed: list[str] = []
+        
+    def shake(self, tokens: list[LuaToken], is_removable: Callable[[int], bool]|None = None) -> list[LuaToken]:
+        """
+        Remove unreferenced modules from Lua tokens. The removed modules are stored in `removed`, eg: "Services.UIService".
+
+        Args:
+            tokens (list[LuaToken]): The tokens of the source code. See `LuaLexer.tokenize()`.
+            is_removable (Callable[[int], bool]|None, optional): Whether or not a module defined at a position in the source can be removed. Defaults to None (all modules can be removed).
+
+        Returns:
+            list[LuaToken]: The tokens without the removed modules. Removed statements are replaced by a newline.
+            
+        Raises:
+            ValueError: If the source code is invalid.
+        """
+        
+        resolver = LuaScopeResolver(tokens)
+        resolver.resolve()
+        
+        significant = resolver.significant
+        
+        # Split into statements
+        statements: list[tuple[int, int, list[LuaToken]]] = []
+        
+        for start, end in resolver.statements:
+            statement = [tokens[index] for index in significant[bisect.bisect_left(significant, start):bisect.bisect_right(significant, end)]]
+            statements.append((start, end, statement))
+            
+        # Find modules that can be removed
+        candidates: list[str] = []
+        
+        for _, _, statement in statements:
+            key = self._get_definition(statement)
+            
+            if key is not None and key not in candidates and (is_removable is None or is_removable(statement[0].position)):
+                candidates.append(key)
+                
+        # Find what everything references
+        owners: list[str|None] = []
+        references: dict[str, set[str]] = {key: set() for key in candidates}
+        roots = {key for key in candidates if key in self.keep or key.split(".", 1)[1] in self.keep}
+        
+        for _, _, statement in statements:
+            owner = self._get_target(statement)
+            
+            if owner not in references or (is_removable is not None and not is_removable(statement[0].position)):
+                owner = None
+                
+            owners.append(owner)
+            (references[owner] if owner is not None else roots).update(self._get_references(statement))
+            
+        # Keep everything reachable from the roots
+        included: set[str] = set()
+        queue = [key for key in roots if key in references]
+        
+        while len(queue) > 0:
+            key = queue.pop()
+            
+            if key in included:
+                continue
+            
+            included.add(key)
+            queue.extend(reference for reference in references[key] if reference in references)
+            
+        self.removed = [key for key in candidates if key not in included]
+        
+        if len(self.removed) == 0:
+            return tokens
+        
+        # Remove statements of removed modules, along with the comments before them
+        kept = [True] * len(tokens)
+        
+        for (start, end, _), owner in zip(statements, owners):
+            if owner is None or owner in included:
+                continue
+            
+            previous = bisect.bisect_left(significant, start) - 1
+            
+            for index in range(significant[previous] + 1 if previous >= 0 else 0, end + 1):
+                kept[index] = False
+                
+        shaken: list[LuaToken] = []
+        
+        for index, token in enumerate(tokens):
+            if kept[index]:
+                shaken.append(token)
+            elif index == 0 or kept[index - 1]:
+                shaken.append(LuaToken("whitespace", "\n", token.position))
+                
+        return shaken
+    
+    def _get_target(self, statement: list[LuaToken]) -> str|None:
+        """
+        Returns the module a statement assigns to or defines a function on, eg: "Services.TaskService" for `function Noir.Services.TaskService:Foo() end`.
+
+        Args:
+            statement (list[LuaToken]): The significant tokens of the statement.
+
+        Returns:
+            str|None: The module, or None if the statement doesn't target one.
+        """
+        
+        texts = [token.text for token in statement[:6]]
+        
+        if len(texts) > 0 and texts[0] == "function":
+            texts = texts[1:]
+            
+        if len(texts) < 5 or texts[:2] != ["Noir", "."] or texts[2] not in self.KINDS or texts[3] != "." or not self._is_name(texts[4]):
+            return None
+        
+        return f"{texts[2]}.{texts[4]}"
+    
+    def _get_definition(self, statement: list[LuaToken]) -> str|None:
+        """
+        Returns the module a statement defines, eg: "Services.TaskService" for `Noir.Services.TaskService = Noir.Services:CreateService(...)`.
+
+        Args:
+            statement (list[LuaToken]): The significant tokens of the statement.
+
+        Returns:
+            str|None: The module, or None if the statement doesn't define one.
+        """
+        
+        key = self._get_target(statement)
+        
+        if key is None or statement[0].text == "function":
+            return None
+        
+        constructor = self._CONSTRUCTORS[key.split(".")[0]]
+        
+        if len(statement) < 6 + len(constructor) or statement[5].text != "=" or [token.text for token in statement[6:6 + len(constructor)]] != constructor:
+            return None
+        
+        return key
+    
+    def _get_references(self, statement: list[LuaToken]) -> set[str]:
+        """
+        Returns the modules a statement references through `Noir.<Kind>.<Name>`, `Noir.<Kind>["<Name>"]` or `:GetService("<Name>")`.
+
+        Args:
+            statement (list[LuaToken]): The significant tokens of the statement.
+
+        Returns:
+            set[str]: The referenced modules, eg: {"Services.TaskService"}.
+        """
+        
+        texts = [token.text for token in statement] + ["", "", "", "", ""]
+        found: set[str] = set()
+        
+        for index, token in enumerate(statement):
+            if token.text == "Noir" and texts[index + 1] == "." and texts[index + 2] in self.KINDS:
+                kind = texts[index + 2]
+                
+                if texts[index + 3] == "." and self._is_name(texts[index + 4]):
+                    found.add(f"{kind}.{texts[index + 4]}")
+                elif texts[index + 3] == "[" and texts[index + 5] == "]" and self._get_string(texts[index + 4]):
+                    found.add(f"{kind}.{self._get_string(texts[index + 4])}")
+            elif token.text == "GetService" and index > 0 and texts[index - 1] == ":":
+                name = self._get_string(texts[index + 2] if texts[index + 1] == "(" else texts[index + 1])
+                
+                if name:
+                    found.add(f"Services.{name}")
+                    
+        return found
+    
+    def _is_name(self, text: str) -> bool:
+        return re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", text) is not None and text not in LuaLexer.KEYWORDS
+    
+    def _get_string(self, text: str) -> str|None:
+        if len(text) >= 2 and text[0] in "\"'" and text[-1] == text[0] and "\\" not in text:
+            return text[1:-1]
+        
+        return None
+
+class CombinerSizeReport():
+    """
+    A breakdown of how much each file and each `__order.json` directory contributes to the combined output.
+    Sizes are in UTF-8 bytes, which is never less than the amount of characters.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, sizes: dict[Path, tuple[int, int]], directories: list[Path], total: int, max_size: int|None = None):
+        """
+        Initialize the class.
+
+        Args:
+            sizes (dict[Path, tuple[int, int]]): The size of each file before and after transforming. See `Combiner.sizes`.
+            directories (list[Path]): The directories with an `__order.json` file to total up.
+            total (int): The size of the combined output, including the separators between files.
+            max_size (int|None, optional): The size budget of the combined output. Defaults to None.
+        """
+        
+        self.total = total
+        self.max_size = max_size
+        self.files = sorted(sizes.items(), key = lambda item: item[1][1], reverse = True)
+        
+        directory_sizes = {directory.absolute(): 0 for directory in directories}
+        parent_sizes: dict[Path, int] = {}
+        
+        for path, (_, after) in sizes.items():
+            parent_sizes[path.parent] = parent_sizes.get(path.parent, 0) + after
+            
+        for parent, size in parent_sizes.items():
+            parent = parent.absolute()
+            
+            for directory in [parent, *parent.parents]:
+                if directory in directory_sizes:
+                    directory_sizes[directory] += size
+                    
+        self.directories = sorted(zip(directories, directory_sizes.values()), key = lambda item: item[1], reverse = True)
+        
+    def is_over_budget(self) -> bool:
+        """
+        Returns whether or not the combined output is bigger than the size budget.
+
+        Returns:
+            bool: Whether or not the output is over budget. Always False if there is no budget.
+        """
+        
+        return self.max_size is not None and self.total > self.max_size
+    
+    def get_top_files(self, count: int) -> list[tuple[Path, int]]:
+        """
+        Returns the files that contribute the most to the combined output.
+
+        Args:
+            count (int): The amount of files to return.
+
+        Returns:
+            list[tuple[Path, int]]: The files and their size in the output, biggest first.
+        """
+        
+        return [(path, after) for path, (_, after) in self.files[:count]]
+    
+    def to_dict(self) -> dict:
+        """
+        Returns the report as a JSON-serializable dictionary.
+
+        Returns:
+            dict: The report.
+        """
+        
+        return {
+            "version" : self.VERSION,
+            "created_at" : time.time(),
+            "total" : self.total,
+            "max_size" : self.max_size,
+            "files" : [{"path" : path.as_posix(), "before" : before, "after" : after} for path, (before, after) in self.files],
+            "directories" : [{"path" : path.as_posix(), "size" : size} for path, size in self.directories]
+        }
+        
+    def save(self, path: Path):
+        """
+        Save the report as JSON.
+
+        Args:
+            path (Path): Where to save the report.
+        """
+        
+        path.parent.mkdir(parents = True, exist_ok = True)
+        path.write_text(json.dumps(self.to_dict(), indent = 4), encoding = "utf-8")
+
+class CombinerSourceMap():
+    """
+    Maps lines of the combined output back to the file and line they came from.
+    Stored as a table of (output line, file, line) entries sorted by output line. Lines after an entry continue on from it, so only lines where the mapping jumps need an entry, and lookups are a binary search.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, sources: list[Path]|None = None, entries: list[tuple[int, int, int]]|None = None):
+        """
+        Initialize the class.
+
+        Args:
+            sources (list[Path]|None, optional): The files the output came from. Defaults to None.
+            entries (list[tuple[int, int, int]]|None, optional): The (output line, source index, source line) entries, sorted by output line. Defaults to None.
+        """
+        
+        self.sources: list[Path] = sources or []
+        self.entries: list[tuple[int, int, int]] = entries or []
+        
+        self._source_indexes = {source: index for index, source in enumerate(self.sources)}
+        self._lines = [entry[0] for entry in self.entries]
+        
+    def add(self, output_line: int, source: Path, source_line: int):
+        """
+        Map a line of the output, and the lines after it, to a file and line. Must be called in order of output line.
+
+        Args:
+            output_line (int): The line of the output.
+            source (Path): The file the line came from.
+            source_line (int): The line in the file.
+        """
+        
+        index = self._source_indexes.get(source)
+        
+        if index is None:
+            index = self._source_indexes[source] = len(self.sources)
+            self.sources.append(source)
+            
+        # Skip entries that the last entry already covers
+        if len(self.entries) > 0:
+            last_line, last_index, last_source_line = self.entries[-1]
+            
+            if last_index == index and source_line - output_line == last_source_line - last_line:
+                return
+            
+            if last_line == output_line:
+                self.entries.pop()
+                self._lines.pop()
+                
+        self.entries.append((output_line, index, source_line))
+        self._lines.append(output_line)
+        
+    def extend(self, source_map: "CombinerSourceMap", offset: int):
+        """
+        Add all entries of another source map, for when its output is embedded in this one's.
+
+        Args:
+            source_map (CombinerSourceMap): The source map to add.
+            offset (int): The amount of lines before the other output starts.
+        """
+        
+        for output_line, index, source_line in source_map.entries:
+            self.add(output_line + offset, source_map.sources[index], source_line)
+        
+    def lookup(self, line: int) -> tuple[Path, int]|None:
+        """
+        Find the file and line a line of the output came from.
+
+        Args:
+            line (int): The line of the output.
+
+        Returns:
+            tuple[Path, int]|None: The file and line, or None if the line is before the first entry.
+        """
+        
+        position = bisect.bisect_right(self._lines, line) - 1
+        
+        if position < 0:
+            return None
+        
+        output_line, index, source_line = self.entries[position]
+        return self.sources[index], source_line + line - output_line
+    
+    def rewrite(self, text: str, names: list[str]) -> str:
+        """
+        Rewrite `<name>:<line>` references to the output (eg: in error messages and tracebacks) to the file and line they came from.
+
+        Args:
+            text (str): The text to rewrite.
+            names (list[str]): The names the output is referred to by, eg: "stdin" or "script.lua".
+
+        Returns:
+            str: The rewritten text.
+        """
+        
+        if len(names) == 0:
+            return text
+        
+        def replace(match: re.Match) -> str:
+            location = self.lookup(int(match.group(2)))
+            return f"{location[0].as_posix()}:{location[1]}" if location is not None else match.group()
+        
+        return re.sub(rf"(?<![\w./\\])({"|".join(re.escape(name) for name in names)}):(\d+)", replace, text)
+    
+    def to_dict(self) -> dict:
+        """
+        Returns the source map as a JSON-serializable dictionary.
+
+        Returns:
+            dict: The source map.
+        """
+        
+        return {
+            "version" : self.VERSION,
+            "sources" : [source.as_posix() for source in self.sources],
+            "entries" : self.entries
+        }
+        
+    @classmethod
+    def from_dict(cls, data: dict) -> "CombinerSourceMap":
+        """
+        Create a source map from a dictionary. See `to_dict()`.
+
+        Args:
+            data (dict): The source map as a dictionary.
+
+        Returns:
+            CombinerSourceMap: The source map.
+            
+        Raises:
+            ValueError: If the source map is invalid or from a different version.
+        """
+        
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported source map version: {data.get("version")}. Expected {cls.VERSION}.")
+        
+        try:
+            return cls([Path(source) for source in data["sources"]], [(entry[0], entry[1], entry[2]) for entry in data["entries"]])
+        except (KeyError, IndexError, TypeError) as exception:
+            raise ValueError(f"Invalid source map: {exception}")
+        
+    def save(self, path: Path):
+        """
+        Save the source map as compact JSON.
+
+        Args:
+            path (Path): Where to save the source map.
+        """
+        
+        path.parent.mkdir(parents = True, exist_ok = True)
+        path.write_text(json.dumps(self.to_dict(), separators = (",", ":")), encoding = "utf-8")
+        
+    @classmethod
+    def load(cls, path: Path) -> "CombinerSourceMap":
+        """
+        Load a source map saved with `save()`.
+
+        Args:
+            path (Path): The path to the source map.
+
+        Returns:
+            CombinerSourceMap: The source map.
+            
+        Raises:
+            ValueError: If the source map is invalid.
+        """
+        
+        try:
+            return cls.from_dict(json.loads(path.read_text("utf-8")))
+        except json.JSONDecodeError as exception:
+            raise ValueError(f"Invalid source map @ {path}: {exception}")
+
+class CombinerPathMatcher():
+    """
+    Matches paths against gitignore-style glob patterns, compiled into one regular expression.
+    Patterns without a `/` match at any depth (eg: `*.png`), patterns with one are relative to the base directory (eg: `assets/*.png`).
+    `*` and `?` never match `/`, `**` matches any amount of directories, and a trailing `/` only matches directories.
+    """
+    
+    def __init__(self, patterns: list[str], base: Path):
+        """
+        Initialize the class.
+
+        Args:
+            patterns (list[str]): The patterns. Empty patterns and patterns starting with `#` are skipped.
+            base (Path): The directory the patterns are relative to.
+            
+        Raises:
+            ValueError: If a pattern is negated (starts with `!`), which is not supported.
+        """
+        
+        self.patterns = patterns
+        self.base = base.absolute()
+        
+        any_kind: list[str] = []
+        directories: list[str] = []
+        
+        for pattern in patterns:
+            pattern = pattern.strip()
+            
+            if pattern == "" or pattern.startswith("#"):
+                continue
+            
+            if pattern.startswith("!"):
+                raise ValueError(f"Negated patterns are not supported ('{pattern}').")
+            
+            (directories if pattern.endswith("/") else any_kind).append(self.translate(pattern))
+            
+        self._any_kind = re.compile("|".join(f"(?:{regex})" for regex in any_kind)) if len(any_kind) > 0 else None
+        self._directories = re.compile("|".join(f"(?:{regex})" for regex in directories)) if len(directories) > 0 else None
+        
+    @staticmethod
+    def translate(pattern: str) -> str:
+        """
+        Translate a gitignore-style glob pattern into a regular expression matching paths relative to the base directory.
+
+        Args:
+            pattern (str): The pattern.
+
+        Returns:
+            str: The regular expression.
+        """
+        
+        pattern = pattern.rstrip("/")
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        
+        regex = ""
+        index = 0
+        
+        while index < len(pattern):
+            if pattern.startswith("**/", index):
+                regex += "(?:.*/)?"
+                index += 3
+                continue
+            
+            if pattern.startswith("**", index):
+                regex += ".*"
+                index += 2
+                continue
+            
+            character = pattern[index]
+            end = pattern.find("]", index + 2) if character == "[" else -1
+            
+            if character == "*":
+                regex += "[^/]*"
+            elif character == "?":
+                regex += "[^/]"
+            elif end != -1:
+                content = pattern[index + 1:end]
+                regex += "[" + ("^" + content[1:] if content.startswith("!") else content).replace("\\", "\\\\") + "]"
+                index = end
+            else:
+                regex += re.escape(character)
+                
+            index += 1
+            
+        return ("" if anchored else "(?:.*/)?") + regex
+    
+    def matches(self, path: Path, is_directory: bool = False) -> bool:
+        """
+        Check if a path matches any of the patterns.
+
+        Args:
+            path (Path): The absolute path to check.
+            is_directory (bool, optional): Whether or not the path is a directory. Defaults to False.
+
+        Returns:
+            bool: Whether or not the path matches. Always False for paths outside of the base directory.
+        """
+        
+        try:
+            relative = path.relative_to(self.base).as_posix()
+        except ValueError:
+            return False
+        
+        if self._any_kind is not None and self._any_kind.fullmatch(relative):
+            return True
+        
+        return is_directory and self._directories is not None and self._directories.fullmatch(relative) is not None
+
 class Combiner():
     """
     A class used to combine all files in a directory into one.
     """
 
-    def __init__(self, directory: Path, destination: Path, whitelisted_extensions: list[str], blacklisted_extensions: list[str], ignored: list[Path]):
+    PROFILES = ("debug", "release")
+    READ_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+    WRITE_CHUNK_SIZE = 1024 * 1024
+    
+    def __init__(self, directory: Path, destination: Path, whitelisted_extensions: list[str], blacklisted_extensions: list[str], ignored: list[Path], cache: bool = False, profile: str = "debug", strip_debugging: bool = False, minify: bool = False, tree_shake: list[Path]|None = None, keep: list[str]|None = None, max_size: int|None = None, report: Path|None = None, source_map: bool = False, ignored_patterns: list[str]|None = None, replacements: dict[str, str]|None = None):
+        """
+        Initialize the class.
+
+        Args:
+            directory (Path): The directory containing files to combine.
+            destination (Path): The file which should have the content of all files combined.
+            whitelisted_extensions (list[str]): The file extensions to allow. Leave empty to allow all extensions.
+            blacklisted_extensions (list[str]): The file extensions to ignore. Leave empty to ignore no extensions.
+            ignored (list[Path]): The paths (inc. files) to ignore when combining.
+            cache (bool, optional): Whether or not to use a persistent build cache, stored in the user's cache directory (see `get_cache_directory()`). Defaults to False.
+            profile (str, optional): "debug" outputs the files as they are. "release" treats the output as Lua and strips type checking, comments and annotations from it. See `LuaTransformer`. Defaults to "debug".
+            strip_debugging (bool, optional): Whether or not to also disable `Noir.Debugging` tracking in the "release" profile. Defaults to False.
+            minify (bool, optional): Whether or not to minify the output, treating it as Lua. See `LuaMinifier`. Defaults to False.
+            tree_shake (list[Path]|None, optional): The paths (inc. files) containing Noir. Services, libraries and classes defined in them are left out if nothing references them, treating the output as Lua. See `NoirTreeShaker`. Defaults to None.
+            keep (list[str]|None, optional): The services, libraries and classes to never leave out when tree shaking, eg: "TaskService". Defaults to None.
+            max_size (int|None, optional): The maximum size of the combined output in UTF-8 bytes. Builds over it fail. Defaults to None.
+            report (Path|None, optional): Where to save the size report of every build as JSON. See `CombinerSizeReport`. Defaults to None.
+            source_map (bool, optional): Whether or not to write a source map next to the destination, mapping lines of the output back to the files they came from. See `CombinerSourceMap`. Defaults to False.
+            ignored_patterns (list[str]|None, optional): Gitignore-style glob patterns (relative to the directory) of paths to ignore when combining, eg: "*.png" or "assets/". See `CombinerPathMatcher`. Defaults to None.
+            replacements (dict[str, str]|None, optional): Strings to replace in every file as it is read, before the output is transformed and written (eg: to fill in a version). Defaults to None.
+            
+        Raises:
+            ValueError: If both whitelisted_extensions and blacklisted_extensions are used at the same time.
+            ValueError: If the directory does not exist.
+            ValueError: If the profile is invalid.
+            ValueError: If an ignored pattern is invalid.
+        """
+        
+        if len(whitelisted_extensions) > 0 and len(blacklisted_extensions) > 0:
+            raise ValueError("Cannot use both whitelisted_extensions and blacklisted_extensions at the same time.")
+        
+        if not directory.exists():
+            raise ValueError("Directory does not exist.")
+        
+        if profile not in self.PROFILES:
+            raise ValueError(f"Invalid profile '{profile}'. Expected one of: {", ".join(self.PROFILES)}.")
+        
+        self.directory = directory
+        self.destination = destination
+        self.whitelisted_extensions = whitelisted_extensions
+        self.blacklisted_extensions = blacklisted_extensions
+        self.ignored = ignored
+        self.ignored.extend([Path(destination)])
+        
+        self._subtrees: dict[Path, dict[Path, Future[str]]] = {}
+        
+        self.temporary_path = self.destination.parent / f".{self.destination.name}.tmp"
+        self.ignored.append(self.temporary_path)
+        
+        # Stored outside of the destination's directory, which is often the game's addon directory
+        cache_key = hashlib.sha256(f"{self.directory.absolute()}\0{self.destination.absolute()}".encode("utf-8")).hexdigest()[:16]
+        self.cache_path = get_cache_directory() / "combiner" / cache_key
+        self.cache: CombinerCache|None = None
+        
+        if cache:
+            self.cache = CombinerCache(self.cache_path)
+            
+        self.source_map_path = self.destination.parent / f"{self.destination.name}.map.json"
+        self.source_map = CombinerSourceMap()
+        self.write_source_map = source_map
+        
+        if source_map:
+            self.ignored.append(self.source_map_path)
+            
+        if report is not None:
+            self.ignored.append(report)
+            
+        self.profile = profile
+        self.transformer = LuaTransformer(strip_debugging) if profile == "release" else None
+        self.minifier = LuaMinifier() if minify else None
+        self.tree_shake = [path.absolute() for path in tree_shake or []]
+        self.tree_shaker = NoirTreeShaker(keep) if len(self.tree_shake) > 0 else None
+        self.sizes: dict[Path, tuple[int, int]] = {}
+        self.max_size = max_size
+        self.report_path = report
+        self.size_report: CombinerSizeReport|None = None
+        self.replacements = replacements or {}
+        self._transformed: tuple[str, str]|None = None
+        
+        # Resolve filters once, so checking a path doesn't depend on how many paths are ignored
+        self.ignored_patterns = CombinerPathMatcher(ignored_patterns or [], directory)
+        self._ignored_paths = {path.absolute() for path in self.ignored}
+        self._whitelisted_extensions = set(whitelisted_extensions)
+        self._blacklisted_extensions = set(blacklisted_extensions)
+        
+    def combine(self, prevent_write: bool = False) -> tuple[str, dict[Path, str]]:
+        """
+        Combine all files in the directory into one.
+        If the build cache is enabled, unchanged files are not re-read and the destination is not re-written if the output is unchanged.
+        
+        Args:
+            prevent_write (bool, optional): Whether or not to prevent writing the combined file. Defaults to False.
+
+        Returns:
+            str: The combined content of all files, joined together by two newlines.
+            dict[Path, str]: The contents of all combined files.
+            
+        Raises:
+            ValueError: If an existing `__order.json` file is invalid.
+            ValueError: If the combined output is bigger than `max_size`. Nothing is written.
+        """
+        
+        self._subtrees.clear()
+        return self._build(prevent_write, full = True)
+    
+    def rebuild(self, changed: list[Path], prevent_write: bool = False) -> tuple[str, dict[Path, str]]:
+        """
+        Combine all files in the directory into one after the provided paths changed.
+        Only directories containing a changed path are combined again, everything else is reused from the last combine.
+        
+        Args:
+            changed (list[Path]): The paths that were created, modified or removed.
+            prevent_write (bool, optional): Whether or not to prevent writing the combined file. Defaults to False.
+
+        Returns:
+            str: The combined content of all files, joined together by two newlines.
+            dict[Path, str]: The contents of all combined files.
+            
+        Raises:
+            ValueError: If an existing `__order.json` file is invalid.
+            ValueError: If the combined output is bigger than `max_size`. Nothing is written.
+        """
+        
+        changed = [path.absolute() for path in changed]
+        
+        for directory in [*self._subtrees.keys()]:
+            if any(path == directory or directory in path.parents for path in changed):
+                del self._subtrees[directory]
+            elif any(path.name == "__order.json" and path.parent in directory.parents for path in changed):
+                del self._subtrees[directory] # exclusions are inherited from parent directories
+        
+        return self._build(prevent_write, full = False)
+    
+    def _build(self, prevent_write: bool, full: bool) -> tuple[str, dict[Path, str]]:
+        """
+        Combine all files, reusing any directories that were already combined.
+        
+        Args:
+            prevent_write (bool): Whether or not to prevent writing the combined file.
+            full (bool): Whether or not every file was visited, allowing the build cache to drop entries for removed files.
+
+        Returns:
+            str: The combined content of all files, joined together by two newlines.
+            dict[Path, str]: The contents of all combined files.
+            
+        Raises:
+            ValueError: If the combined output is bigger than `max_size`.
+        """
+        
+        # Read files, keeping the order. Failed reads are skipped
+        with ThreadPoolExecutor(max_workers = self.READ_WORKERS) as executor:
+            reads = self._combine_directory(self.directory, executor)
+            
+        contents = {path: read.result() for path, read in reads.items() if read.exception() is None}
+        result = self._transform(contents)
+        
+        # Check size
+        self.size_report = self._create_size_report(contents, result)
+        
+        if self.report_path is not None:
+            self.size_report.save(self.report_path)
+            
+        if self.size_report.is_over_budget():
+            offenders = ", ".join(f"{path} ({size:,}B)" for path, size in self.size_report.get_top_files(5))
+            raise ValueError(f"Combined output is {self.size_report.total:,}B, which is over the maximum size of {self.max_size:,}B. Biggest files: {offenders}")
+        
+        # Write
+        if not prevent_write:
+            self._write(result)
+            
+            if self.write_source_map:
+                self.source_map.save(self.source_map_path)
+            
+        if self.cache is not None:
+            self.cache.save(prune = full)
+        
+        # Return
+        return result, dict(contents)
+    
+    def _transform(self, contents: dict[Path, str]) -> str:
+        """
+        Join the combined files, tree shake them and transform them for the current profile, minifying them if enabled.
+        Updates `sizes` with the size of each file before and after, and `source_map`. The last transform is reused if the files haven't changed.
+        
+        Args:
+            contents (dict[Path, str]): The contents of all combined files, in order.
+
+        Returns:
+            str: The transformed content.
         """
-        Initialize the class.
+        
+        result = "\n\n".join(contents.values())
+        
+        if self.transformer is None and self.minifier is None and self.tree_shaker is None:
+            self.sizes = {path: (len(content.encode("utf-8")),) * 2 for path, content in contents.items()}
+            self.source_map = CombinerSourceMap()
+            line = 1
+            
+            for path, content in contents.items():
+                self.source_map.add(line, path, 1)
+                line += content.count("\n") + 2
+                
+            return result
+        
+        if self._transformed is not None and self._transformed[0] == result:
+            return self._transformed[1]
+        
+        # Find where each file starts
+        paths = [*contents.keys()]
+        starts: list[int] = []
+        offset = 0
+        
+        for content in contents.values():
+            starts.append(offset)
+            offset += len(content) + 2
+            
+        # Transform
+        tokens = LuaLexer.tokenize(result)
+        
+        if self.tree_shaker is not None:
+            tokens = self.tree_shaker.shake(tokens, lambda position: self._is_tree_shaken(paths[bisect.bisect_right(starts, position) - 1]))
+        
+        if self.transformer is not None:
+            tokens = self.transformer.transform_tokens(tokens)
+            
+        if self.minifier is not None:
+            tokens = self.minifier.minify_tokens(tokens)
+            
+        self._transformed = (result, "".join(token.text for token in tokens))
+        
+        # Work out how much of the output came from each file
+        after = [0] * len(starts)
+        
+        for token in tokens:
+            after[bisect.bisect_right(starts, token.position) - 1] += len(token.text.encode("utf-8"))
+            
+        self.sizes = {path: (len(content.encode("utf-8")), after[index]) for index, (path, content) in enumerate(contents.items())}
+        
+        # Map the first token of each output line back to its source line
+        line_starts = [0, *(match.end() for match in re.finditer("\n", result))]
+        first_lines = [bisect.bisect_right(line_starts, start) for start in starts]
+        
+        self.source_map = CombinerSourceMap()
+        line = 1
+        at_line_start = True
+        
+        for token in tokens:
+            if at_line_start and token.kind != "whitespace":
+                index = bisect.bisect_right(starts, token.position) - 1
+                self.source_map.add(line, paths[index], bisect.bisect_right(line_starts, token.position) - first_lines[index] + 1)
+                at_line_start = False
+                
+            newlines = token.text.count("\n")
+            
+            if newlines > 0:
+                line += newlines
+                at_line_start = True
+                
+        return self._transformed[1]
+    
+    def _create_size_report(self, contents: dict[Path, str], result: str) -> CombinerSizeReport:
+        """
+        Create a size report for the last build.
 
         Args:
-            directory (Path): The directory containing files to combine.
-            destination (Path): The file which should have the content of all files combined.
-            whitelisted_extensions (list[str]): The file extensions to allow. Leave empty to allow all extensions.
-            blacklisted_extensions (list[str]): The file extensions to ignore. Leave empty to ignore no extensions.
-            ignored (list[Path]): The paths (inc. files) to ignore when combining.
-            
-        Raises:
-            ValueError: If both whitelisted_extensions and blacklisted_extensions are used at the same time.
-            ValueError: If the directory does not exist.
+            contents (dict[Path, str]): The contents of all combined files.
+            result (str): The combined output.
+
+        Returns:
+            CombinerSizeReport: The size report.
         """
         
-        if len(whitelisted_extensions) > 0 and len(blacklisted_extensions) > 0:
-            raise ValueError("Cannot use both whitelisted_extensions and blacklisted_extensions at the same time.")
-        
-        if not directory.exists():
-            raise ValueError("Directory does not exist.")
+        parents = {parent for path in contents.keys() for parent in path.parents}
+        directories = {
+            parent for parent in parents
+            if (parent == self.directory or self.directory in parent.parents) and (parent / "__order.json").exists()
+        }
         
-        self.directory = directory
-        self.destination = destination
-        self.whitelisted_extensions = whitelisted_extensions
-        self.blacklisted_extensions = blacklisted_extensions
-        self.ignored = ignored
-        self.ignored.extend([Path(destination)])
+        return CombinerSizeReport(self.sizes, sorted(directories), len(result.encode("utf-8")), self.max_size)
+    
+    def _is_tree_shaken(self, path: Path) -> bool:
+        """
+        Check if a file is in one of the paths to tree shake.
+
+        Args:
+            path (Path): The file to check.
+
+        Returns:
+            bool: Whether or not modules in the file can be left out.
+        """
         
-    def combine(self, prevent_write: bool = False, *, _directory: Path|None = None) -> tuple[str, dict[Path, str]]:
+        path = path.absolute()
+        return any(path == current_path or current_path in path.parents for current_path in self.tree_shake)
+    
+    def _combine_directory(self, directory: Path, executor: ThreadPoolExecutor, excluded: tuple[CombinerPathMatcher, ...] = ()) -> dict[Path, Future[str]]:
         """
-        Combine all files in the directory into one.
+        Start reading all allowed files in a directory, following `__order.json` files.
+        An `__order.json` file's `order` list can contain glob patterns (eg: "Services/*.lua"), and its optional `exclude` list holds gitignore-style patterns of paths to leave out, in its directory and below.
         
         Args:
-            prevent_write (bool, optional): Whether or not to prevent writing the combined file. Defaults to False.
-            _directory (Path, optional): The directory to combine. Used internally. Defaults to None.
+            directory (Path): The directory to read.
+            executor (ThreadPoolExecutor): The executor to read files in.
+            excluded (tuple[CombinerPathMatcher, ...], optional): Exclusions from the `__order.json` files of parent directories. Defaults to ().
 
         Returns:
-            str: The combined content of all files, joined together by two newlines.
-            dict[Path, str]: The contents of all combined files.
+            dict[Path, Future[str]]: The reads of all files, in order.
             
         Raises:
             ValueError: If an existing `__order.json` file is invalid.
         """
         
-        # Validation
-        if _directory is None:
-            _directory = self.directory
+        # Reuse the directory if it hasn't changed since it was last combined
+        key = directory.absolute()
+        
+        if key in self._subtrees:
+            return self._subtrees[key]
         
         # For later
-        contents: dict[Path, str] = {}
+        contents: dict[Path, Future[str]] = {}
         
         # Read __order.json if it exists 
-        order = self._read_order(_directory)
+        order = self._read_order(directory)
 
         if order is not None:
             orderedFiles: list[str]|None = order.get("order")
             
             if orderedFiles is None:
-                raise ValueError(f"Invalid `__order.json` file @ {path}. Missing `order` list.")
+                raise ValueError(f"Invalid `__order.json` file @ {directory}. Missing `order` list.")
             
-            paths = [_directory / file for file in orderedFiles]
+            if "exclude" in order:
+                excluded = (*excluded, CombinerPathMatcher(order["exclude"], directory))
+                
+            paths = self._expand_order(directory, orderedFiles)
         else:
-            paths = [*_directory.iterdir()]
+            paths = sorted(directory.iterdir()) # sorted so output is identical across platforms
         
         # Read files
         for path in paths:
             if path.is_file():
                 # Check if the file is allowed
-                if not self.is_file_allowed(path):
+                if not self.is_file_allowed(path) or any(matcher.matches(path.absolute()) for matcher in excluded):
                     continue
                 
-                # Read and save
-                try:
-                    contents[path] = path.read_text("utf-8")
-                except:
-                    continue
+                # Read in the background
+                contents[path] = executor.submit(self._read, path)
             else:
                 # Check if the directory is allowed
-                if not self._is_directory_allowed(path):
+                if not self._is_directory_allowed(path) or any(matcher.matches(path.absolute(), True) for matcher in excluded):
                     continue
             
                 # Iterate through files
-                _, results = self.combine(prevent_write = prevent_write, _directory = path)
-                contents.update(results)
+                contents.update(self._combine_directory(path, executor, excluded))
                 
-        # Write
-        result = "\n\n".join(contents.values())
+        # Return
+        self._subtrees[key] = contents
+        return contents
+    
+    def _expand_order(self, directory: Path, entries: list[str]) -> list[Path]:
+        """
+        Turn the entries of an `__order.json` file into paths, expanding glob patterns. Paths are only included once, at their first entry.
+
+        Args:
+            directory (Path): The directory containing the `__order.json` file.
+            entries (list[str]): The entries of the `order` list.
+
+        Returns:
+            list[Path]: The paths, in order.
+        """
         
-        if not prevent_write:
-            self.destination.parents[0].mkdir(exist_ok = True)
-            self.destination.write_text(result, encoding = "utf-8")
+        paths: dict[Path, None] = {}
         
-        # Return
-        return result, contents
+        for entry in entries:
+            if any(character in entry for character in "*?["):
+                paths.update(dict.fromkeys(sorted(directory.glob(entry)))) # sorted so output is identical across platforms
+            else:
+                paths.setdefault(directory / entry)
+                
+        return [*paths.keys()]
+    
+    def _read(self, path: Path) -> str:
+        """
+        Read a file, through the build cache if it is enabled, and apply `replacements` to it.
+
+        Args:
+            path (Path): The file to read.
+
+        Returns:
+            str: The contents of the file.
+        """
+        
+        content = self.cache.read(path) if self.cache is not None else path.read_text("utf-8")
+        
+        for old, new in self.replacements.items():
+            content = content.replace(old, new)
+            
+        return content
+    
+    def _write(self, result: str):
+        """
+        Write the combined content to the destination, skipping the write if the build cache shows it is unchanged.
+        The content is streamed to a temporary file in chunks, which then replaces the destination, so readers never see a partly written file.
+
+        Args:
+            result (str): The combined content.
+        """
+        
+        if self.cache is not None:
+            digest = hashlib.sha256()
+            
+            for chunk in self._get_chunks(result):
+                digest.update(chunk.encode("utf-8"))
+                
+            output_hash = digest.hexdigest()
+            
+            if self.cache.is_output_current(self.destination, output_hash):
+                return
+        
+        self.destination.parents[0].mkdir(exist_ok = True)
+        
+        try:
+            with self.temporary_path.open("w", encoding = "utf-8") as file:
+                for chunk in self._get_chunks(result):
+                    file.write(chunk)
+                    
+            os.replace(self.temporary_path, self.destination)
+        except BaseException:
+            self.temporary_path.unlink(missing_ok = True)
+            raise
+        
+        if self.cache is not None:
+            self.cache.set_output(self.destination, output_hash)
+            
+    def _get_chunks(self, result: str) -> Iterator[str]:
+        """
+        Split the combined content into chunks, so it is never encoded all at once.
+
+        Args:
+            result (str): The combined content.
+
+        Yields:
+            str: The next chunk.
+        """
+        
+        for start in range(0, len(result), self.WRITE_CHUNK_SIZE):
+            yield result[start:start + self.WRITE_CHUNK_SIZE]
     
     def _read_order(self, directory: Path) -> dict|None:
         """
@@ -165,10 +2161,7 @@ class Combiner():
             bool: Whether or not the directory is allowed to be parsed.
         """
 
-        if self.in_paths(path, self.ignored):
-            return False
-        
-        return True
+        return not self.is_ignored(path, is_directory = True)
                 
     def is_file_allowed(self, path: Path) -> bool:
         """
@@ -181,42 +2174,346 @@ class Combiner():
             bool: Whether or not the file is allowed to be parsed.
         """
         
-        if len(self.whitelisted_extensions) > 0 and not path.suffix in self.whitelisted_extensions:
-            return False
-        
-        if len(self.blacklisted_extensions) > 0 and path.suffix in self.blacklisted_extensions:
+        if len(self._whitelisted_extensions) > 0 and not path.suffix in self._whitelisted_extensions:
             return False
         
-        if self.in_paths(path, self.ignored):
+        if path.suffix in self._blacklisted_extensions:
             return False
         
-        return True
-  
-    def in_paths(self, path: Path, paths: list[Path]) -> bool:
+        return not self.is_ignored(path)
+    
+    def is_ignored(self, path: Path, is_directory: bool = False, parents: bool = False) -> bool:
         """
-        Check if a path is in a list of paths.
+        Check if a path is ignored, either directly or by an ignored pattern.
+        Ignored paths are resolved when the combiner is created, so later changes to `ignored` are not seen.
 
         Args:
             path (Path): The path to check.
-            paths (list[Path]): A list of paths to check against.
+            is_directory (bool, optional): Whether or not the path is a directory. Defaults to False.
+            parents (bool, optional): Whether or not to also check the path's parent directories, for paths that weren't found by combining (eg: from a watcher). Defaults to False.
 
         Returns:
-            bool: Whether or not the path is in the list of paths.
+            bool: Whether or not the path is ignored.
         """
         
-        for current_path in paths:
-            if path.absolute() == current_path.absolute():
-                return True
-            
+        path = path.absolute()
+        
+        if path in self._ignored_paths or self.ignored_patterns.matches(path, is_directory):
+            return True
+        
+        if parents:
+            return any(parent in self._ignored_paths or self.ignored_patterns.matches(parent, True) for parent in path.parents)
+        
         return False
 
+class PollingWatcher():
+    """
+    Watches a directory for changes by periodically comparing file modification times and sizes.
+    Used when inotify is unavailable.
+    """
+    
+    def __init__(self, directory: Path, interval: float = 0.1):
+        """
+        Initialize the class.
+
+        Args:
+            directory (Path): The directory to watch.
+            interval (float, optional): How often to check for changes in seconds. Defaults to 0.1.
+        """
+        
+        self.directory = directory.absolute()
+        self.interval = interval
+        self._files = self._snapshot()
+        
+    def _snapshot(self) -> dict[Path, tuple[int, int]]:
+        """
+        Get the modification time and size of every file in the directory.
+
+        Returns:
+            dict[Path, tuple[int, int]]: The modification time and size of every file.
+        """
+        
+        files: dict[Path, tuple[int, int]] = {}
+        
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = Path(root) / name
+                
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                
+                files[path] = (stat.st_mtime_ns, stat.st_size)
+                
+        return files
+        
+    def wait(self) -> list[Path]:
+        """
+        Block until something in the directory changes.
+
+        Returns:
+            list[Path]: The paths that were created, modified or removed.
+        """
+        
+        while True:
+            time.sleep(self.interval)
+            
+            files = self._snapshot()
+            changed = [path for path in files.keys() | self._files.keys() if files.get(path) != self._files.get(path)]
+            self._files = files
+            
+            if len(changed) > 0:
+                return sorted(changed)
+            
+    def close(self):
+        """
+        Stop watching the directory.
+        """
+        
+        pass
+            
+class InotifyWatcher():
+    """
+    Watches a directory for changes using inotify. Linux only.
+    """
+    
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT = struct.Struct("iIII")
+    
+    def __init__(self, directory: Path, debounce: float = 0.01):
+        """
+        Initialize the class.
+
+        Args:
+            directory (Path): The directory to watch.
+            debounce (float, optional): How long to keep collecting events after the first one in seconds. Defaults to 0.01.
+            
+        Raises:
+            OSError: If inotify is unavailable.
+        """
+        
+        self.directory = directory.absolute()
+        self.debounce = debounce
+        
+        self._libc = ctypes.CDLL(None, use_errno = True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        self._watches: dict[int, Path] = {}
+        
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "Failed to initialize inotify.")
+        
+        self._watch_tree(self.directory)
+        
+    def _watch_tree(self, directory: Path):
+        """
+        Watch a directory and all of its subdirectories.
+
+        Args:
+            directory (Path): The directory to watch.
+        """
+        
+        for root, _, _ in os.walk(directory):
+            descriptor = self._libc.inotify_add_watch(self._fd, os.fsencode(root), self.MASK)
+            
+            if descriptor >= 0:
+                self._watches[descriptor] = Path(root)
+                
+    def _read_events(self) -> set[Path]:
+        """
+        Read all pending inotify events.
+
+        Returns:
+            set[Path]: The paths that were created, modified or removed.
+        """
+        
+        changed: set[Path] = set()
+        
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        
+        offset = 0
+        
+        while offset < len(data):
+            descriptor, mask, _, length = self.EVENT.unpack_from(data, offset)
+            name = data[offset + self.EVENT.size:offset + self.EVENT.size + length].rstrip(b"\0")
+            offset += self.EVENT.size + length
+            
+            if mask & self.IN_Q_OVERFLOW:
+                changed.add(self.directory)
+                continue
+            
+            directory = self._watches.get(descriptor)
+            
+            if directory is None:
+                continue
+            
+            if mask & self.IN_IGNORED:
+                del self._watches[descriptor]
+                continue
+            
+            path = directory / os.fsdecode(name) if name else directory
+            changed.add(path)
+            
+            if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                self._watch_tree(path)
+                
+        return changed
+        
+    def wait(self) -> list[Path]:
+        """
+        Block until something in the directory changes.
+
+        Returns:
+            list[Path]: The paths that were created, modified or removed.
+        """
+        
+        changed: set[Path] = set()
+        
+        while True:
+            ready, _, _ = select.select([self._fd], [], [], self.debounce if len(changed) > 0 else None)
+            
+            if len(ready) == 0:
+                return sorted(changed)
+            
+            changed.update(self._read_events())
+            
+    def close(self):
+        """
+        Stop watching the directory.
+        """
+        
+        os.close(self._fd)
+
+def create_watcher(directory: Path) -> InotifyWatcher|PollingWatcher:
+    """
+    Create the best available watcher for the current platform.
+
+    Args:
+        directory (Path): The directory to watch.
+
+    Returns:
+        InotifyWatcher|PollingWatcher: The watcher. inotify is used on Linux, polling everywhere else.
+    """
+    
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directory)
+        except (OSError, AttributeError):
+            pass
+        
+    return PollingWatcher(directory)
+
+# ---- // Functions
+def get_cache_directory() -> Path:
+    """
+    Get the directory build caches are stored in.
+    This is `%LOCALAPPDATA%/Noir/Cache` on Windows, and `$XDG_CACHE_HOME/noir` (usually `~/.cache/noir`) elsewhere.
+
+    Returns:
+        Path: The cache directory.
+    """
+    
+    if sys.platform == "win32":
+        return Path(os.path.expandvars(os.environ.get("LOCALAPPDATA", "~/AppData/Local"))).expanduser() / "Noir" / "Cache"
+    
+    return Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "noir"
+
+def show_size_report(report: CombinerSizeReport):
+    """
+    Print how much each file and `__order.json` directory contributes to the combined output, biggest first.
+
+    Args:
+        report (CombinerSizeReport): The size report. See `Combiner.size_report`.
+    """
+    
+    table = Table(title = "Sizes")
+    table.add_column("File", style = "blue")
+    table.add_column("Before (B)", justify = "right")
+    table.add_column("After (B)", justify = "right")
+    table.add_column("Saved", justify = "right")
+    table.add_column("Share", justify = "right")
+    
+    for path, (before, after) in report.files:
+        table.add_row(str(path), f"{before:,}", f"{after:,}", f"{(1 - after / before) * 100 if before > 0 else 0:.1f}%", f"{after / report.total * 100 if report.total > 0 else 0:.1f}%")
+        
+    print(table)
+    
+    if len(report.directories) > 0:
+        table = Table(title = "Directories")
+        table.add_column("Directory", style = "blue")
+        table.add_column("Size (B)", justify = "right")
+        table.add_column("Share", justify = "right")
+        
+        for path, size in report.directories:
+            table.add_row(str(path), f"{size:,}", f"{size / report.total * 100 if report.total > 0 else 0:.1f}%")
+            
+        print(table)
+        
+    color = "red" if report.is_over_budget() else "green"
+    print(f"Total: [{color}]{report.total:,}B[/{color}]" + (f" / {report.max_size:,}B" if report.max_size is not None else ""))
+
+def watch_directory(combiner: Combiner):
+    """
+    Keep combining files whenever something in the combiner's directory changes. Blocks until interrupted.
+
+    Args:
+        combiner (Combiner): The combiner to rebuild with. Must have been used to combine once already.
+    """
+    
+    watcher = create_watcher(combiner.directory)
+    print(f"[bold blue](Watching)[/bold blue] {combiner.directory} for changes ({type(watcher).__name__}). Press Ctrl+C to stop.")
+    
+    try:
+        while True:
+            changed = [path for path in watcher.wait() if not combiner.is_ignored(path, parents = True)]
+            
+            if len(changed) == 0:
+                continue
+            
+            started_at = time.perf_counter()
+            
+            try:
+                combiner.rebuild(changed)
+            except Exception as exception:
+                print(f"[bold red](Error)[/bold red] {exception}")
+                continue
+            
+            print(f"[bold green](Rebuilt)[/bold green] {len(changed)} change(s) in {(time.perf_counter() - started_at) * 1000:.1f}ms")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
 # ---- // Main
 @click.command()
 @click.option("--directory", "-d", "-p", "--path", type = str, required = True, help = "The directory containing files to combine.")
 @click.option("--destination", "-de", type = str, required = True, help = "The file which should have the content of all files combined. Created automatically if it doesn't exist.")
 @click.option("--allow_file_extension", "-afe", default = [], multiple = True, help = "The file extensions to allow.")
 @click.option("--ignore_path", "-ip", default = [], multiple = True, help = "The paths to ignore when combining.")
-def combiner_tool(directory: str, destination: str, allow_file_extension: list[str], ignore_path: list[str]):
+@click.option("--ignore_pattern", "-ig", default = [], multiple = True, help = "Gitignore-style glob patterns (relative to the directory) of paths to ignore when combining, eg: \"*.png\" or \"assets/\".")
+@click.option("--cache", "-c", is_flag = True, default = False, help = "Enables a build cache stored in your user cache directory, so unchanged files aren't re-read and the destination isn't re-written if nothing changed.")
+@click.option("--watch", "-w", is_flag = True, default = False, help = "Keeps running and combines again whenever a file in the directory changes.")
+@click.option("--profile", "-pr", type = click.Choice(Combiner.PROFILES), default = "debug", help = "\"release\" strips type checking, comments and annotations from the output (Lua only).")
+@click.option("--strip_debugging", "-sd", is_flag = True, default = False, help = "Disables Noir.Debugging tracking in the \"release\" profile.")
+@click.option("--minify", "-m", is_flag = True, default = False, help = "Minifies the output, removing comments and whitespace and renaming locals (Lua only).")
+@click.option("--tree_shake", "-ts", default = [], multiple = True, help = "A path (inc. files) containing Noir. Noir services, libraries and classes in it that nothing references are left out (Lua only).")
+@click.option("--keep", "-k", default = [], multiple = True, help = "A Noir service, library or class to never leave out when tree shaking, eg: \"TaskService\".")
+@click.option("--max_size", "-ms", type = click.IntRange(min = 1), default = None, help = "The maximum size of the output in bytes. The build fails if the output is bigger.")
+@click.option("--report", "-r", type = str, default = None, help = "Where to save a JSON report of the size of each file and directory in the output.")
+@click.option("--source_map", "-sm", is_flag = True, default = False, help = "Writes a source map next to the destination, mapping its lines back to the combined files.")
+def combiner_tool(directory: str, destination: str, allow_file_extension: list[str], ignore_path: list[str], ignore_pattern: list[str], cache: bool, watch: bool, profile: str, strip_debugging: bool, minify: bool, tree_shake: list[str], keep: list[str], max_size: int|None, report: str|None, source_map: bool):
     """
     Combine all files in the directory into one.
 
@@ -225,6 +2522,17 @@ def combiner_tool(directory: str, destination: str, allow_file_extension: list[s
         destination (str): The file which should have the content of all files combined. Created automatically if it doesn't exist.
         allow_file_extension (list[str]): The file extensions to allow.
         ignore_path (list[str]): The paths to ignore when combining.
+        ignore_pattern (list[str]): The glob patterns of paths to ignore when combining.
+        cache (bool): Whether or not to enable the build cache.
+        watch (bool): Whether or not to keep combining whenever a file changes.
+        profile (str): The build profile, "debug" or "release".
+        strip_debugging (bool): Whether or not to disable Noir.Debugging tracking in the "release" profile.
+        minify (bool): Whether or not to minify the output.
+        tree_shake (list[str]): The paths containing Noir to tree shake.
+        keep (list[str]): The Noir services, libraries and classes to never leave out when tree shaking.
+        max_size (int|None): The maximum size of the output in bytes.
+        report (str|None): Where to save the size report as JSON.
+        source_map (bool): Whether or not to write a source map next to the destination.
     """    
     
     # Combine files
@@ -236,10 +2544,28 @@ def combiner_tool(directory: str, destination: str, allow_file_extension: list[s
         destination = Path(destination),
         whitelisted_extensions = allow_file_extension,
         blacklisted_extensions = [],
-        ignored = ignored
+        ignored = ignored,
+        cache = cache,
+        profile = profile,
+        strip_debugging = strip_debugging,
+        minify = minify,
+        tree_shake = [Path(path) for path in tree_shake],
+        keep = list(keep),
+        max_size = max_size,
+        report = Path(report) if report else None,
+        source_map = source_map,
+        ignored_patterns = list(ignore_pattern)
     )
     
-    _, contents = combiner.combine()
+    try:
+        _, contents = combiner.combine()
+    except ValueError as exception:
+        if combiner.size_report is None or not combiner.size_report.is_over_budget():
+            raise
+        
+        show_size_report(combiner.size_report)
+        print(f"[bold red](Error)[/bold red] {exception}")
+        sys.exit(1)
 
     # Output
     print(Panel(
@@ -257,7 +2583,21 @@ def combiner_tool(directory: str, destination: str, allow_file_extension: list[s
     for path in contents.keys():
         print(f"    🗃️ [blue]{path}[/blue]")
     
-    print(f"To: {combiner.destination}")
+    print(f"To: {combiner.destination} ({combiner.profile})")
+    
+    if combiner.write_source_map:
+        print(f"Source map: {combiner.source_map_path}")
+    
+    # Tree shaking
+    if combiner.tree_shaker is not None:
+        print(f"Left out {len(combiner.tree_shaker.removed)} unused Noir module(s): {", ".join(combiner.tree_shaker.removed) or "None"}")
+    
+    # Sizes
+    show_size_report(combiner.size_report)
+    
+    # Watch
+    if watch:
+        watch_directory(combiner)
     
 if __name__ == "__main__":
     combiner_tool()
\ No newline at end of file
@@ -24,4 +24,4 @@ limitations under the License.
 """
 
 # ---- // Imports
-from .main import Project
\ No newline at end of file
+from .main import Project, Downloader, CachedDownloader, LocalSource
\ No newline at end of file
@@ -29,13 +29,24 @@ import requests
 import subprocess
 import os
 import json
+import hashlib
+import shutil
+import sys
+import threading
+import importlib.util
+import click
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from textwrap import dedent
 from pathlib import Path as _Path
+from requests.adapters import HTTPAdapter
 from werkzeug.utils import secure_filename
 import rich
 from rich import print
 from rich.panel import Panel
 from rich.prompt import Prompt
+from rich.table import Table
+from rich.markup import escape
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn, TimeElapsedColumn
 
 # ---- // Functions
 def multiline(string: str) -> str:
@@ -99,6 +110,140 @@ def errorWrapper(func: "function") -> "function":
     
     return wrapper
 
+def getCacheDirectory() -> "Path":
+    """
+    Returns the directory downloaded files are cached in.
+    This is `%LOCALAPPDATA%/Noir/Cache` on Windows, and `$XDG_CACHE_HOME/noir` (usually `~/.cache/noir`) elsewhere.
+
+    Returns:
+        Path: The cache directory.
+    """
+    
+    if sys.platform == "win32":
+        return Path(os.environ.get("LOCALAPPDATA", "~/AppData/Local")).expand() / "Noir" / "Cache"
+    
+    return Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expand() / "noir"
+
+def hashFile(path: "Path") -> str:
+    """
+    Hashes a file.
+
+    Args:
+        path (Path): The file to hash.
+
+    Returns:
+        str: The SHA-256 hex digest of the file.
+    """
+    
+    digest = hashlib.sha256()
+    
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(64 * 1024), b""):
+            digest.update(chunk)
+            
+    return digest.hexdigest()
+
+def writeAtomic(path: "Path", contents: bytes):
+    """
+    Writes a file, renaming it into place once written so a failed write never leaves a partial file behind.
+
+    Args:
+        path (Path): The file to write.
+        contents (bytes): The contents to write.
+    """
+    
+    temporaryPath = path.with_name(f".{path.name}.tmp")
+    
+    try:
+        temporaryPath.write_bytes(contents)
+        os.replace(temporaryPath, path)
+    finally:
+        temporaryPath.unlink(missing_ok = True)
+
+def resolveManifestPath(manifestPath: "Path", path: str) -> "Path":
+    """
+    Resolves a path in a manifest, relative to the manifest.
+
+    Args:
+        manifestPath (Path): The path to the manifest.
+        path (str): The path in the manifest.
+
+    Returns:
+        Path: The resolved path.
+    """
+    
+    return (manifestPath.parent / Path(os.path.expandvars(path)).expanduser()).resolve()
+
+def loadManifest(path: "Path", SWAddonsPath: "Path|None" = None, source: "Path|None" = None) -> list[dict]:
+    """
+    Loads a manifest of projects for bulk creating/updating.
+    The manifest is a JSON file in the form of `{"SWAddonsPath": "...", "source": "...", "projects": [{"name": "...", "path": "...", "SWAddonsPath": "...", "source": "..."}]}`.
+    `SWAddonsPath` and `source` (a local copy of Noir, see `LocalSource`) are optional per project, and relative paths in the manifest are relative to the manifest.
+
+    Args:
+        path (Path): The path to the manifest.
+        SWAddonsPath (Path|None, optional): The Stormworks addon path to use if the manifest doesn't specify one. Relative to the current directory. Defaults to None.
+        source (Path|None, optional): The local copy of Noir to use if the manifest doesn't specify one. Relative to the current directory. Defaults to None.
+
+    Raises:
+        Exception: If the manifest is invalid.
+
+    Returns:
+        list[dict]: The projects, each with a `name`, `path`, `SWAddonsPath` and `source` (None to download Noir).
+    """
+    
+    try:
+        manifest = json.loads(path.read_text("utf-8"))
+    except (OSError, ValueError) as error:
+        raise Exception(f"Failed to read manifest '{path}': {error}")
+    
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("projects"), list):
+        raise Exception(f"Manifest '{path}' must be an object with a \"projects\" list.")
+    
+    defaultSWAddonsPath = resolveManifestPath(path, manifest["SWAddonsPath"]) if "SWAddonsPath" in manifest else SWAddonsPath
+    defaultSource = resolveManifestPath(path, manifest["source"]) if "source" in manifest else source
+    projects = []
+    
+    for index, entry in enumerate(manifest["projects"]):
+        if not isinstance(entry, dict) or not entry.get("name") or not entry.get("path"):
+            raise Exception(f"Project #{index + 1} in manifest '{path}' must have a \"name\" and a \"path\".")
+        
+        projectSWAddonsPath = resolveManifestPath(path, entry["SWAddonsPath"]) if "SWAddonsPath" in entry else defaultSWAddonsPath
+        
+        if projectSWAddonsPath is None:
+            raise Exception(f"Project '{entry["name"]}' in manifest '{path}' has no \"SWAddonsPath\", and no default was given.")
+        
+        projects.append({
+            "name" : entry["name"],
+            "path" : resolveManifestPath(path, entry["path"]),
+            "SWAddonsPath" : projectSWAddonsPath,
+            "source" : resolveManifestPath(path, entry["source"]) if "source" in entry else defaultSource
+        })
+        
+    return projects
+
+def runAction(project: "Project", action: str) -> str:
+    """
+    Creates or updates a project.
+
+    Args:
+        project (Project): The project.
+        action (str): "create", "update", or "auto" to create the project if it doesn't exist and update it otherwise.
+
+    Returns:
+        str: The action that was performed.
+    """
+    
+    if action == "auto":
+        action = "update" if project.projectExists() else "create"
+        
+    if action == "create":
+        project.create()
+    else:
+        project.update()
+        
+    return action
+
 # ---- // Classes
 class Path(_Path):
     """
@@ -118,6 +263,451 @@ class Path(_Path):
         
         return Path(os.path.expandvars(self)).expanduser().resolve()
 
+class Downloader():
+    """
+    Downloads files over a shared, pooled `requests.Session`.
+    Files are streamed to disk in chunks and renamed into place once complete, so a failed download never leaves a partial file behind.
+    """
+    
+    chunkSize = 64 * 1024
+    
+    def __init__(self, session: requests.Session|None = None, timeout: tuple[float, float] = (10, 60), poolSize: int = 16):
+        """
+        Initializes downloader class objects.
+
+        Args:
+            session (requests.Session|None, optional): The session to download with. Defaults to a new session.
+            timeout (tuple[float, float], optional): The connect and read timeouts in seconds. Defaults to (10, 60).
+            poolSize (int, optional): The maximum amount of connections kept open per host. Defaults to 16.
+        """
+        
+        self.timeout = timeout
+        self.session = session
+        
+        if self.session is None:
+            adapter = HTTPAdapter(pool_connections = poolSize, pool_maxsize = poolSize)
+            
+            self.session = requests.Session()
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+            
+    def download(self, url: str, path: Path):
+        """
+        Downloads a file.
+
+        Args:
+            url (str): The URL to download.
+            path (Path): Where to save the file.
+            
+        Raises:
+            Exception: If the download failed.
+        """
+        
+        temporaryPath = path.with_name(f".{path.name}.download")
+        
+        try:
+            with self.session.get(url, stream = True, timeout = self.timeout) as response:
+                if not response.ok:
+                    raise Exception(f"Failed to download '{path.name}' (HTTP {response.status_code}).")
+                
+                with open(temporaryPath, "wb") as file:
+                    for chunk in response.iter_content(chunk_size = self.chunkSize):
+                        file.write(chunk)
+                        
+            os.replace(temporaryPath, path)
+        except requests.RequestException as error:
+            raise Exception(f"Failed to download '{path.name}': {error}")
+        finally:
+            temporaryPath.unlink(missing_ok = True)
+            
+    def downloadMany(self, downloads: dict[str, Path]):
+        """
+        Downloads multiple files at the same time.
+
+        Args:
+            downloads (dict[str, Path]): The URLs to download, and where to save them.
+            
+        Raises:
+            Exception: If any download failed. The other downloads still finish.
+        """
+        
+        # A new executor per call, so that calls from different threads never wait on each other's workers
+        with ThreadPoolExecutor(max_workers = max(len(downloads), 1)) as executor:
+            futures = [executor.submit(self.download, url, path) for url, path in downloads.items()]
+            
+        for future in futures:
+            future.result()
+
+class CachedDownloader(Downloader):
+    """
+    A downloader that keeps a shared, content-addressed cache of downloaded files, so many projects can be created or updated with one network check per file.
+    Cached files are revalidated with conditional requests (ETag/Last-Modified) once per downloader, and used as they are if the network is unavailable.
+    Files are copied out of the cache, or hardlinked if `link` is set (only do this if the files won't be edited in place, as that would modify every linked copy).
+    """
+    
+    indexVersion = 1
+    
+    def __init__(self, cacheDirectory: Path|None = None, link: bool = False, **kwargs):
+        """
+        Initializes cached downloader class objects.
+
+        Args:
+            cacheDirectory (Path|None, optional): The cache directory. Defaults to `getCacheDirectory()`.
+            link (bool, optional): Whether or not to hardlink files out of the cache instead of copying them, where possible. Defaults to False.
+            **kwargs: Passed to `Downloader`.
+        """
+        
+        super().__init__(**kwargs)
+        
+        self.cacheDirectory = cacheDirectory or getCacheDirectory()
+        self.objectsPath = self.cacheDirectory / "objects"
+        self.indexPath = self.cacheDirectory / "index.json"
+        self.link = link
+        
+        self._checked: dict[str, Path] = {} # url -> object, for URLs checked by this downloader
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        
+    def download(self, url: str, path: Path):
+        """
+        Downloads a file through the cache.
+
+        Args:
+            url (str): The URL to download.
+            path (Path): Where to save the file.
+            
+        Raises:
+            Exception: If the download failed and the file isn't cached.
+        """
+        
+        objectPath = self.fetch(url, path.name)
+        temporaryPath = path.with_name(f".{path.name}.download")
+        temporaryPath.unlink(missing_ok = True)
+        
+        try:
+            if not self.link or not self._tryLink(objectPath, temporaryPath):
+                shutil.copyfile(objectPath, temporaryPath)
+                
+            os.replace(temporaryPath, path)
+        finally:
+            temporaryPath.unlink(missing_ok = True)
+            
+    def fetch(self, url: str, name: str = "file") -> Path:
+        """
+        Returns the cached copy of a URL, downloading it first if it is missing or changed upstream.
+
+        Args:
+            url (str): The URL to fetch.
+            name (str, optional): The name of the file, for error messages. Defaults to "file".
+
+        Returns:
+            Path: The cached file. Do not modify it.
+            
+        Raises:
+            Exception: If the download failed and the file isn't cached.
+        """
+        
+        with self._lock:
+            lock = self._locks.setdefault(url, threading.Lock())
+            
+        with lock:
+            if url in self._checked:
+                return self._checked[url]
+            
+            entry = self._loadIndex().get(url)
+            objectPath = self._getCachedObject(entry)
+            headers = {}
+            
+            if objectPath is not None:
+                if entry.get("etag"):
+                    headers["If-None-Match"] = entry["etag"]
+                    
+                if entry.get("lastModified"):
+                    headers["If-Modified-Since"] = entry["lastModified"]
+                    
+            try:
+                with self.session.get(url, stream = True, timeout = self.timeout, headers = headers) as response:
+                    if response.status_code == 304 and objectPath is not None:
+                        pass
+                    elif response.ok:
+                        objectPath = self._store(response)
+                        
+                        self._saveEntry(url, {
+                            "hash" : objectPath.name,
+                            "etag" : response.headers.get("ETag"),
+                            "lastModified" : response.headers.get("Last-Modified")
+                        })
+                    elif objectPath is None or response.status_code < 500:
+                        raise Exception(f"Failed to download '{name}' (HTTP {response.status_code}).")
+                    else:
+                        rich.print(f"[bold yellow]Could not check '{name}' for updates (HTTP {response.status_code}), using the cached copy.[/bold yellow]")
+            except requests.RequestException as error:
+                if objectPath is None:
+                    raise Exception(f"Failed to download '{name}': {error}")
+                
+                rich.print(f"[bold yellow]Could not check '{name}' for updates (offline?), using the cached copy.[/bold yellow]")
+                
+            self._checked[url] = objectPath
+            return objectPath
+        
+    def _getCachedObject(self, entry: dict|None) -> Path|None:
+        """
+        Returns the cached file of an index entry if it exists and is intact.
+
+        Args:
+            entry (dict|None): The index entry.
+
+        Returns:
+            Path|None: The cached file, or None if there isn't a usable one.
+        """
+        
+        if entry is None:
+            return None
+        
+        objectPath = self.objectsPath / entry.get("hash", "")
+        
+        try:
+            # Verify the contents, as a hardlinked copy may have been edited in place
+            return objectPath if hashFile(objectPath) == objectPath.name else None
+        except OSError:
+            return None
+        
+    def _store(self, response: requests.Response) -> Path:
+        """
+        Streams a response into the cache.
+
+        Args:
+            response (requests.Response): The response to store.
+
+        Returns:
+            Path: The cached file, named after the SHA-256 hash of its contents.
+        """
+        
+        self.objectsPath.mkdir(parents = True, exist_ok = True)
+        
+        digest = hashlib.sha256()
+        temporaryPath = self.objectsPath / f".{threading.get_ident()}.download"
+        
+        try:
+            with open(temporaryPath, "wb") as file:
+                for chunk in response.iter_content(chunk_size = self.chunkSize):
+                    digest.update(chunk)
+                    file.write(chunk)
+                    
+            objectPath = self.objectsPath / digest.hexdigest()
+            os.replace(temporaryPath, objectPath)
+        finally:
+            temporaryPath.unlink(missing_ok = True)
+            
+        return objectPath
+    
+    def _loadIndex(self) -> dict[str, dict]:
+        """
+        Loads the cache index. An invalid or outdated index is treated as empty.
+
+        Returns:
+            dict[str, dict]: The index entries by URL.
+        """
+        
+        try:
+            index = json.loads(self.indexPath.read_text("utf-8"))
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(index, dict) or index.get("version") != self.indexVersion:
+            return {}
+        
+        return index.get("entries", {})
+    
+    def _saveEntry(self, url: str, entry: dict):
+        """
+        Saves an entry to the cache index, merging with any entries saved by other downloaders in the meantime.
+
+        Args:
+            url (str): The URL of the entry.
+            entry (dict): The entry.
+        """
+        
+        with self._lock:
+            entries = self._loadIndex()
+            entries[url] = entry
+            
+            temporaryPath = self.indexPath.with_name(f".index.{threading.get_ident()}.json")
+            temporaryPath.write_text(json.dumps({"version" : self.indexVersion, "entries" : entries}, indent = 4))
+            os.replace(temporaryPath, self.indexPath)
+            
+    def _tryLink(self, objectPath: Path, path: Path) -> bool:
+        """
+        Tries to hardlink a cached file.
+
+        Args:
+            objectPath (Path): The cached file.
+            path (Path): Where to link it.
+
+        Returns:
+            bool: Whether or not the link was created.
+        """
+        
+        try:
+            os.link(objectPath, path)
+            return True
+        except OSError:
+            return False
+
+class LocalSource():
+    """
+    A local copy of Noir to create and update projects from instead of downloading the latest release, so no network is needed.
+    This can be a `_build` directory (or a built `Noir.lua` file), or Noir's source (`src` or `src/Noir`), which is built with the `Combiner`.
+    The combiner is copied into projects as `combine.py` instead of `combine.exe`.
+    Share one between projects so that Noir is only built once.
+    """
+    
+    def __init__(self, path: Path):
+        """
+        Initializes local source class objects.
+
+        Args:
+            path (Path): The `_build` directory, `Noir.lua` file, or `src`/`src/Noir` directory.
+            
+        Raises:
+            Exception: If the path doesn't contain Noir, or the combiner can't be found.
+        """
+        
+        self.path = path.expand()
+        self.builtNoirPath = None # A built Noir.lua to copy as-is
+        self.NoirSourcePath = None # A directory to build Noir from
+        
+        if self.path.is_file():
+            self.builtNoirPath = self.path
+        elif (self.path / "__order.json").exists():
+            self.NoirSourcePath = self.path
+        elif (self.path / "Noir" / "__order.json").exists():
+            self.NoirSourcePath = self.path / "Noir"
+        elif (self.path / "Noir.lua").exists():
+            self.builtNoirPath = self.path / "Noir.lua"
+        else:
+            raise Exception(f"'{path}' does not contain Noir. Expected a `_build` directory, a `Noir.lua` file, or Noir's source (`src` or `src/Noir`).")
+        
+        self.root = self._findRoot()
+        self.combinerPath = (self.root or self._getBundleRoot()) / "tools" / "combine" / "main.py"
+        
+        if not self.combinerPath.exists():
+            raise Exception(f"Could not find the combiner (`tools/combine/main.py`) for '{path}'.")
+        
+        self.intellisensePath = self.path.parent / "intellisense.lua" if self.path.is_file() else self.path / "intellisense.lua"
+        self.cachedNoirPath = getCacheDirectory() / "builds" / hashlib.sha256(str(self.NoirSourcePath).encode()).hexdigest()[:16] / "Noir.lua"
+        
+        self._Noir = None
+        self._warned = False
+        self._lock = threading.Lock()
+        
+    def _findRoot(self) -> Path|None:
+        """
+        Returns the Noir repo the source is in, if any.
+
+        Returns:
+            Path|None: The root of the repo, or None if the source isn't in one.
+        """
+        
+        for parent in [self.path, *self.path.parents]:
+            if (parent / "tools" / "combine" / "main.py").exists():
+                return parent
+            
+        return None
+        
+    @staticmethod
+    def _getBundleRoot() -> Path:
+        """
+        Returns the root of the files bundled with this tool: the Noir repo when running from source, or where PyInstaller unpacked the tool (see `build.py`).
+
+        Returns:
+            Path: The root of the bundled files.
+        """
+        
+        if hasattr(sys, "_MEIPASS"):
+            return Path(sys._MEIPASS)
+        
+        return Path(__file__).resolve().parents[2]
+        
+    def getNoir(self) -> str:
+        """
+        Returns Noir, building it first if needed. Noir is only built once per local source.
+        The version is filled in from the repo's `VERSION` file if it hasn't been already.
+
+        Returns:
+            str: The contents of `Noir.lua`.
+        """
+        
+        with self._lock:
+            if self._Noir is not None:
+                return self._Noir
+            
+            if self.builtNoirPath is None:
+                self._build()
+                
+            Noir = (self.builtNoirPath or self.cachedNoirPath).read_text("utf-8")
+            versionPath = self.root / "VERSION" if self.root is not None else None
+            
+            if versionPath is not None and versionPath.exists():
+                major, minor, patch = versionPath.read_text().strip().split(".")
+                version = "Noir.Version = \"{VERSION_MAJOR}.{VERSION_MINOR}.{VERSION_PATCH}\""
+                Noir = Noir.replace(version, version.format(VERSION_MAJOR = major, VERSION_MINOR = minor, VERSION_PATCH = patch))
+                
+            self._Noir = Noir
+            return Noir
+        
+    def _build(self):
+        """
+        Builds Noir from source with the combiner. The build is cached, so unchanged files aren't read again.
+        """
+        
+        self.cachedNoirPath.parent.mkdir(parents = True, exist_ok = True)
+        
+        combiner = self._loadCombiner().Combiner(
+            directory = self.NoirSourcePath,
+            destination = self.cachedNoirPath,
+            whitelisted_extensions = [".lua"],
+            blacklisted_extensions = [],
+            ignored = [],
+            cache = True
+        )
+        
+        try:
+            combiner.combine()
+        except ValueError as error:
+            raise Exception(f"Failed to build Noir from '{self.NoirSourcePath}': {error}")
+        
+    def _loadCombiner(self):
+        """
+        Imports the combiner.
+
+        Returns:
+            module: The combiner module.
+        """
+        
+        spec = importlib.util.spec_from_file_location("_noir_combine", self.combinerPath)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        
+        return module
+    
+    def install(self, project: "Project"):
+        """
+        Copies Noir, the combiner and intellisense (if the source has it) into a project.
+
+        Args:
+            project (Project): The project.
+        """
+        
+        writeAtomic(project.NoirPath, self.getNoir().encode("utf-8"))
+        writeAtomic(project.combinePath, self.combinerPath.read_bytes())
+        
+        if self.intellisensePath.exists():
+            writeAtomic(project.intellisensePath, self.intellisensePath.read_bytes())
+        elif not project.intellisensePath.exists() and not self._warned:
+            self._warned = True
+            rich.print(f"[bold yellow]'{self.path}' has no intellisense.lua, so it wasn't added. Update without a local source to download it.[/bold yellow]")
+
 class Project():
     """
     Represents an addon project.
@@ -225,8 +815,9 @@ class Project():
     IntellisenseDownloadURL = "https://raw.githubusercontent.com/Cuh4/StormworksAddonLuaDocumentation/main/docs/intellisense.lua"
     
     build = "combine.exe --directory \".\" --destination \"{romScriptPath}\" --allow_file_extension \".lua\""
+    localBuild = "py combine.py --directory \".\" --destination \"{romScriptPath}\" --allow_file_extension \".lua\""
 
-    def __init__(self, name: str, addonPath: Path, SWAddonsPath: Path):
+    def __init__(self, name: str, addonPath: Path, SWAddonsPath: Path, downloader: Downloader|None = None, source: LocalSource|None = None):
         """
         Initializes project class objects.
 
@@ -234,6 +825,8 @@ class Project():
             name (str): The name of the addon
             addonPath (Path): The path the addon should be placed in
             SWAddonsPath (Path): The path to the Stormworks addon folder
+            downloader (Downloader|None, optional): The downloader to fetch Noir and tools with. Share one between projects to reuse connections and cache checks. Defaults to a new `CachedDownloader`.
+            source (LocalSource|None, optional): A local copy of Noir to use instead of downloading anything. Defaults to None.
             
         Raises:
             NotADirectoryError: If the addon path is not a directory
@@ -245,6 +838,9 @@ class Project():
         if not SWAddonsPath.expand().exists():
             raise NotADirectoryError(f"Stormworks addon path '{SWAddonsPath}' does not exist. If you are on Windows, '%appdata/Stormworks/data/missions' should work.")
         
+        self.downloader = downloader or CachedDownloader()
+        self.source = source
+        
         self.rawName = name
         self.name = XMLEscape(secure_filename(self.rawName))
         self.SWAddonsPath = SWAddonsPath.expand()
@@ -257,7 +853,8 @@ class Project():
         self.addonPath = addonPath # The path the user will be writing code in
         self.NoirPath = self.addonPath / "Noir.lua"
         self.orderPath = self.addonPath / "__order.json"
-        self.combinePath = self.addonPath / "combine.exe"
+        self.combinePath = self.addonPath / ("combine.py" if self.source is not None else "combine.exe")
+        self.otherCombinePath = self.addonPath / ("combine.exe" if self.source is not None else "combine.py") # The combiner from before switching to/from a local source
         self.buildPath = self.addonPath / "build.bat"
         self.intellisensePath = self.addonPath / "intellisense.lua"
         self.READMEPath = self.addonPath / "README.md"
@@ -279,29 +876,28 @@ class Project():
 
         self._createDirectories()
 
-        self._createNoir()
+        self._createFiles()
         self._createScript()
         self._createLibraryExample()
         self._createServiceExample()
         self._createOrder()
         self._createBuild()
-        self._createIntellisense()
         self._createREADME()
-        self._createCombine()
         
         self._createPlaylist()
         
     def update(self):
         """
-        Updates the project's Noir.lua file.
+        Updates the project's Noir.lua file and tools.
+        `build.bat` is rewritten to use the combiner that was just installed, and the other combiner is removed.
         """
         
         if not self.projectExists():
             raise Exception("Project does not exist. Create the project first before updating it.")
         
-        self._createNoir()
-        self._createIntellisense()
-        self._createCombine()
+        self._createFiles()
+        self._createBuild()
+        self.otherCombinePath.unlink(missing_ok = True)
         
     def openAddon(self):
         """
@@ -354,41 +950,26 @@ class Project():
         self.librariesPath.mkdir(parents = True, exist_ok = True)
         self.servicesPath.mkdir(parents = True, exist_ok = True)
         
-    def _createNoir(self):
+    def _createFiles(self):
         """
-        Creates the `Noir.lua` file.
+        Creates the `Noir.lua`, `intellisense.lua` and combiner files, from the local source if there is one and by downloading them otherwise.
         """
         
-        response = requests.get(self.NoirDownloadURL)
-        
-        if not response.ok:
-            raise Exception("Failed to download 'Noir.lua'.")
+        if self.source is not None:
+            self.source.install(self)
+        else:
+            self._downloadFiles()
         
-        self.NoirPath.write_bytes(response.content)
-        
-    def _createCombine(self):
+    def _downloadFiles(self):
         """
-        Creates the `combine.exe` file.
+        Downloads the `Noir.lua`, `intellisense.lua` and `combine.exe` files at the same time.
         """
         
-        response = requests.get(self.CombineDownloadURL)
-        
-        if not response.ok:
-            raise Exception("Failed to download 'combine.exe'.")
-
-        self.combinePath.write_bytes(response.content)
-        
-    def _createIntellisense(self):
-        """
-        Creates the `intellisense.lua` file.
-        """
-        
-        response = requests.get(self.IntellisenseDownloadURL)
-        
-        if not response.ok:
-            raise Exception("Failed to download 'intellisense.lua'.")
-        
-        self.intellisensePath.write_bytes(response.content)
+        self.downloader.downloadMany({
+            self.NoirDownloadURL : self.NoirPath,
+            self.IntellisenseDownloadURL : self.intellisensePath,
+            self.CombineDownloadURL : self.combinePath
+        })
         
     def _createREADME(self):
         """
@@ -447,13 +1028,56 @@ class Project():
         Creates the `build.bat` file.
         """
         
-        self.buildPath.write_text(self.build.format(romScriptPath = self.romScriptPath))
+        build = self.localBuild if self.source is not None else self.build
+        self.buildPath.write_text(build.format(romScriptPath = self.romScriptPath))
 
 # ---- // Main
+def projectOptions(func: "function") -> "function":
+    """
+    Adds the options needed to identify a project to a command.
+
+    Args:
+        func (function): The command.
+
+    Returns:
+        function: The command with the options added.
+    """
+    
+    func = click.option("--sw_addons_path", "-sw", type = str, default = "%appdata%/Stormworks/data/missions", show_default = True, help = "The path to the Stormworks addon folder.")(func)
+    func = click.option("--path", "-p", type = str, required = True, help = "The path of the addon, eg: \"C:/MyAddons/AIGunners\".")(func)
+    func = click.option("--name", "-n", type = str, required = True, help = "The name of the addon, eg: \"AI Gunners\".")(func)
+    
+    return func
+
+def getProject(name: str, path: str, SWAddonsPath: str, source: str|None = None) -> Project:
+    """
+    Returns a project from command options, raising click errors for invalid ones.
+
+    Args:
+        name (str): The name of the addon.
+        path (str): The path of the addon.
+        SWAddonsPath (str): The path to the Stormworks addon folder.
+        source (str|None, optional): The local copy of Noir to use. Defaults to None.
+
+    Returns:
+        Project: The project.
+    """
+    
+    try:
+        return Project(
+            name = name,
+            addonPath = Path(path).expand(),
+            SWAddonsPath = Path(SWAddonsPath),
+            source = LocalSource(Path(source)) if source is not None else None
+        )
+    except Exception as error:
+        raise click.ClickException(str(error))
+    
 @errorWrapper
-def project_manager():
-    # Clear
-    os.system("cls")
+def interactive():
+    """
+    Creates, updates or opens a project through prompts.
+    """
     
     # Title (ish)
     print(Panel(
@@ -484,9 +1108,6 @@ def project_manager():
 
     # Create, update, or open
     while True:
-        # Clear
-        os.system("cls")
-        
         # Show project details
         print(Panel.fit(
             title = f"💻 | {project.name}",
@@ -503,23 +1124,154 @@ def project_manager():
         if choice == "create":
             if project.projectExists():
                 rich.print("[bold red]The project has already been created![/bold red]")
-                time.sleep(1.5)
                 continue
             
             project.create()
             project.openAddon()
 
             rich.print("[green]Project created![/green]")
-            time.sleep(1.5)
         elif choice == "update":
             project.update()
 
             rich.print("[green]Project updated![/green]")
-            time.sleep(1.5)
         elif choice == "open":
             project.openAddon()
         elif choice == "quit":
             break
+        
+@click.group(invoke_without_command = True)
+@click.pass_context
+def project_manager(context: click.Context):
+    """
+    Creates, updates and opens addons with Noir. Run without a command to be prompted instead.
+    """
+    
+    if context.invoked_subcommand is None:
+        interactive()
+        
+@project_manager.command()
+@projectOptions
+@click.option("--open", "-o", "open_addon", is_flag = True, default = False, help = "Opens the addon once created.")
+@click.option("--source", "-s", type = str, default = None, help = "A local copy of Noir to use instead of downloading it (a `_build` directory, or `src`/`src/Noir`, which is built). No network is needed.")
+def create(name: str, path: str, sw_addons_path: str, open_addon: bool, source: str|None):
+    """
+    Creates an addon with Noir set up.
+    """
+    
+    project = getProject(name, path, sw_addons_path, source)
+    
+    try:
+        project.create()
+        
+        if open_addon:
+            project.openAddon()
+    except Exception as error:
+        raise click.ClickException(str(error))
+    
+    rich.print(f"[green]Created '{project.rawName}' in {project.addonPath}.[/green]")
+    
+@project_manager.command()
+@projectOptions
+@click.option("--source", "-s", type = str, default = None, help = "A local copy of Noir to use instead of downloading it (a `_build` directory, or `src`/`src/Noir`, which is built). No network is needed.")
+def update(name: str, path: str, sw_addons_path: str, source: str|None):
+    """
+    Updates Noir and any tools in an addon.
+    """
+    
+    project = getProject(name, path, sw_addons_path, source)
+    
+    try:
+        project.update()
+    except Exception as error:
+        raise click.ClickException(str(error))
+    
+    rich.print(f"[green]Updated '{project.rawName}'.[/green]")
+    
+@project_manager.command("open")
+@projectOptions
+def open_(name: str, path: str, sw_addons_path: str):
+    """
+    Opens an addon in VSCode (or file explorer if not possible).
+    """
+    
+    project = getProject(name, path, sw_addons_path)
+    
+    try:
+        project.openAddon()
+    except Exception as error:
+        raise click.ClickException(str(error))
+    
+@project_manager.command()
+@click.argument("manifest", type = str)
+@click.option("--action", "-a", type = click.Choice(["auto", "create", "update"]), default = "auto", show_default = True, help = "\"auto\" creates projects that don't exist yet and updates the rest.")
+@click.option("--workers", "-w", type = click.IntRange(min = 1), default = 8, show_default = True, help = "The maximum amount of projects to work on at the same time.")
+@click.option("--sw_addons_path", "-sw", type = str, default = None, help = "The path to the Stormworks addon folder, for projects in the manifest that don't specify one.")
+@click.option("--source", "-s", type = str, default = None, help = "A local copy of Noir to use for projects in the manifest that don't specify one (a `_build` directory, or `src`/`src/Noir`, which is built). No network is needed.")
+def bulk(manifest: str, action: str, workers: int, sw_addons_path: str|None, source: str|None):
+    """
+    Creates or updates every project in a JSON manifest at the same time, eg:
+    {"SWAddonsPath": "%appdata%/Stormworks/data/missions", "projects": [{"name": "AI Gunners", "path": "AIGunners"}]}
+    """
+    
+    try:
+        entries = loadManifest(
+            Path(manifest),
+            Path(sw_addons_path).expand() if sw_addons_path is not None else None,
+            Path(source).expand() if source is not None else None
+        )
+        
+        # Shared, so each file is only checked for updates once and each local source is only built once
+        downloader = CachedDownloader()
+        sources = {entry["source"] : LocalSource(entry["source"]) for entry in entries if entry["source"] is not None}
+    except Exception as error:
+        raise click.ClickException(str(error))
+    
+    def run(entry: dict) -> tuple[str, float]:
+        start = time.perf_counter()
+        project = Project(entry["name"], entry["path"], entry["SWAddonsPath"], downloader, sources.get(entry["source"]))
+        
+        return runAction(project, action), time.perf_counter() - start
+    
+    results = {}
+    start = time.perf_counter()
+    
+    with Progress(SpinnerColumn(), TextColumn("{task.description}"), BarColumn(), MofNCompleteColumn(), TimeElapsedColumn()) as progress:
+        task = progress.add_task("Projects", total = len(entries))
+        
+        with ThreadPoolExecutor(max_workers = workers) as executor:
+            futures = {executor.submit(run, entry) : index for index, entry in enumerate(entries)}
+            
+            for future in as_completed(futures):
+                results[futures[future]] = future
+                progress.update(task, advance = 1, description = f"Projects (last: {entries[futures[future]]["name"]})")
+                
+    elapsed = time.perf_counter() - start
+                
+    # Show summary
+    table = Table(title = f"{len(entries)} project(s) in {elapsed:.2f}s", title_justify = "left")
+    table.add_column("Project")
+    table.add_column("Action")
+    table.add_column("Result")
+    table.add_column("Time", justify = "right")
+    
+    failed = 0
+    
+    for index, entry in enumerate(entries):
+        future = results[index]
+        error = future.exception()
+        
+        if error is None:
+            performed, duration = future.result()
+            table.add_row(entry["name"], performed, "[green]OK[/green]", f"{duration:.2f}s")
+        else:
+            failed += 1
+            table.add_row(entry["name"], action, f"[red]{escape(str(error))}[/red]", "-")
+            
+    print(table)
+    
+    if failed > 0:
+        rich.print(f"[bold red]{failed} project(s) failed.[/bold red]")
+        sys.exit(1)
     
 if __name__ == "__main__":
-    project_manager()
\ No newline at end of file
+    project_manager()